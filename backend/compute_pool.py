@@ -0,0 +1,92 @@
+"""Bounded worker pool that keeps CPU-bound endpoint work off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+
+
+class PoolSaturated(Exception):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+class ComputePool:
+    """Thread pool with admission control.
+
+    At most ``max_workers`` jobs run and ``max_queue`` more wait; anything past
+    that is rejected immediately with `PoolSaturated` so callers can shed load
+    (HTTP 429) instead of queueing behind slow requests. A slot is held until
+    the job itself finishes, even if the awaiting request was cancelled.
+    The pool exists to keep the event loop responsive and to apply
+    backpressure, not to add CPU parallelism: small-batch ``predict_proba``
+    calls are dominated by Python-level validation and dispatch, and the
+    scoring loops are pure Python, so jobs largely serialize on the GIL.
+    Throughput across cores would need process workers (e.g. several uvicorn
+    workers, or a ``ProcessPoolExecutor`` fed picklable inputs).
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 32, name: str = "compute"):
+        self.max_workers = max(1, int(max_workers))
+        self.max_queue = max(0, int(max_queue))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._name = name
+        self._lock = Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self._name)
+        return self._executor
+
+    def _acquire(self) -> bool:
+        with self._lock:
+            if self.in_flight >= self.capacity:
+                self.rejected += 1
+                return False
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            return True
+
+    def _release(self, _future: Any = None) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``func(*args, **kwargs)`` on a worker thread, or raise `PoolSaturated`."""
+        if not self._acquire():
+            raise PoolSaturated(f"{self._name} pool saturated ({self.capacity} jobs in flight)")
+        try:
+            future = self._get_executor().submit(functools.partial(func, *args, **kwargs))
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": self.in_flight,
+                "queued": max(0, self.in_flight - self.max_workers),
+                "peak_in_flight": self.peak_in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
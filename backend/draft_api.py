@@ -9,18 +9,23 @@ Focuses on archetype synergies, compositional balance, and strategic reasoning.
 
 from __future__ import annotations
 
-from collections import defaultdict
-from fastapi import FastAPI, HTTPException
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, replace
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any, Set, Tuple, Literal
 from pathlib import Path
 from datetime import datetime, timezone
+import asyncio
 import json
 import sys
 import hashlib
+import hmac
 import math
 import os
+import time
+from threading import Lock
 
 import joblib
 import numpy as np
@@ -30,7 +35,12 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from validation.ensemble_prediction import load_ensemble_predictor, PredictionResult
 from validation.ml_simulation import extract_features_from_team, features_to_vector
+from validation.simulation_io import load_simulation_payload
 from backend.telemetry import log_prediction_event
+from backend.response_cache import ResponseCache, canonical_key
+from backend.compute_pool import ComputePool, PoolSaturated
+from backend.file_cache import LogTail, MtimeCache, file_signature
+from backend.hot_reload import FileWatcher, ReadWriteLock, snapshot_signatures
 
 
 APP_VERSION = "1.0.0"
@@ -42,12 +52,13 @@ CALIBRATION_REPORT_PATH = TELEMETRY_DIR / "calibration_report.json"
 
 
 simulation_summary_cache: Dict[str, Any] = {}
+simulation_summary_snapshot: Optional["SimulationSummarySnapshot"] = None
 simulation_matchup_table: Dict[Tuple[str, str], Dict[str, Any]] = {}
 simulation_composition_table: Dict[str, Any] = {}
 
 
 def _resolve_simulation_summary_path() -> Path:
-    """Pick the most relevant simulation summary JSON."""
+    """Pick the most relevant simulation summary (JSON or columnar .npz)."""
     env_override = os.environ.get("SIMULATION_SUMMARY_PATH")
     if env_override:
         return Path(env_override).expanduser()
@@ -56,7 +67,9 @@ def _resolve_simulation_summary_path() -> Path:
     newest_mass_file: Optional[Path] = None
     newest_mtime = -1.0
     if simulations_dir.exists():
-        for candidate in simulations_dir.glob("mass_simulation*.json"):
+        for candidate in simulations_dir.glob("mass_simulation*"):
+            if candidate.suffix not in (".json", ".npz"):
+                continue
             try:
                 mtime = candidate.stat().st_mtime
             except OSError:
@@ -73,7 +86,34 @@ def _resolve_simulation_summary_path() -> Path:
 
 SIMULATION_SUMMARY_PATH = _resolve_simulation_summary_path()
 MATCHES_PATH = DATA_DIR / "matches" / "multi_region_10k.json"
+# "compiled" serves predictions from flat coefficient/tree arrays; "sklearn" uses the pickled estimators.
+ENSEMBLE_INFERENCE_BACKEND = os.environ.get("ENSEMBLE_INFERENCE_BACKEND", "compiled")
+CHAMPION_DATA_PATH = Path("data/processed/champion_archetypes.json")
+ATTRIBUTE_DATA_PATH = Path("data/processed/archetype_attributes.json")
+LANE_DUO_STATS_PATH = "data/matches/lane_duo_stats.json"
+SIMULATION_MODEL_PATH = Path("models/simulated_sgd.pkl")
+# Inputs of load_ensemble_predictor and startup; a change to any of them can be hot-reloaded.
+BUNDLE_SOURCE_PATHS = [
+    Path("data/simulations/trained_models.pkl"),
+    Path("data/simulations/calibration.json"),
+    Path("data/processed/role_aware_relationships.json"),
+    Path(LANE_DUO_STATS_PATH),
+    CHAMPION_DATA_PATH,
+    ATTRIBUTE_DATA_PATH,
+    SIMULATION_MODEL_PATH,
+]
+# DRAFT_RELOAD_WATCH=1 polls BUNDLE_SOURCE_PATHS (plus matches/summary) and reloads on change.
+RELOAD_WATCH_ENABLED = os.environ.get("DRAFT_RELOAD_WATCH", "").lower() in ("1", "true", "yes")
+RELOAD_WATCH_INTERVAL_SECONDS = float(os.environ.get("DRAFT_RELOAD_WATCH_INTERVAL", 5.0))
+# POST /admin/reload requires this token in X-Admin-Token; unset disables the endpoint.
+ADMIN_TOKEN = os.environ.get("DRAFT_ADMIN_TOKEN")
 OPENING_BAN_COUNT = 6
+RESPONSE_CACHE_MAX_ENTRIES = 256
+RESPONSE_CACHE_TTL_SECONDS = 300.0
+# CPU-bound endpoints run on a bounded pool; past workers + queue depth they answer 429.
+COMPUTE_POOL_WORKERS = int(os.environ.get("DRAFT_COMPUTE_WORKERS", min(4, os.cpu_count() or 1)))
+COMPUTE_POOL_QUEUE_DEPTH = int(os.environ.get("DRAFT_COMPUTE_QUEUE_DEPTH", 32))
+COMPUTE_RETRY_AFTER_SECONDS = 1
 BAN_MODES = {
     "pro": "pro",
     "soloq": "soloq"
@@ -97,11 +137,25 @@ app.add_middleware(
 # Global predictor (loaded on startup)
 predictor = None
 champion_data = None
+response_cache = ResponseCache(RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_TTL_SECONDS)
+compute_pool = ComputePool(COMPUTE_POOL_WORKERS, COMPUTE_POOL_QUEUE_DEPTH, name="draft-compute")
 attribute_data = None
 simulation_model = None
 simulation_feature_names: List[str] = []
 solo_queue_ban_stats: Dict[str, Dict[str, float]] = {}
 flex_priority_scores: Dict[str, float] = {}
+# The globals above mirror `model_bundle`; pool jobs hold `bundle_lock` for reading.
+model_bundle: Optional["ModelBundle"] = None
+bundle_lock = ReadWriteLock()
+bundle_watcher: Optional[FileWatcher] = None
+_reload_lock = Lock()
+reload_status: Dict[str, Any] = {
+    "state": "not_loaded",
+    "reason": None,
+    "last_error": None,
+    "last_finished_at": None,
+    "last_duration_seconds": None
+}
 
 ROLE_ORDER = ["TOP", "JUNGLE", "MIDDLE", "BOTTOM", "UTILITY"]
 POSITION_TO_ROLE = {
@@ -225,6 +279,9 @@ blue_side_prior = BLUE_PRIOR_FALLBACK
 PROBABILITY_EPSILON = 1e-6
 FAMILY_STACK_PENALTY = 0.02
 ROLE_STACK_PENALTY = 0.015
+ROLE_BITS = {role: 1 << position for position, role in enumerate(ROLE_ORDER)}
+SCORE_COMPONENT_KEYS = ("synergy", "counters", "role_fit", "balance", "comfort", "diversity")
+TEAM_AGGREGATE_CACHE_SIZE = 512
 
 
 def _champ_info_attributes(champ_info: Optional[Dict[str, Any]]) -> List[str]:
@@ -245,9 +302,8 @@ def _champion_attributes(champion: str) -> List[str]:
     return _champ_info_attributes(champ_info)
 
 
-def _initialize_ban_datasets():
+def _load_ban_datasets(champions: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Dict[str, float]], Dict[str, float]]:
     """Load SoloQ performance baselines and flex scores for ban logic."""
-    global solo_queue_ban_stats, flex_priority_scores
     matches = []
     if MATCHES_PATH.exists():
         try:
@@ -257,12 +313,8 @@ def _initialize_ban_datasets():
         except Exception as exc:
             print(f"Failed to load match dataset for bans: {exc}")
 
-    if matches:
-        solo_queue_ban_stats = _compute_solo_queue_ban_table(matches)
-    else:
-        solo_queue_ban_stats = {}
-
-    flex_priority_scores = _compute_flex_priority_scores()
+    solo_stats = _compute_solo_queue_ban_table(matches) if matches else {}
+    return solo_stats, _compute_flex_priority_scores(champions, solo_stats)
 
 
 def _compute_solo_queue_ban_table(matches: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
@@ -301,11 +353,14 @@ def _compute_solo_queue_ban_table(matches: List[Dict[str, Any]]) -> Dict[str, Di
     return table
 
 
-def _compute_flex_priority_scores() -> Dict[str, float]:
+def _compute_flex_priority_scores(
+    champions: Optional[Dict[str, Any]],
+    solo_stats: Dict[str, Dict[str, float]]
+) -> Dict[str, float]:
     scores: Dict[str, float] = {}
-    if not champion_data:
+    if not champions:
         return scores
-    assignments = champion_data.get("assignments", {})
+    assignments = champions.get("assignments", {})
     for champion, info in assignments.items():
         roles = set()
         primary = info.get("primary_position")
@@ -315,7 +370,7 @@ def _compute_flex_priority_scores() -> Dict[str, float]:
             roles.add(POSITION_TO_ROLE.get(pos, pos.upper()))
         flex_count = max(len(roles), 1)
         flex_score = min(flex_count, 4) / 4.0
-        meta_score = solo_queue_ban_stats.get(champion, {}).get("score", 0.0)
+        meta_score = solo_stats.get(champion, {}).get("score", 0.0)
         scores[champion] = flex_score * 0.7 + meta_score * 0.3
     return scores
 
@@ -635,53 +690,191 @@ class BanRecommendationRequest(BaseModel):
 
 # === Startup/Shutdown ===
 
-@app.on_event("startup")
-async def startup_event():
-    """Load models and data on startup."""
-    global predictor, champion_data, attribute_data, simulation_model, simulation_feature_names, blue_side_prior
-    
+@dataclass(frozen=True)
+class ModelBundle:
+    """Everything requests read, built off to the side and swapped in as one unit."""
+
+    predictor: Any
+    champion_data: Dict[str, Any]
+    attribute_data: Dict[str, Any]
+    simulation_model: Any
+    simulation_feature_names: List[str]
+    blue_side_prior: float
+    solo_queue_ban_stats: Dict[str, Dict[str, float]]
+    flex_priority_scores: Dict[str, float]
+    champion_index: Optional[ChampionIndex]
+    simulation_summary: SimulationSummarySnapshot
+    summary_path: Path
+    sources: Dict[Path, Optional[Tuple[int, int, int]]]
+    version: int
+    loaded_at: float
+
+
+def _model_bundle_sources(summary_path: Optional[Path] = None) -> List[Path]:
+    """Files whose change should trigger a reload (see DRAFT_RELOAD_WATCH)."""
+    return BUNDLE_SOURCE_PATHS + [MATCHES_PATH, summary_path or _resolve_simulation_summary_path()]
+
+
+def _build_model_bundle(version: int) -> ModelBundle:
+    """Load every model/data artifact without touching the serving globals."""
+    summary_path = _resolve_simulation_summary_path()
+    # Signatures first: a file replaced mid-load is seen as changed on the next poll.
+    sources = snapshot_signatures(_model_bundle_sources(summary_path))
+
+    print("Loading ensemble predictor...")
+    new_predictor = load_ensemble_predictor(
+        matchups_path=LANE_DUO_STATS_PATH,
+        inference_backend=ENSEMBLE_INFERENCE_BACKEND
+    )
+    prior = BLUE_PRIOR_FALLBACK
     try:
-        print("Loading ensemble predictor...")
-        predictor = load_ensemble_predictor(matchups_path="data/matches/lane_duo_stats.json")
-        if predictor and hasattr(predictor, "blue_side_prior"):
-            try:
-                prior = float(predictor.blue_side_prior)
-                if 0.0 < prior < 1.0:
-                    blue_side_prior = prior
-            except (TypeError, ValueError):
-                blue_side_prior = BLUE_PRIOR_FALLBACK
-        
-        print("Loading champion data...")
-        with open("data/processed/champion_archetypes.json", "r", encoding="utf-8") as f:
-            champion_data = json.load(f)
-        
-        with open("data/processed/archetype_attributes.json", "r", encoding="utf-8") as f:
-            attribute_data = json.load(f)
+        candidate = float(new_predictor.blue_side_prior)
+        if 0.0 < candidate < 1.0:
+            prior = candidate
+    except (AttributeError, TypeError, ValueError):
+        prior = BLUE_PRIOR_FALLBACK
 
-        _initialize_ban_datasets()
-        _refresh_mass_simulation_tables()
+    print("Loading champion data...")
+    with open(CHAMPION_DATA_PATH, "r", encoding="utf-8") as f:
+        new_champion_data = json.load(f)
 
-        model_path = Path("models/simulated_sgd.pkl")
-        if model_path.exists():
-            try:
-                bundle = joblib.load(model_path)
-                simulation_model = bundle.get("model")
-                simulation_feature_names = bundle.get("feature_names", []) or []
-                if simulation_model and simulation_feature_names:
-                    print("Loaded simulation-trained SGD model")
-                else:
-                    print("Simulation-trained model bundle missing data; skipping")
-            except Exception as exc:
-                print(f"Simulation model load failed: {exc}")
+    with open(ATTRIBUTE_DATA_PATH, "r", encoding="utf-8") as f:
+        new_attribute_data = json.load(f)
+
+    solo_stats, flex_scores = _load_ban_datasets(new_champion_data)
+
+    new_simulation_model = None
+    new_simulation_features: List[str] = []
+    if SIMULATION_MODEL_PATH.exists():
+        try:
+            bundle = joblib.load(SIMULATION_MODEL_PATH)
+            new_simulation_model = bundle.get("model")
+            new_simulation_features = bundle.get("feature_names", []) or []
+            if new_simulation_model and new_simulation_features:
+                print("Loaded simulation-trained SGD model")
+            else:
+                print("Simulation-trained model bundle missing data; skipping")
+        except Exception as exc:
+            print(f"Simulation model load failed: {exc}")
+    else:
+        print(f"Simulation-trained model not found ({SIMULATION_MODEL_PATH})")
+
+    summary_snapshot = _build_simulation_summary(summary_path)
+    new_champion_index = ChampionIndex(new_champion_data.get("assignments", {}))
+
+    return ModelBundle(
+        predictor=new_predictor,
+        champion_data=new_champion_data,
+        attribute_data=new_attribute_data,
+        simulation_model=new_simulation_model,
+        simulation_feature_names=new_simulation_features,
+        blue_side_prior=prior,
+        solo_queue_ban_stats=solo_stats,
+        flex_priority_scores=flex_scores,
+        champion_index=new_champion_index,
+        simulation_summary=summary_snapshot,
+        summary_path=summary_path,
+        sources=sources,
+        version=version,
+        loaded_at=time.time()
+    )
+
+
+def _install_model_bundle(bundle: ModelBundle) -> None:
+    """Swap ``bundle`` into the serving globals once in-flight requests finish.
+
+    Every global a request reads changes inside the write-locked section, and the
+    response cache is cleared there too: requests hold the read side while they
+    compute and cache, so no request mixes bundles and no old-bundle response
+    survives the swap.
+    """
+    global model_bundle, predictor, champion_data, attribute_data, simulation_model, simulation_feature_names
+    global blue_side_prior, solo_queue_ban_stats, flex_priority_scores, SIMULATION_SUMMARY_PATH, _champion_index
+    with bundle_lock.write():
+        predictor = bundle.predictor
+        champion_data = bundle.champion_data
+        attribute_data = bundle.attribute_data
+        simulation_model = bundle.simulation_model
+        simulation_feature_names = bundle.simulation_feature_names
+        blue_side_prior = bundle.blue_side_prior
+        solo_queue_ban_stats = bundle.solo_queue_ban_stats
+        flex_priority_scores = bundle.flex_priority_scores
+        if not os.environ.get("SIMULATION_SUMMARY_PATH"):
+            SIMULATION_SUMMARY_PATH = bundle.summary_path
+        _champion_index = bundle.champion_index
+        _apply_simulation_summary(bundle.simulation_summary)
+        model_bundle = bundle
+        response_cache.clear("model_bundle")
+    if bundle_watcher is not None:
+        bundle_watcher.rebase(bundle.sources)
+
+
+def reload_model_bundle(reason: str) -> bool:
+    """Build a new bundle and swap it in; the old one keeps serving on failure.
+
+    Returns False without doing anything if another reload is already running.
+    """
+    if not _reload_lock.acquire(blocking=False):
+        return False
+    try:
+        reload_status["state"] = "reloading"
+        reload_status["reason"] = reason
+        started = time.perf_counter()
+        try:
+            version = model_bundle.version + 1 if model_bundle is not None else 1
+            _install_model_bundle(_build_model_bundle(version))
+        except Exception as exc:
+            reload_status["state"] = "failed"
+            reload_status["last_error"] = str(exc)
+            print(f"Model bundle reload failed ({reason}): {exc}")
         else:
-            print("Simulation-trained model not found (models/simulated_sgd.pkl)")
-        
+            reload_status["state"] = "ready"
+            reload_status["last_error"] = None
+            print(f"Model bundle v{model_bundle.version} loaded ({reason})")
+        reload_status["last_finished_at"] = time.time()
+        reload_status["last_duration_seconds"] = round(time.perf_counter() - started, 3)
+        return True
+    finally:
+        _reload_lock.release()
+
+
+def _model_bundle_status() -> Dict[str, Any]:
+    status = dict(reload_status)
+    status["last_finished_at"] = _safe_iso_timestamp(status.get("last_finished_at"))
+    status["version"] = model_bundle.version if model_bundle is not None else None
+    status["loaded_at"] = _safe_iso_timestamp(model_bundle.loaded_at) if model_bundle is not None else None
+    status["watching"] = bundle_watcher is not None
+    return status
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Load models and data on startup."""
+    global bundle_watcher
+    if reload_model_bundle("startup") and reload_status["state"] == "ready":
         print("API ready")
-    
-    except Exception as e:
-        print(f"Error loading data: {e}")
+    else:
         print("Run ml_simulation.py first to train models")
 
+    if RELOAD_WATCH_ENABLED and bundle_watcher is None:
+        bundle_watcher = FileWatcher(
+            _model_bundle_sources,
+            lambda changed: reload_model_bundle("watch: " + ", ".join(str(path) for path in changed)),
+            interval=RELOAD_WATCH_INTERVAL_SECONDS
+        )
+        bundle_watcher.start(model_bundle.sources if model_bundle is not None else None)
+        print(f"Watching model/data files every {RELOAD_WATCH_INTERVAL_SECONDS:g}s")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the compute pool and file watcher without waiting on queued work."""
+    global bundle_watcher
+    if bundle_watcher is not None:
+        bundle_watcher.stop()
+        bundle_watcher = None
+    compute_pool.shutdown()
+
 
 # === Endpoints ===
 
@@ -696,16 +889,72 @@ async def root():
     }
 
 
+@app.get("/health/live")
+async def health_live() -> Dict[str, Any]:
+    """Cheap liveness probe for load balancers: no file or model access."""
+    return {
+        "status": "online" if predictor is not None else "degraded",
+        "version": APP_VERSION
+    }
+
+
 @app.get("/health")
-async def health() -> Dict[str, Any]:
+def health() -> Dict[str, Any]:
     """Detailed health snapshot with model + telemetry diagnostics."""
+    # Plain `def`: FastAPI runs it in a worker thread, so file reads never block the loop.
     return _build_health_payload()
 
 
 @app.get("/simulations/summary")
-async def simulation_summary() -> Dict[str, Any]:
-    """Expose metadata from the latest ml_simulation run."""
-    return _load_simulation_summary()
+def simulation_summary(request: Request) -> Response:
+    """Expose metadata from the latest ml_simulation run.
+
+    Served from pre-serialized bytes; clients sending a matching
+    ``If-None-Match`` get an empty 304.
+    """
+    snapshot = _current_simulation_summary()
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), snapshot.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+@app.post("/admin/reload", status_code=202)
+async def admin_reload(request: Request) -> Dict[str, Any]:
+    """Rebuild models/data in the background and swap them in without a restart."""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin reload disabled (set DRAFT_ADMIN_TOKEN)")
+    if not hmac.compare_digest(request.headers.get("x-admin-token", ""), ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+    if _reload_lock.locked():
+        return {"accepted": False, "model_bundle": _model_bundle_status()}
+    asyncio.get_running_loop().run_in_executor(None, reload_model_bundle, "admin")
+    return {"accepted": True, "model_bundle": _model_bundle_status()}
+
+
+def _run_on_current_bundle(func, *args: Any) -> Any:
+    # A bundle swap waits for this to return, so one request never mixes bundles.
+    with bundle_lock.read():
+        return func(*args)
+
+
+async def _run_compute(func, *args: Any) -> Any:
+    """Run a CPU-bound handler on the compute pool; 429 when it is saturated."""
+    try:
+        return await compute_pool.run(_run_on_current_bundle, func, *args)
+    except PoolSaturated:
+        raise HTTPException(
+            status_code=429,
+            detail="Server busy, retry shortly",
+            headers={"Retry-After": str(COMPUTE_RETRY_AFTER_SECONDS)}
+        )
 
 
 @app.post("/draft/recommend", response_model=RecommendationResponse)
@@ -724,6 +973,14 @@ async def recommend_champions(request: RecommendationRequest):
     if predictor is None:
         raise HTTPException(status_code=503, detail="Models not loaded")
     
+    cache_key = _recommend_cache_key(request)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    return await _run_compute(_recommend_champions, request, cache_key)
+
+
+def _recommend_champions(request: RecommendationRequest, cache_key: str) -> RecommendationResponse:
     draft = request.draft_state
 
     # Determine which champions are still available
@@ -770,15 +1027,16 @@ async def recommend_champions(request: RecommendationRequest):
         draft.red_roles
     )
 
+    candidates = [
+        (slot.team, rec.champion, slot.role or rec.recommended_role)
+        for slot in slot_recommendations
+        for rec in slot.recommendations
+    ]
+    projections = iter(_project_pick_win_probabilities(draft, candidates))
+
     for slot in slot_recommendations:
         for rec in slot.recommendations:
-            resolved_role = slot.role or rec.recommended_role
-            projected = _project_pick_win_probability(
-                draft,
-                slot.team,
-                rec.champion,
-                resolved_role
-            )
+            projected = next(projections)
             rec.winrate_delta = None
             if not projected:
                 continue
@@ -795,11 +1053,13 @@ async def recommend_champions(request: RecommendationRequest):
 
     draft_analysis = _analyze_draft_state(draft.blue_picks, draft.red_picks)
 
-    return RecommendationResponse(
+    response = RecommendationResponse(
         slots=slot_recommendations,
         draft_analysis=draft_analysis,
         win_projection=win_projection
     )
+    response_cache.put(cache_key, response)
+    return response
 
 
 @app.post("/draft/analyze", response_model=AnalysisResponse)
@@ -827,7 +1087,16 @@ async def analyze_composition(request: AnalysisRequest):
             status_code=400,
             detail=f"Invalid champion names: {', '.join(invalid)}"
         )
-    
+
+    cache_key = _analyze_cache_key(request)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        _record_analysis_telemetry(request, cached.prediction, cached.matchup_context)
+        return cached
+    return await _run_compute(_analyze_composition, request, cache_key)
+
+
+def _analyze_composition(request: AnalysisRequest, cache_key: str) -> AnalysisResponse:
     # Get base ensemble prediction for reasoning/model breakdown
     result: PredictionResult = predictor.predict(
         request.blue_team,
@@ -877,6 +1146,7 @@ async def analyze_composition(request: AnalysisRequest):
         matchup_context=matchup_context
     )
 
+    response_cache.put(cache_key, response)
     _record_analysis_telemetry(request, response.prediction, matchup_context)
     return response
 
@@ -886,6 +1156,14 @@ async def recommend_bans(request: BanRecommendationRequest):
     if request.mode not in BAN_MODES:
         raise HTTPException(status_code=400, detail="Unsupported ban mode")
 
+    cache_key = _bans_cache_key(request)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    return await _run_compute(_recommend_bans, request, cache_key)
+
+
+def _recommend_bans(request: BanRecommendationRequest, cache_key: str) -> BanRecommendationResponse:
     available = _remaining_champions(request.draft_state)
     if not available:
         raise HTTPException(status_code=400, detail="Champion catalog unavailable")
@@ -910,7 +1188,7 @@ async def recommend_bans(request: BanRecommendationRequest):
     if not recommendations:
         raise HTTPException(status_code=404, detail="No ban recommendations available")
 
-    return BanRecommendationResponse(
+    response = BanRecommendationResponse(
         team=request.team,
         mode=request.mode,
         phase=context.get("phase", "unknown"),
@@ -919,6 +1197,8 @@ async def recommend_bans(request: BanRecommendationRequest):
         our_theme=context.get("our_theme"),
         recommendations=recommendations
     )
+    response_cache.put(cache_key, response)
+    return response
 
 
 @app.get("/champions/{champion_name}")
@@ -975,6 +1255,50 @@ async def list_archetypes():
 
 # === Helper Functions ===
 
+def _draft_state_cache_payload(draft: DraftState) -> Dict[str, Any]:
+    """Draft fields that affect responses; bans only matter as a set."""
+    return {
+        "blue_picks": list(draft.blue_picks),
+        "blue_roles": list(draft.blue_roles),
+        "blue_bans": sorted(draft.blue_bans),
+        "red_picks": list(draft.red_picks),
+        "red_roles": list(draft.red_roles),
+        "red_bans": sorted(draft.red_bans),
+        "next_pick": draft.next_pick,
+    }
+
+
+def _recommend_cache_key(request: RecommendationRequest) -> str:
+    slots = None
+    if request.upcoming_slots:
+        slots = [[slot.slot_id, slot.team, slot.role] for slot in request.upcoming_slots]
+    return canonical_key("recommend", {
+        "draft": _draft_state_cache_payload(request.draft_state),
+        "role": request.role,
+        "slots": slots,
+        "limit": request.limit,
+    })
+
+
+def _analyze_cache_key(request: AnalysisRequest) -> str:
+    # actual_winner only feeds telemetry, so it is left out of the key.
+    return canonical_key("analyze", {
+        "blue_team": request.blue_team,
+        "blue_roles": request.blue_roles,
+        "red_team": request.red_team,
+        "red_roles": request.red_roles,
+    })
+
+
+def _bans_cache_key(request: BanRecommendationRequest) -> str:
+    return canonical_key("bans", {
+        "mode": request.mode,
+        "team": request.team,
+        "draft": _draft_state_cache_payload(request.draft_state),
+        "limit": request.limit,
+    })
+
+
 def _summarize_team_profile(team: List[str]) -> Dict[str, int]:
     """Aggregate coarse attribute counts for synergy and counter scoring."""
     profile = {
@@ -1080,110 +1404,98 @@ def _build_position_team(champions: List[str], roles: List[str]) -> Dict[str, st
     return mapping
 
 
+def _simulation_diff_vector(
+    blue_team: List[str],
+    blue_roles: List[str],
+    red_team: List[str],
+    red_roles: List[str]
+) -> List[float]:
+    """Blue-minus-red team feature vector in the simulation model's layout."""
+    blue_map = _build_position_team(blue_team, blue_roles)
+    red_map = _build_position_team(red_team, red_roles)
+    blue_features = extract_features_from_team(blue_map, champion_data)
+    red_features = extract_features_from_team(red_map, champion_data)
+    blue_vector = features_to_vector(blue_features, simulation_feature_names)
+    red_vector = features_to_vector(red_features, simulation_feature_names)
+    return [b - r for b, r in zip(blue_vector, red_vector)]
+
+
 def _predict_simulation_probability(
     blue_team: List[str],
     blue_roles: List[str],
     red_team: List[str],
     red_roles: List[str]
 ) -> Optional[float]:
+    probabilities = _predict_simulation_probabilities([(blue_team, blue_roles, red_team, red_roles)])
+    if probabilities is None:
+        return None
+    return float(probabilities[0])
+
+
+def _predict_simulation_probabilities(
+    drafts: List[Tuple[List[str], List[str], List[str], List[str]]]
+) -> Optional[np.ndarray]:
+    """Score several prepared drafts with one simulation-model call."""
     if simulation_model is None or not simulation_feature_names or champion_data is None:
         return None
+    if not drafts:
+        return np.zeros(0, dtype=float)
 
     try:
-        blue_map = _build_position_team(blue_team, blue_roles)
-        red_map = _build_position_team(red_team, red_roles)
-        blue_features = extract_features_from_team(blue_map, champion_data)
-        red_features = extract_features_from_team(red_map, champion_data)
-        blue_vector = features_to_vector(blue_features, simulation_feature_names)
-        red_vector = features_to_vector(red_features, simulation_feature_names)
-        diff = np.array([[b - r for b, r in zip(blue_vector, red_vector)]], dtype=float)
-        prob = simulation_model.predict_proba(diff)[0][1]
-        return float(prob)
+        diffs = np.array([_simulation_diff_vector(*draft) for draft in drafts], dtype=float)
+        return simulation_model.predict_proba(diffs)[:, 1]
     except Exception as exc:
         print(f"Simulation probability failed: {exc}")
         return None
 
 
-def _predict_blue_win_probability(
+def _neutral_projection(note: str) -> Dict[str, Any]:
+    return {
+        "blue": 0.5,
+        "red": 0.5,
+        "ensemble_blue": 0.5,
+        "ensemble_red": 0.5,
+        "simulated_blue": None,
+        "simulated_red": None,
+        "confidence": 0.0,
+        "favored": "blue",
+        "notes": [note]
+    }
+
+
+def _prepare_projection_draft(
     blue_picks: List[str],
     blue_roles: List[Optional[str]],
     red_picks: List[str],
     red_roles: List[Optional[str]]
-) -> Optional[Dict[str, Any]]:
-    """Run predictor on the current (possibly incomplete) draft state."""
-    if predictor is None:
-        return None
-
+) -> Tuple[Optional[Dict[str, Any]], Optional[Tuple[List[str], List[str], List[str], List[str]]]]:
+    """Return either a neutral early-draft projection or the draft to score."""
     cleaned_blue = [pick for pick in blue_picks if pick]
     cleaned_red = [pick for pick in red_picks if pick]
     total_real_picks = len(cleaned_blue) + len(cleaned_red)
     if total_real_picks <= 1:
-        return {
-            "blue": 0.5,
-            "red": 0.5,
-            "ensemble_blue": 0.5,
-            "ensemble_red": 0.5,
-            "simulated_blue": None,
-            "simulated_red": None,
-            "confidence": 0.0,
-            "favored": "blue",
-            "notes": [
-                "Even draft — not enough picks locked yet for matchup edges."
-            ]
-        }
+        return _neutral_projection("Even draft — not enough picks locked yet for matchup edges."), None
 
     blue_team, resolved_blue_roles = _prepare_team_for_prediction(blue_picks, blue_roles)
     red_team, resolved_red_roles = _prepare_team_for_prediction(red_picks, red_roles)
 
     if len(blue_team) < 2 and len(red_team) < 2:
-        return {
-            "blue": 0.5,
-            "red": 0.5,
-            "ensemble_blue": 0.5,
-            "ensemble_red": 0.5,
-            "simulated_blue": None,
-            "simulated_red": None,
-            "confidence": 0.0,
-            "favored": "blue",
-            "notes": [
-                "Need more picks on each side before projecting meaningful edges."
-            ]
-        }
+        return _neutral_projection("Need more picks on each side before projecting meaningful edges."), None
 
     if len(blue_team) < MIN_TEAM_PICKS_FOR_PROJECTION or len(red_team) < MIN_TEAM_PICKS_FOR_PROJECTION:
-        return {
-            "blue": 0.5,
-            "red": 0.5,
-            "ensemble_blue": 0.5,
-            "ensemble_red": 0.5,
-            "simulated_blue": None,
-            "simulated_red": None,
-            "confidence": 0.0,
-            "favored": "blue",
-            "notes": [
-                "Hold projections until each side locks at least two real champions."
-            ]
-        }
+        return _neutral_projection("Hold projections until each side locks at least two real champions."), None
 
-    try:
-        result: PredictionResult = predictor.predict(
-            blue_team,
-            resolved_blue_roles,
-            red_team,
-            resolved_red_roles
-        )
-    except Exception as exc:
-        print(f"Win projection failed: {exc}")
-        return None
+    return None, (blue_team, resolved_blue_roles, red_team, resolved_red_roles)
 
-    simulated_prob = _predict_simulation_probability(
-        blue_team,
-        resolved_blue_roles,
-        red_team,
-        resolved_red_roles
-    )
 
-    ensemble_blue = _rebalance_probability(result.blue_win_probability, blue_side_prior)
+def _blend_projection(
+    ensemble_probability: float,
+    simulated_prob: Optional[float],
+    confidence: float,
+    notes: List[str]
+) -> Dict[str, Any]:
+    """Side-correct ensemble/simulation probabilities and blend them."""
+    ensemble_blue = _rebalance_probability(ensemble_probability, blue_side_prior)
     ensemble_red = 1.0 - ensemble_blue
     if simulated_prob is not None:
         corrected_sim = _rebalance_probability(simulated_prob, blue_side_prior)
@@ -1202,34 +1514,123 @@ def _predict_blue_win_probability(
         "ensemble_red": ensemble_red,
         "simulated_blue": corrected_sim,
         "simulated_red": 1.0 - corrected_sim if corrected_sim is not None else None,
-        "confidence": result.confidence,
+        "confidence": confidence,
         "favored": favored_side,
-        "notes": result.reasoning[:3]
+        "notes": notes
     }
 
 
-def _project_pick_win_probability(
+def _predict_blue_win_probability(
+    blue_picks: List[str],
+    blue_roles: List[Optional[str]],
+    red_picks: List[str],
+    red_roles: List[Optional[str]]
+) -> Optional[Dict[str, Any]]:
+    """Run predictor on the current (possibly incomplete) draft state."""
+    if predictor is None:
+        return None
+
+    neutral, prepared = _prepare_projection_draft(blue_picks, blue_roles, red_picks, red_roles)
+    if neutral is not None:
+        return neutral
+    blue_team, resolved_blue_roles, red_team, resolved_red_roles = prepared
+
+    try:
+        result: PredictionResult = predictor.predict(
+            blue_team,
+            resolved_blue_roles,
+            red_team,
+            resolved_red_roles
+        )
+    except Exception as exc:
+        print(f"Win projection failed: {exc}")
+        return None
+
+    simulated_prob = _predict_simulation_probability(
+        blue_team,
+        resolved_blue_roles,
+        red_team,
+        resolved_red_roles
+    )
+
+    return _blend_projection(
+        result.blue_win_probability,
+        simulated_prob,
+        result.confidence,
+        result.reasoning[:3]
+    )
+
+
+def _predict_blue_win_probabilities(
+    drafts: List[Tuple[List[str], List[Optional[str]], List[str], List[Optional[str]]]]
+) -> List[Optional[Dict[str, Any]]]:
+    """Batched `_predict_blue_win_probability` with one call per model.
+
+    Features of every draft that needs a model projection are stacked into a
+    single (sparse, for the ensemble) matrix per model. Archetypal
+    reasoning is skipped, so the ``notes`` of model-backed projections are empty.
+    """
+    if predictor is None:
+        return [None] * len(drafts)
+
+    projections: List[Optional[Dict[str, Any]]] = [None] * len(drafts)
+    pending_indices: List[int] = []
+    pending_drafts: List[Tuple[List[str], List[str], List[str], List[str]]] = []
+    feature_dicts: List[Dict[str, float]] = []
+
+    for idx, (blue_picks, blue_roles, red_picks, red_roles) in enumerate(drafts):
+        neutral, prepared = _prepare_projection_draft(blue_picks, blue_roles, red_picks, red_roles)
+        if neutral is not None:
+            projections[idx] = neutral
+            continue
+        try:
+            feature_dict, _ = predictor.build_feature_dict(
+                *prepared,
+                include_feature_breakdown=False
+            )
+        except Exception as exc:
+            print(f"Win projection failed: {exc}")
+            continue
+        pending_indices.append(idx)
+        pending_drafts.append(prepared)
+        feature_dicts.append(feature_dict)
+
+    if not feature_dicts:
+        return projections
+
+    try:
+        blue_probs, _, confidences = predictor.batch_predict_from_vectors(
+            predictor.build_sparse_feature_matrix(feature_dicts)
+        )
+    except Exception as exc:
+        print(f"Win projection failed: {exc}")
+        return projections
+
+    simulated_probs = _predict_simulation_probabilities(pending_drafts)
+
+    for position, idx in enumerate(pending_indices):
+        simulated_prob = float(simulated_probs[position]) if simulated_probs is not None else None
+        projections[idx] = _blend_projection(
+            float(blue_probs[position]),
+            simulated_prob,
+            float(confidences[position]),
+            []
+        )
+
+    return projections
+
+
+def _build_pick_projection_draft(
     draft: DraftState,
     team: str,
     champion: str,
     role: Optional[str]
-) -> Optional[Dict[str, Any]]:
-    """Predict win probability after hypothetically locking a recommendation."""
-    if not champion:
-        return None
-
+) -> Optional[Tuple[List[str], List[Optional[str]], List[str], List[Optional[str]]]]:
+    """Return the draft after hypothetically locking a pick, or None if the team is full."""
     blue_picks = list(draft.blue_picks)
     blue_roles = list(draft.blue_roles)
     red_picks = list(draft.red_picks)
     red_roles = list(draft.red_roles)
-    existing_picks = len(blue_picks) + len(red_picks)
-
-    if existing_picks == 0:
-        # Pure blind pick: no real champions locked yet, so keep 50/50 baseline.
-        return {
-            "blue": 0.5,
-            "red": 0.5
-        }
 
     resolved_role = role.upper() if isinstance(role, str) else None
 
@@ -1244,7 +1645,49 @@ def _project_pick_win_probability(
         red_picks.append(champion)
         red_roles.append(resolved_role)
 
-    return _predict_blue_win_probability(blue_picks, blue_roles, red_picks, red_roles)
+    return blue_picks, blue_roles, red_picks, red_roles
+
+
+def _project_pick_win_probability(
+    draft: DraftState,
+    team: str,
+    champion: str,
+    role: Optional[str]
+) -> Optional[Dict[str, Any]]:
+    """Predict win probability after hypothetically locking a recommendation."""
+    return _project_pick_win_probabilities(draft, [(team, champion, role)])[0]
+
+
+def _project_pick_win_probabilities(
+    draft: DraftState,
+    candidates: List[Tuple[str, str, Optional[str]]]
+) -> List[Optional[Dict[str, Any]]]:
+    """Project every (team, champion, role) candidate in one batched model pass."""
+    projections: List[Optional[Dict[str, Any]]] = [None] * len(candidates)
+    existing_picks = len(draft.blue_picks) + len(draft.red_picks)
+
+    batch_indices: List[int] = []
+    batch_drafts: List[Tuple[List[str], List[Optional[str]], List[str], List[Optional[str]]]] = []
+    for idx, (team, champion, role) in enumerate(candidates):
+        if not champion:
+            continue
+        if existing_picks == 0:
+            # Pure blind pick: no real champions locked yet, so keep 50/50 baseline.
+            projections[idx] = {
+                "blue": 0.5,
+                "red": 0.5
+            }
+            continue
+        hypothetical = _build_pick_projection_draft(draft, team, champion, role)
+        if hypothetical is None:
+            continue
+        batch_indices.append(idx)
+        batch_drafts.append(hypothetical)
+
+    for idx, projection in zip(batch_indices, _predict_blue_win_probabilities(batch_drafts)):
+        projections[idx] = projection
+
+    return projections
 
 
 def _contextual_noise(champion: str, our_team: List[str], enemy_team: List[str], requested_role: Optional[str]) -> float:
@@ -1292,299 +1735,535 @@ def _extract_rationale_tags(reasoning: List[str]) -> List[str]:
 
     return tags[:3]
 
+
+class ChampionIndex:
+    """Per-champion attribute, archetype and role arrays used to score whole slots at once."""
+
+    def __init__(self, assignments: Dict[str, Dict[str, Any]]):
+        self.assignments = assignments
+        self.names: List[str] = list(assignments.keys())
+        self.positions: Dict[str, int] = {name: row for row, name in enumerate(self.names)}
+        size = len(self.names)
+
+        attribute_lists = [_champ_info_attributes(assignments[name]) for name in self.names]
+        self.attribute_names: List[str] = sorted({attr for attrs in attribute_lists for attr in attrs})
+        self.attribute_columns: Dict[str, int] = {
+            attr: column for column, attr in enumerate(self.attribute_names)
+        }
+        self.attribute_matrix = np.zeros((size, len(self.attribute_names)), dtype=bool)
+        for row, attrs in enumerate(attribute_lists):
+            for attr in attrs:
+                self.attribute_matrix[row, self.attribute_columns[attr]] = True
+
+        def _any_attr(predicate) -> np.ndarray:
+            return np.array([any(predicate(attr) for attr in attrs) for attrs in attribute_lists], dtype=bool)
+
+        self.has_magic_damage = _any_attr(lambda attr: "damage_magic" in attr)
+        self.has_physical_damage = _any_attr(lambda attr: "damage_physical" in attr)
+        self.has_engage = _any_attr(lambda attr: attr.startswith("engage") or attr == "utility_engage")
+        self.has_peel = _any_attr(lambda attr: attr in {"utility_peel", "utility_shields"})
+        self.has_frontline = _any_attr(lambda attr: attr in {"survive_tank", "engage_frontline", "survive_shields"})
+        self.has_sustain = _any_attr(lambda attr: attr in {"survive_sustain", "survive_heal", "utility_heal"})
+        self.has_range_source = _any_attr(lambda attr: attr.startswith("range_"))
+
+        self.archetypes: List[Optional[str]] = [
+            assignments[name].get("primary_archetype") for name in self.names
+        ]
+        self.archetype_names: List[str] = sorted({a for a in self.archetypes if a})
+        archetype_lookup = {archetype: idx for idx, archetype in enumerate(self.archetype_names)}
+        self.archetype_ids = np.array(
+            [archetype_lookup.get(a, -1) if a else -1 for a in self.archetypes],
+            dtype=np.int32
+        )
+
+        self.family_keys: List[str] = []
+        self.family_labels: List[str] = []
+        family_lookup: Dict[str, int] = {}
+        family_ids = []
+        for archetype in self.archetypes:
+            family_key, family_label = _resolve_archetype_family(archetype)
+            if family_key not in family_lookup:
+                family_lookup[family_key] = len(self.family_keys)
+                self.family_keys.append(family_key)
+                self.family_labels.append(family_label)
+            family_ids.append(family_lookup[family_key])
+        self.family_lookup = family_lookup
+        self.family_ids = np.array(family_ids, dtype=np.int32)
+
+        def _archetype_flag(*keywords: str) -> np.ndarray:
+            return np.array(
+                [bool(a) and any(keyword in a for keyword in keywords) for a in self.archetypes],
+                dtype=bool
+            )
+
+        self.has_archetype = np.array([bool(a) for a in self.archetypes], dtype=bool)
+        self.is_mage_or_marksman = _archetype_flag("mage", "marksman")
+        self.is_tank_or_warden = _archetype_flag("tank", "warden")
+        self.is_warden = _archetype_flag("warden")
+        self.is_enchanter = _archetype_flag("enchanter")
+        self.is_marksman = _archetype_flag("marksman")
+        self.is_diver_or_assassin = _archetype_flag("diver", "assassin")
+        self.is_skirmisher_or_juggernaut = _archetype_flag("skirmisher", "juggernaut")
+        self.is_artillery_mage = np.array([a == "artillery_mage" for a in self.archetypes], dtype=bool)
+
+        self.role_archetype_bonus: Dict[str, np.ndarray] = {
+            role: np.array([bonuses.get(a, 0.0) for a in self.archetypes], dtype=float)
+            for role, bonuses in ROLE_ARCHETYPE_BONUS.items()
+        }
+
+        self.champion_roles: List[List[str]] = []
+        role_masks = []
+        for name in self.names:
+            info = assignments[name]
+            roles: List[str] = []
+            for position in [info.get("primary_position")] + list(info.get("viable_positions", [])):
+                if not position:
+                    continue
+                normalized = POSITION_TO_ROLE.get(position, position.upper())
+                if normalized not in roles:
+                    roles.append(normalized)
+            self.champion_roles.append(roles)
+            mask = 0
+            for role in roles:
+                mask |= ROLE_BITS.get(role, 0)
+            role_masks.append(mask)
+        self.role_masks = np.array(role_masks, dtype=np.int32)
+        self.has_roles = np.array([bool(roles) for roles in self.champion_roles], dtype=bool)
+        self.first_roles = np.array(
+            [roles[0] if roles else None for roles in self.champion_roles],
+            dtype=object
+        )
+
+        self.attribute_highlights: List[List[str]] = [
+            _get_attribute_highlights(assignments[name]) for name in self.names
+        ]
+        self._noise_cache: Dict[Tuple[int, int, Optional[str]], np.ndarray] = {}
+        self._team_cache: "OrderedDict[Tuple[str, ...], TeamAggregate]" = OrderedDict()
+        # Endpoints score drafts on several compute-pool threads at once.
+        self._team_cache_lock = Lock()
+
+    def rows(self, champions: List[str]) -> np.ndarray:
+        return np.array([self.positions[champion] for champion in champions], dtype=np.intp)
+
+    def attribute_column(self, attribute: str) -> np.ndarray:
+        column = self.attribute_columns.get(attribute)
+        if column is None:
+            return np.zeros(len(self.names), dtype=bool)
+        return self.attribute_matrix[:, column]
+
+    def role_mask(self, role: str) -> np.ndarray:
+        bit = ROLE_BITS.get(role)
+        if bit is None:
+            return np.array([role in roles for roles in self.champion_roles], dtype=bool)
+        return (self.role_masks & bit) != 0
+
+    def team_aggregate(self, team: List[str]) -> "TeamAggregate":
+        """Return team-level aggregates from an LRU cache keyed by the sorted picks."""
+        key = tuple(sorted(team))
+        with self._team_cache_lock:
+            cached = self._team_cache.get(key)
+            if cached is not None:
+                self._team_cache.move_to_end(key)
+                return cached
+
+        aggregate = _build_team_aggregate(self, key)
+        with self._team_cache_lock:
+            self._team_cache[key] = aggregate
+            if len(self._team_cache) > TEAM_AGGREGATE_CACHE_SIZE:
+                self._team_cache.popitem(last=False)
+        return aggregate
+
+    def contextual_noise(self, our_team: List[str], enemy_team: List[str], requested_role: Optional[str]) -> np.ndarray:
+        key = (len(our_team), len(enemy_team), requested_role)
+        cached = self._noise_cache.get(key)
+        if cached is None:
+            cached = np.array(
+                [_contextual_noise(name, our_team, enemy_team, requested_role) for name in self.names],
+                dtype=float
+            )
+            self._noise_cache[key] = cached
+        return cached
+
+
+@dataclass(frozen=True)
+class TeamAggregate:
+    """Order-independent aggregates for one side of the draft."""
+
+    picks: Tuple[str, ...]
+    rows: np.ndarray
+    archetypes: Tuple[str, ...]
+    archetype_text: str
+    damage_count: int
+    tank_count: int
+    family_counts: np.ndarray
+    archetype_counts: np.ndarray
+    profile: Dict[str, int]
+    attributes: frozenset
+    composition: Optional[str]
+
+
+@dataclass(frozen=True)
+class DraftContext:
+    """Everything a slot needs to score candidates, computed once per slot."""
+
+    our: TeamAggregate
+    enemy: TeamAggregate
+    our_size: int
+    enemy_size: int
+    needed_roles: Tuple[str, ...]
+    requested_role: Optional[str]
+    noise: np.ndarray
+
+
+def _build_team_aggregate(index: ChampionIndex, picks: Tuple[str, ...]) -> TeamAggregate:
+    known = [champion for champion in picks if champion in index.positions]
+    archetypes = tuple(index.archetypes[index.positions[champion]] for champion in known)
+
+    family_counts = np.zeros(len(index.family_keys), dtype=np.int32)
+    archetype_counts = np.zeros(len(index.archetype_names) + 1, dtype=np.int32)
+    for archetype in archetypes:
+        family_key, _ = _resolve_archetype_family(archetype)
+        family_counts[index.family_lookup[family_key]] += 1
+        if archetype in index.archetype_names:
+            archetype_counts[index.archetype_names.index(archetype)] += 1
+
+    attributes = set()
+    for champion in known:
+        attributes.update(_champion_attributes(champion))
+
+    return TeamAggregate(
+        picks=picks,
+        rows=index.rows(known),
+        archetypes=archetypes,
+        archetype_text=" ".join(archetypes),
+        damage_count=sum(1 for a in archetypes if "mage" in a or "assassin" in a or "marksman" in a),
+        tank_count=sum(1 for a in archetypes if "tank" in a or "warden" in a),
+        family_counts=family_counts,
+        archetype_counts=archetype_counts,
+        profile=_summarize_team_profile(list(picks)),
+        attributes=frozenset(attributes),
+        composition=_classify_mass_compositions(index, index.rows(known))[0]
+    )
+
+
+def _build_draft_context(
+    our_team: List[str],
+    enemy_team: List[str],
+    our_roles: List[str],
+    requested_role: Optional[str]
+) -> DraftContext:
+    """Collect the slot-wide aggregates consumed by `_score_champions_for_draft`."""
+    index = _get_champion_index()
+    return DraftContext(
+        our=index.team_aggregate(our_team),
+        enemy=index.team_aggregate(enemy_team),
+        our_size=len(our_team),
+        enemy_size=len(enemy_team),
+        needed_roles=tuple(_get_needed_roles(our_roles)),
+        requested_role=requested_role,
+        noise=index.contextual_noise(our_team, enemy_team, requested_role)
+    )
+
+
+_champion_index: Optional[ChampionIndex] = None
+
+
+def _get_champion_index() -> Optional[ChampionIndex]:
+    """Return the champion index for the loaded dataset, rebuilding if it changed."""
+    global _champion_index
+    if champion_data is None:
+        return None
+    assignments = champion_data.get("assignments", {})
+    if _champion_index is None or _champion_index.assignments is not assignments:
+        _champion_index = ChampionIndex(assignments)
+    return _champion_index
+
+
+def _classify_mass_compositions(
+    index: ChampionIndex,
+    team_rows: np.ndarray,
+    candidate_rows: Optional[np.ndarray] = None
+) -> List[Optional[str]]:
+    """Label `team_rows` (plus each candidate, if given) with mass-simulation compositions."""
+    def _with_candidates(flags: np.ndarray) -> np.ndarray:
+        base = int(flags[team_rows].sum())
+        if candidate_rows is None:
+            return np.array([base], dtype=np.int32)
+        return base + flags[candidate_rows].astype(np.int32)
+
+    archetype_count = _with_candidates(index.has_archetype)
+    dive = _with_candidates(index.is_diver_or_assassin) >= 2
+    poke = (_with_candidates(index.is_artillery_mage) > 0) & (_with_candidates(index.has_range_source) >= 2)
+    protect = (
+        (_with_candidates(index.is_tank_or_warden) > 0)
+        & (_with_candidates(index.is_marksman) > 0)
+        & (_with_candidates(index.is_enchanter) > 0)
+    )
+    bruiser = _with_candidates(index.is_skirmisher_or_juggernaut) >= 2
+
+    labels = np.select(
+        [archetype_count == 0, dive, poke, protect, bruiser],
+        ["", "dive", "poke", "protect_the_carry", "bruiser"],
+        default="mixed"
+    )
+    return [label or None for label in labels.tolist()]
+
+
+def _infer_mass_compositions_with_candidates(
+    index: ChampionIndex,
+    team: TeamAggregate,
+    candidate_rows: np.ndarray
+) -> List[Optional[str]]:
+    """Vectorized `_infer_mass_composition(team + [candidate])` for many candidates."""
+    return _classify_mass_compositions(index, team.rows, candidate_rows)
+
+
 def _score_champion_for_draft(
     champion: str,
     our_team: List[str],
     enemy_team: List[str],
     our_roles: List[str],
-    requested_role: Optional[str],
-    enemy_sim_comp: Optional[str] = None
+    requested_role: Optional[str]
 ) -> tuple[float, List[str], Optional[str], Dict[str, float], Optional[Dict[str, Any]]]:
     """Score a champion for current draft and suggest an optimal role."""
-    score = 0.4  # Base score leaves room for differentiation
-    reasoning: List[str] = []
-    components = {
-        "synergy": 0.0,
-        "counters": 0.0,
-        "role_fit": 0.0,
-        "balance": 0.0,
-        "comfort": 0.0,
-        "diversity": 0.0
-    }
+    context = _build_draft_context(our_team, enemy_team, our_roles, requested_role)
+    return _score_champions_for_draft([champion], context)[0]
 
-    champ_info = champion_data["assignments"][champion]
-    champ_archetype = champ_info["primary_archetype"]
-    champ_attributes = set(_champ_info_attributes(champ_info))
+
+def _score_champions_for_draft(
+    champions: List[str],
+    context: DraftContext
+) -> List[tuple[float, List[str], Optional[str], Dict[str, float], Optional[Dict[str, Any]]]]:
+    """Score every candidate for the current draft with array operations.
+
+    Each heuristic is applied to all candidates as a boolean mask over the
+    slot-wide aggregates in ``context``. Returns ``(score, reasoning, role,
+    components, simulation_context)`` per champion, in input order.
+    """
+    index = _get_champion_index()
+    rows = index.rows(champions)
+    count = len(rows)
+    score = np.full(count, 0.4)  # Base score leaves room for differentiation
+    components = {key: np.zeros(count) for key in SCORE_COMPONENT_KEYS}
+    reasoning: List[List[str]] = [[] for _ in range(count)]
+    requested_role = context.requested_role
     requested_role_upper = requested_role.upper() if requested_role else None
+    our, enemy = context.our, context.enemy
+    our_profile = our.profile
+    enemy_profile = enemy.profile
 
-    our_archetypes = [
-        champion_data["assignments"][c]["primary_archetype"]
-        for c in our_team if c in champion_data["assignments"]
-    ]
+    def _apply(mask: np.ndarray, delta, component: str, reason) -> None:
+        hits = np.flatnonzero(mask)
+        if hits.size == 0:
+            return
+        applied = np.where(mask, delta, 0.0)
+        score[:] += applied
+        components[component] += applied
+        for hit in hits:
+            reasoning[hit].append(reason if isinstance(reason, str) else reason(hit))
+
+    archetype_names = [index.archetypes[row] for row in rows]
+    family_ids = index.family_ids[rows]
+    engage_attr = index.attribute_column("engage")[rows]
+    range_long = index.attribute_column("range_long")[rows]
+    cc_hard = index.attribute_column("cc_hard")[rows]
+    mobility_high = index.attribute_column("mobility_high")[rows]
+    has_magic_damage = index.has_magic_damage[rows]
+    has_physical_damage = index.has_physical_damage[rows]
+    has_engage = index.has_engage[rows]
+    has_peel = index.has_peel[rows]
+    has_frontline = index.has_frontline[rows]
+    has_sustain = index.has_sustain[rows]
 
-    family_counts: Dict[str, int] = {}
-    for archetype in our_archetypes:
-        family_key, _ = _resolve_archetype_family(archetype)
-        family_counts[family_key] = family_counts.get(family_key, 0) + 1
+    if requested_role_upper and requested_role_upper in ROLE_ARCHETYPE_BONUS:
+        archetype_bonus = index.role_archetype_bonus[requested_role_upper][rows]
+        _apply(
+            archetype_bonus != 0.0,
+            archetype_bonus,
+            "role_fit",
+            lambda hit: f"{requested_role_upper.title()} slot values {archetype_names[hit].replace('_', ' ')} archetype"
+        )
 
-    enemy_archetypes = [
-        champion_data["assignments"][c]["primary_archetype"]
-        for c in enemy_team if c in champion_data["assignments"]
-    ]
+    if our.damage_count == 0:
+        _apply(index.is_mage_or_marksman[rows], 0.15, "balance", "Fills critical damage dealer gap")
+
+    if our.tank_count == 0:
+        _apply(index.is_tank_or_warden[rows], 0.15, "balance", "Provides missing frontline presence")
+
+    duplicate_family_count = our.family_counts[family_ids]
+    if context.our_size >= 3:
+        penalty = 0.04 + np.minimum(duplicate_family_count - 1, 3) * 0.02
+        _apply(
+            duplicate_family_count >= 2,
+            -penalty,
+            "diversity",
+            lambda hit: (
+                f"Already {duplicate_family_count[hit]} {index.family_labels[family_ids[hit]]} picks locked"
+                " — diversify threats"
+            )
+        )
 
-    archetype_counts = {
-        "damage": sum(1 for a in our_archetypes if "mage" in a or "assassin" in a or "marksman" in a),
-        "tank": sum(1 for a in our_archetypes if "tank" in a or "warden" in a),
-        "fighter": sum(1 for a in our_archetypes if "diver" in a or "skirmisher" in a or "juggernaut" in a),
-        "support": sum(1 for a in our_archetypes if "enchanter" in a or "catcher" in a)
-    }
+    if "damage_burst" in our.attributes:
+        _apply(engage_attr, 0.10, "synergy", "Engage synergizes with team's burst damage")
 
-    our_profile = _summarize_team_profile(our_team)
-    enemy_profile = _summarize_team_profile(enemy_team)
+    if "engage" in our.attributes:
+        _apply(range_long, 0.08, "synergy", "Poke/range complements team's engage")
 
-    has_magic_damage = any("damage_magic" in attr for attr in champ_attributes)
-    has_physical_damage = any("damage_physical" in attr for attr in champ_attributes)
-    has_hard_cc = "cc_hard" in champ_attributes
-    has_engage = any(attr.startswith("engage") or attr == "utility_engage" for attr in champ_attributes)
-    has_poke = "range_long" in champ_attributes
-    has_peel = any(attr in {"utility_peel", "utility_shields"} for attr in champ_attributes)
-    has_frontline = any(attr in {"survive_tank", "engage_frontline", "survive_shields"} for attr in champ_attributes)
-    has_mobility = "mobility_high" in champ_attributes
-    has_sustain = any(attr in {"survive_sustain", "survive_heal", "utility_heal"} for attr in champ_attributes)
+    if "marksman" in our.archetype_text:
+        _apply(index.is_enchanter[rows], 0.12, "synergy", "Enchanter synergizes with marksman")
 
-    if requested_role_upper and requested_role_upper in ROLE_ARCHETYPE_BONUS:
-        archetype_bonus = ROLE_ARCHETYPE_BONUS[requested_role_upper].get(champ_archetype, 0.0)
-        if archetype_bonus:
-            score += archetype_bonus
-            components["role_fit"] += archetype_bonus
-            friendly = champ_archetype.replace('_', ' ')
-            reasoning.append(f"{requested_role_upper.title()} slot values {friendly} archetype")
-
-    if archetype_counts["damage"] == 0 and ("mage" in champ_archetype or "marksman" in champ_archetype):
-        delta = 0.15
-        score += delta
-        components["balance"] += delta
-        reasoning.append("Fills critical damage dealer gap")
-
-    if archetype_counts["tank"] == 0 and ("tank" in champ_archetype or "warden" in champ_archetype):
-        delta = 0.15
-        score += delta
-        components["balance"] += delta
-        reasoning.append("Provides missing frontline presence")
-
-    team_attributes = set()
-    for champ in our_team:
-        if champ in champion_data["assignments"]:
-            team_attributes.update(_champion_attributes(champ))
-
-    family_key, family_label = _resolve_archetype_family(champ_archetype)
-    duplicate_family_count = family_counts.get(family_key, 0)
-    if len(our_team) >= 3 and duplicate_family_count >= 2:
-        penalty = 0.04 + min(duplicate_family_count - 1, 3) * 0.02
-        score -= penalty
-        components["diversity"] -= penalty
-        reasoning.append(
-            f"Already {duplicate_family_count} {family_label} picks locked — diversify threats"
-        )
+    if "assassin" in enemy.archetype_text:
+        _apply(index.is_warden[rows], 0.15, "counters", "Counters enemy assassin threat")
 
-    if "engage" in champ_attributes and "damage_burst" in team_attributes:
-        delta = 0.10
-        score += delta
-        components["synergy"] += delta
-        reasoning.append("Engage synergizes with team's burst damage")
-
-    if "range_long" in champ_attributes and "engage" in team_attributes:
-        delta = 0.08
-        score += delta
-        components["synergy"] += delta
-        reasoning.append("Poke/range complements team's engage")
-
-    if "enchanter" in champ_archetype and "marksman" in " ".join(our_archetypes):
-        delta = 0.12
-        score += delta
-        components["synergy"] += delta
-        reasoning.append("Enchanter synergizes with marksman")
-
-    enemy_attributes = set()
-    for champ in enemy_team:
-        if champ in champion_data["assignments"]:
-            enemy_attributes.update(_champion_attributes(champ))
-
-    if "assassin" in " ".join(enemy_archetypes) and "warden" in champ_archetype:
-        delta = 0.15
-        score += delta
-        components["counters"] += delta
-        reasoning.append("Counters enemy assassin threat")
-
-    if "mobility_high" in enemy_attributes and "cc_hard" in champ_attributes:
-        delta = 0.10
-        score += delta
-        components["counters"] += delta
-        reasoning.append("Hard CC counters enemy mobility")
-
-    if "range_long" in enemy_attributes and "engage" in champ_attributes:
-        delta = 0.08
-        score += delta
-        components["counters"] += delta
-        reasoning.append("Engage counters enemy poke")
+    if "mobility_high" in enemy.attributes:
+        _apply(cc_hard, 0.10, "counters", "Hard CC counters enemy mobility")
+
+    if "range_long" in enemy.attributes:
+        _apply(engage_attr, 0.08, "counters", "Engage counters enemy poke")
 
     # Damage profile balancing
-    if has_magic_damage:
-        if our_profile["magic_damage"] == 0:
-            delta = 0.12
-            score += delta
-            components["balance"] += delta
-            reasoning.append("Introduces first magic damage threat")
-        elif our_profile["magic_damage"] + 1 < our_profile["physical_damage"]:
-            delta = 0.05
-            score += delta
-            components["balance"] += delta
-            reasoning.append("Balances physical-heavy composition")
-    elif our_profile["magic_damage"] == 0 and len(our_team) >= 2:
-        score -= 0.04
-        components["balance"] -= 0.04
-        reasoning.append("Lineup still lacks dependable magic damage")
-
-    if has_physical_damage:
-        if our_profile["physical_damage"] == 0:
-            delta = 0.12
-            score += delta
-            components["balance"] += delta
-            reasoning.append("Adds first consistent physical damage")
-        elif our_profile["physical_damage"] + 1 < our_profile["magic_damage"]:
-            delta = 0.05
-            score += delta
-            components["balance"] += delta
-            reasoning.append("Rebalances magic-heavy loadout")
-    elif our_profile["physical_damage"] == 0 and len(our_team) >= 2:
-        score -= 0.04
-        components["balance"] -= 0.04
-        reasoning.append("Still missing a physical threat")
-
-    if has_hard_cc:
-        if our_profile["hard_cc"] == 0:
-            delta = 0.09
-            score += delta
-            components["synergy"] += delta
-            reasoning.append("Adds reliable lockdown")
-        elif our_profile["hard_cc"] >= 2:
-            delta = 0.03
-            score += delta
-            components["synergy"] += delta
-            reasoning.append("Stacks even more crowd control")
-
-    if has_engage and our_profile["engage"] == 0:
-        delta = 0.08
-        score += delta
-        components["synergy"] += delta
-        reasoning.append("Provides the team's primary engage tool")
-
-    if has_poke and our_profile["poke"] == 0:
-        delta = 0.04
-        score += delta
-        components["synergy"] += delta
-        reasoning.append("Adds long-range pressure for sieges")
-
-    if has_frontline and our_profile["frontline"] == 0:
-        delta = 0.10
-        score += delta
-        components["balance"] += delta
-        reasoning.append("Supplies much-needed frontline durability")
-
-    if has_peel and enemy_profile["engage"] >= 2:
-        delta = 0.07
-        score += delta
-        components["counters"] += delta
-        reasoning.append("Peels against enemy dive threats")
-
-    if has_sustain and enemy_profile["poke"] >= 2:
-        delta = 0.05
-        score += delta
-        components["counters"] += delta
-        reasoning.append("Sustain mitigates poke damage")
-
-    if has_engage and enemy_profile["poke"] >= 2:
-        delta = 0.08
-        score += delta
-        components["counters"] += delta
-        reasoning.append("Engage punishes enemy poke setup")
-
-    if has_hard_cc and enemy_profile["mobility"] >= 2:
-        delta = 0.06
-        score += delta
-        components["counters"] += delta
-        reasoning.append("Locks down mobile threats")
-
-    if has_frontline and enemy_profile["physical_damage"] >= 3:
-        delta = 0.05
-        score += delta
-        components["counters"] += delta
-        reasoning.append("Frontline absorbs heavy AD pressure")
-
-    if has_peel and enemy_profile["magic_damage"] >= 3:
-        delta = 0.04
-        score += delta
-        components["counters"] += delta
-        reasoning.append("Protects carries from heavy AP burst")
-
-    if has_mobility and enemy_profile["hard_cc"] >= 2:
-        delta = 0.04
-        score += delta
-        components["comfort"] += delta
-        reasoning.append("Mobile kit can dodge layered CC")
-
-    same_archetype_count = our_archetypes.count(champ_archetype)
-    if same_archetype_count >= 2:
-        penalty = min(0.08, 0.04 * (same_archetype_count - 1))
-        score -= penalty
-        components["balance"] -= penalty
-        reasoning.append("Avoids stacking another {} pick".format(champ_archetype.replace('_', ' ')))
-
-    recommended_role, role_bonus, role_reasoning = _select_role_for_champion(
-        champion,
-        our_roles,
-        requested_role
+    if our_profile["magic_damage"] == 0:
+        _apply(has_magic_damage, 0.12, "balance", "Introduces first magic damage threat")
+        if context.our_size >= 2:
+            _apply(~has_magic_damage, -0.04, "balance", "Lineup still lacks dependable magic damage")
+    elif our_profile["magic_damage"] + 1 < our_profile["physical_damage"]:
+        _apply(has_magic_damage, 0.05, "balance", "Balances physical-heavy composition")
+
+    if our_profile["physical_damage"] == 0:
+        _apply(has_physical_damage, 0.12, "balance", "Adds first consistent physical damage")
+        if context.our_size >= 2:
+            _apply(~has_physical_damage, -0.04, "balance", "Still missing a physical threat")
+    elif our_profile["physical_damage"] + 1 < our_profile["magic_damage"]:
+        _apply(has_physical_damage, 0.05, "balance", "Rebalances magic-heavy loadout")
+
+    if our_profile["hard_cc"] == 0:
+        _apply(cc_hard, 0.09, "synergy", "Adds reliable lockdown")
+    elif our_profile["hard_cc"] >= 2:
+        _apply(cc_hard, 0.03, "synergy", "Stacks even more crowd control")
+
+    if our_profile["engage"] == 0:
+        _apply(has_engage, 0.08, "synergy", "Provides the team's primary engage tool")
+
+    if our_profile["poke"] == 0:
+        _apply(range_long, 0.04, "synergy", "Adds long-range pressure for sieges")
+
+    if our_profile["frontline"] == 0:
+        _apply(has_frontline, 0.10, "balance", "Supplies much-needed frontline durability")
+
+    if enemy_profile["engage"] >= 2:
+        _apply(has_peel, 0.07, "counters", "Peels against enemy dive threats")
+
+    if enemy_profile["poke"] >= 2:
+        _apply(has_sustain, 0.05, "counters", "Sustain mitigates poke damage")
+        _apply(has_engage, 0.08, "counters", "Engage punishes enemy poke setup")
+
+    if enemy_profile["mobility"] >= 2:
+        _apply(cc_hard, 0.06, "counters", "Locks down mobile threats")
+
+    if enemy_profile["physical_damage"] >= 3:
+        _apply(has_frontline, 0.05, "counters", "Frontline absorbs heavy AD pressure")
+
+    if enemy_profile["magic_damage"] >= 3:
+        _apply(has_peel, 0.04, "counters", "Protects carries from heavy AP burst")
+
+    if enemy_profile["hard_cc"] >= 2:
+        _apply(mobility_high, 0.04, "comfort", "Mobile kit can dodge layered CC")
+
+    same_archetype_count = our.archetype_counts[index.archetype_ids[rows]]
+    _apply(
+        same_archetype_count >= 2,
+        -np.minimum(0.08, 0.04 * (same_archetype_count - 1)),
+        "balance",
+        lambda hit: "Avoids stacking another {} pick".format(archetype_names[hit].replace('_', ' '))
     )
+
+    # Role selection (mirrors `_select_role_for_champion` across all candidates)
+    requested_upper = requested_role.upper() if isinstance(requested_role, str) else None
+    recommended_roles = np.full(count, None, dtype=object)
+    role_bonus = np.zeros(count)
+    role_reasoning: List[Optional[str]] = [None] * count
+    unresolved = np.ones(count, dtype=bool)
+    if requested_upper:
+        has_requested = index.role_mask(requested_upper)[rows]
+        recommended_roles[has_requested] = requested_upper
+        role_bonus[has_requested] += 0.06
+        for hit in np.flatnonzero(has_requested):
+            role_reasoning[hit] = f"Optimal comfort pick for {requested_upper} role"
+        unresolved &= ~has_requested
+    for role in context.needed_roles:
+        fills = unresolved & index.role_mask(role)[rows]
+        recommended_roles[fills] = role
+        role_bonus[fills] += 0.08
+        for hit in np.flatnonzero(fills):
+            role_reasoning[hit] = f"Fills empty {role} slot"
+        unresolved &= ~fills
+    fallback = unresolved & index.has_roles[rows]
+    recommended_roles[fallback] = index.first_roles[rows][fallback]
+    if requested_upper:
+        role_bonus[fallback] -= 0.03
+        for hit in np.flatnonzero(fallback):
+            role_reasoning[hit] = f"Prefers {recommended_roles[hit]} over requested {requested_upper}"
+        recommended_roles[unresolved & ~fallback] = requested_upper
     score += role_bonus
     components["role_fit"] += role_bonus
-    reasoning.extend(role_reasoning)
-
-    simulation_context: Optional[Dict[str, Any]] = None
-    if simulation_matchup_table:
-        team_with_candidate = list(our_team)
-        team_with_candidate.append(champion)
-        our_sim_comp = _infer_mass_composition(team_with_candidate)
-        opponent_sim_comp = enemy_sim_comp or _infer_mass_composition(enemy_team)
-        simulation_context = _lookup_mass_matchup(our_sim_comp, opponent_sim_comp)
-        if simulation_context and simulation_context.get("win_rate") is not None:
-            delta = float(simulation_context.get("delta") or 0.0)
-            swing = max(-0.08, min(0.08, delta * 2.5))
+    for hit, line in enumerate(role_reasoning):
+        if line:
+            reasoning[hit].append(line)
+
+    simulation_contexts: List[Optional[Dict[str, Any]]] = [None] * count
+    simulation_bias = np.zeros(count)
+    if simulation_matchup_table and count:
+        our_sim_comps = _infer_mass_compositions_with_candidates(index, our, rows)
+        opponent_sim_comp = enemy.composition
+        resolved: Dict[Optional[str], Tuple[Optional[Dict[str, Any]], float, Optional[str]]] = {}
+        for our_sim_comp in set(our_sim_comps):
+            simulation_context = _lookup_mass_matchup(our_sim_comp, opponent_sim_comp)
+            swing = 0.0
+            line = None
+            if simulation_context and simulation_context.get("win_rate") is not None:
+                delta = float(simulation_context.get("delta") or 0.0)
+                swing = max(-0.08, min(0.08, delta * 2.5))
+                comp_label = _format_label(simulation_context.get("our_comp"))
+                enemy_label = _format_label(simulation_context.get("enemy_comp"))
+                win_pct = simulation_context["win_rate"] * 100.0
+                sample = ""
+                games = simulation_context.get("games")
+                if isinstance(games, int) and games > 0:
+                    sample = f" over {games:,} sims"
+                line = f"15M sims: {comp_label} vs {enemy_label} wins {win_pct:.1f}%{sample}"
+            resolved[our_sim_comp] = (simulation_context, swing, line)
+        for hit, our_sim_comp in enumerate(our_sim_comps):
+            simulation_context, swing, line = resolved[our_sim_comp]
+            if line is None:
+                simulation_contexts[hit] = simulation_context
+                continue
             if swing:
-                score += swing
-                components["simulation_bias"] = round(components.get("simulation_bias", 0.0) + swing, 3)
-            comp_label = _format_label(simulation_context.get("our_comp"))
-            enemy_label = _format_label(simulation_context.get("enemy_comp"))
-            win_pct = simulation_context["win_rate"] * 100.0
-            sample = ""
-            games = simulation_context.get("games")
-            if isinstance(games, int) and games > 0:
-                sample = f" over {games:,} sims"
-            reasoning.append(
-                f"15M sims: {comp_label} vs {enemy_label} wins {win_pct:.1f}%{sample}"
-            )
+                score[hit] += swing
+                simulation_bias[hit] = round(swing, 3)
+            reasoning[hit].append(line)
             context_copy = dict(simulation_context)
             context_copy["score_bonus"] = swing
-            simulation_context = context_copy
-
-    score += _contextual_noise(champion, our_team, enemy_team, requested_role)
-
-    score = max(0.0, min(1.0, score))
-
-    if not reasoning:
-        reasoning.append("Solid pick for composition")
-
-    components = {k: round(v, 3) for k, v in components.items() if abs(v) > 0.001}
-    return score, reasoning, recommended_role, components, simulation_context
+            simulation_contexts[hit] = context_copy
+
+    score += context.noise[rows]
+    score = np.clip(score, 0.0, 1.0)
+
+    results = []
+    for hit in range(count):
+        if not reasoning[hit]:
+            reasoning[hit].append("Solid pick for composition")
+        breakdown = {key: round(float(values[hit]), 3) for key, values in components.items()}
+        if simulation_bias[hit]:
+            breakdown["simulation_bias"] = float(simulation_bias[hit])
+        breakdown = {k: v for k, v in breakdown.items() if abs(v) > 0.001}
+        results.append((
+            float(score[hit]),
+            reasoning[hit],
+            recommended_roles[hit],
+            breakdown,
+            simulation_contexts[hit]
+        ))
+    return results
 
 
 def _generate_recommendations_for_slot(
@@ -1597,31 +2276,24 @@ def _generate_recommendations_for_slot(
 ) -> List[ChampionRecommendation]:
     """Generate sorted recommendations for a single pick slot."""
     recommendations: List[ChampionRecommendation] = []
-    enemy_sim_comp = _infer_mass_composition(enemy_team)
-
-    for champion in available_champions:
-        if requested_role:
-            champion_roles = _get_champion_roles(champion)
-            if requested_role not in champion_roles:
-                continue
+    index = _get_champion_index()
+    context = _build_draft_context(our_team, enemy_team, our_roles, requested_role)
 
-        score, reasoning, recommended_role, breakdown, sim_context = _score_champion_for_draft(
-            champion,
-            our_team,
-            enemy_team,
-            our_roles,
-            requested_role,
-            enemy_sim_comp
-        )
+    candidates = list(available_champions)
+    if requested_role:
+        role_fit = index.role_mask(requested_role)[index.rows(candidates)]
+        candidates = [champion for champion, fits in zip(candidates, role_fit) if fits]
 
-        champ_info = champion_data["assignments"][champion]
+    scored = _score_champions_for_draft(candidates, context)
 
+    for champion, (score, reasoning, recommended_role, breakdown, sim_context) in zip(candidates, scored):
+        row = index.positions[champion]
         recommendations.append(ChampionRecommendation(
             champion=champion,
             score=score,
-            archetype=champ_info["primary_archetype"],
+            archetype=index.archetypes[row],
             recommended_role=recommended_role,
-            attribute_highlights=_get_attribute_highlights(champ_info),
+            attribute_highlights=list(index.attribute_highlights[row]),
             reasoning=reasoning,
             score_breakdown=breakdown,
             rationale_tags=_extract_rationale_tags(reasoning),
@@ -1877,36 +2549,11 @@ def _format_label(value: Optional[str]) -> str:
 
 
 def _infer_mass_composition(team: List[str]) -> Optional[str]:
-    if not team or not champion_data:
-        return None
-    assignments = champion_data.get("assignments", {})
-    archetypes: List[str] = []
-    range_sources = 0
-    for champion in team:
-        info = assignments.get(champion)
-        if not info:
-            continue
-        archetype = info.get("primary_archetype")
-        if archetype:
-            archetypes.append(archetype)
-        attrs = _champ_info_attributes(info)
-        if any(attr.startswith("range_") for attr in attrs):
-            range_sources += 1
-    if not archetypes:
+    index = _get_champion_index()
+    if not team or index is None:
         return None
-
-    if sum(1 for a in archetypes if "diver" in a or "assassin" in a) >= 2:
-        return "dive"
-    if "artillery_mage" in archetypes and range_sources >= 2:
-        return "poke"
-    has_tank = any("tank" in a or "warden" in a for a in archetypes)
-    has_marksman = any("marksman" in a for a in archetypes)
-    has_enchanter = any("enchanter" in a for a in archetypes)
-    if has_tank and has_marksman and has_enchanter:
-        return "protect_the_carry"
-    if sum(1 for a in archetypes if "skirmisher" in a or "juggernaut" in a) >= 2:
-        return "bruiser"
-    return "mixed"
+    known = [champion for champion in team if champion in index.positions]
+    return _classify_mass_compositions(index, index.rows(known))[0]
 
 
 def _lookup_mass_matchup(
@@ -2160,51 +2807,51 @@ def _identify_key_champions(
     underdog_team = red_team if favored_side == "blue" else blue_team
     underdog_roles = red_roles if favored_side == "blue" else blue_roles
 
+    # Leave-one-out: swap each of the ten champions for the placeholder and
+    # score every variant in one batched call per model.
+    variants: List[Tuple[bool, str, str]] = []
+    drafts: List[Tuple[List[str], List[str], List[str], List[str]]] = []
+    for on_favored, team, roles in ((True, favored_team, favored_roles), (False, underdog_team, underdog_roles)):
+        other_team = underdog_team if on_favored else favored_team
+        other_roles = underdog_roles if on_favored else favored_roles
+        for idx, champion in enumerate(team):
+            swapped_team, swapped_roles, role_value = _swap_champion_for_impact(team, roles, idx)
+            if (favored_side == "blue") == on_favored:
+                drafts.append((swapped_team, swapped_roles, other_team, other_roles))
+            else:
+                drafts.append((other_team, other_roles, swapped_team, swapped_roles))
+            variants.append((on_favored, champion, role_value))
+
     playmaker: Optional[Dict[str, Any]] = None
     playmaker_impact = 0.0
-
-    for idx, champion in enumerate(favored_team):
-        swapped_team, swapped_roles, role_value = _swap_champion_for_impact(favored_team, favored_roles, idx)
-        if favored_side == "blue":
-            projection = _predict_blue_win_probability(swapped_team, swapped_roles, underdog_team, underdog_roles)
-        else:
-            projection = _predict_blue_win_probability(underdog_team, underdog_roles, swapped_team, swapped_roles)
-        if not projection:
-            continue
-        alt_blue = projection.get("blue", base_blue)
-        alt_favored = alt_blue if favored_side == "blue" else 1 - alt_blue
-        impact = base_favored - alt_favored
-        if impact > playmaker_impact + 1e-4:
-            playmaker_impact = impact
-            playmaker = {
-                "champion": champion,
-                "role": role_value,
-                "impact": impact,
-                "impact_pct": impact * 100.0
-            }
-
     threat: Optional[Dict[str, Any]] = None
     threat_impact = 0.0
 
-    for idx, champion in enumerate(underdog_team):
-        swapped_team, swapped_roles, role_value = _swap_champion_for_impact(underdog_team, underdog_roles, idx)
-        if favored_side == "blue":
-            projection = _predict_blue_win_probability(favored_team, favored_roles, swapped_team, swapped_roles)
-        else:
-            projection = _predict_blue_win_probability(swapped_team, swapped_roles, favored_team, favored_roles)
+    for (on_favored, champion, role_value), projection in zip(variants, _predict_blue_win_probabilities(drafts)):
         if not projection:
             continue
         alt_blue = projection.get("blue", base_blue)
         alt_favored = alt_blue if favored_side == "blue" else 1 - alt_blue
-        swing = alt_favored - base_favored
-        if swing > threat_impact + 1e-4:
-            threat_impact = swing
-            threat = {
-                "champion": champion,
-                "role": role_value,
-                "impact": swing,
-                "impact_pct": swing * 100.0
-            }
+        if on_favored:
+            impact = base_favored - alt_favored
+            if impact > playmaker_impact + 1e-4:
+                playmaker_impact = impact
+                playmaker = {
+                    "champion": champion,
+                    "role": role_value,
+                    "impact": impact,
+                    "impact_pct": impact * 100.0
+                }
+        else:
+            swing = alt_favored - base_favored
+            if swing > threat_impact + 1e-4:
+                threat_impact = swing
+                threat = {
+                    "champion": champion,
+                    "role": role_value,
+                    "impact": swing,
+                    "impact_pct": swing * 100.0
+                }
 
     result: Dict[str, Any] = {}
     if playmaker and playmaker_impact > 0:
@@ -2515,10 +3162,17 @@ def _convert_mass_summary_to_analysis(summary: Optional[Dict[str, Any]]) -> Opti
 
 
 def _load_simulation_summary() -> Dict[str, Any]:
-    """Load metadata and analysis from the latest simulation summary file."""
+    """Metadata and analysis from the latest simulation summary, re-read only when the file changes.
+
+    The returned payload is shared between callers and must not be mutated.
+    """
+    return _current_simulation_summary().payload
+
+
+def _read_simulation_summary(path: Path) -> Dict[str, Any]:
     payload: Dict[str, Any] = {
-        "path": str(SIMULATION_SUMMARY_PATH),
-        "exists": SIMULATION_SUMMARY_PATH.exists(),
+        "path": str(path),
+        "exists": path.exists(),
         "last_modified": None,
         "metadata": None,
         "analysis": None,
@@ -2530,13 +3184,12 @@ def _load_simulation_summary() -> Dict[str, Any]:
         return payload
 
     try:
-        payload["last_modified"] = _safe_iso_timestamp(SIMULATION_SUMMARY_PATH.stat().st_mtime)
+        payload["last_modified"] = _safe_iso_timestamp(path.stat().st_mtime)
     except OSError as exc:
         payload["stat_error"] = str(exc)
 
     try:
-        with SIMULATION_SUMMARY_PATH.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        data = load_simulation_payload(path)
         summary_block = data.get("summary")
         metadata_block = _normalize_simulation_metadata(data.get("metadata"), summary_block)
         analysis_block = data.get("analysis") or _convert_mass_summary_to_analysis(summary_block)
@@ -2551,11 +3204,68 @@ def _load_simulation_summary() -> Dict[str, Any]:
     return payload
 
 
-def _refresh_mass_simulation_tables() -> None:
-    """Hydrate lookup tables from the latest simulation summary for fast access."""
-    global simulation_summary_cache, simulation_matchup_table, simulation_composition_table
-    payload = _load_simulation_summary()
-    simulation_summary_cache = payload
+@dataclass(frozen=True)
+class SimulationSummarySnapshot:
+    """One parsed summary file with its response bytes and lookup tables; replaced whole on reload."""
+
+    signature: Optional[Tuple[int, int, int]]
+    payload: Dict[str, Any]
+    body: bytes
+    etag: str
+    raw_payload: Dict[str, Any]
+    matchup_table: Dict[Tuple[str, str], Dict[str, Any]]
+    composition_table: Dict[str, Any]
+
+
+def _current_simulation_summary() -> SimulationSummarySnapshot:
+    """Loaded summary snapshot; a changed file is swapped in as a new bundle first."""
+    snapshot = simulation_summary_snapshot
+    if snapshot is not None and snapshot.signature == file_signature(SIMULATION_SUMMARY_PATH):
+        return snapshot
+    # A reload already in progress brings its own summary, so only wait when none is loaded.
+    if _reload_lock.acquire(blocking=snapshot is None):
+        try:
+            snapshot = simulation_summary_snapshot
+            if snapshot is None or snapshot.signature != file_signature(SIMULATION_SUMMARY_PATH):
+                _install_simulation_summary(_build_simulation_summary(SIMULATION_SUMMARY_PATH))
+        finally:
+            _reload_lock.release()
+    return simulation_summary_snapshot
+
+
+def _install_simulation_summary(snapshot: SimulationSummarySnapshot) -> None:
+    """Swap a re-read summary in through the bundle lock; callers hold ``_reload_lock``."""
+    if model_bundle is None:
+        # Models never loaded, so there is no bundle to extend; still wait for readers.
+        with bundle_lock.write():
+            _apply_simulation_summary(snapshot)
+            response_cache.clear("simulation_tables")
+        return
+    sources = dict(model_bundle.sources)
+    sources[SIMULATION_SUMMARY_PATH] = snapshot.signature
+    _install_model_bundle(replace(
+        model_bundle,
+        simulation_summary=snapshot,
+        summary_path=SIMULATION_SUMMARY_PATH,
+        sources=sources,
+        version=model_bundle.version + 1,
+        loaded_at=time.time()
+    ))
+    print(f"Model bundle v{model_bundle.version} loaded (simulation summary changed)")
+
+
+def _build_simulation_summary(path: Path) -> SimulationSummarySnapshot:
+    """Parse ``path`` into a snapshot with matchup/composition lookup tables."""
+    # Stat before reading so a write that lands mid-read triggers another reload.
+    signature = file_signature(path)
+    payload = _read_simulation_summary(path)
+    served = payload
+    try:
+        # Same encoding as FastAPI's JSONResponse, which rejects NaN/Infinity.
+        body = json.dumps(served, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+    except ValueError as exc:
+        served = {**payload, "metadata": None, "analysis": None, "sample_games": None, "status": "error", "load_error": str(exc)}
+        body = json.dumps(served, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
     analysis = payload.get("analysis") or {}
     raw_matchups = analysis.get("raw_matchups") or {}
     matchups: Dict[Tuple[str, str], Dict[str, Any]] = {}
@@ -2576,8 +3286,24 @@ def _refresh_mass_simulation_tables() -> None:
             "blue_ci_half_width": entry.get("blue_ci_half_width"),
             "red_ci_half_width": entry.get("red_ci_half_width")
         }
-    simulation_matchup_table = matchups
-    simulation_composition_table = analysis.get("raw_compositions") or {}
+    return SimulationSummarySnapshot(
+        signature=signature,
+        payload=served,
+        body=body,
+        etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+        raw_payload=payload,
+        matchup_table=matchups,
+        composition_table=analysis.get("raw_compositions") or {}
+    )
+
+
+def _apply_simulation_summary(snapshot: SimulationSummarySnapshot) -> None:
+    """Point the summary globals at ``snapshot``; callers hold ``bundle_lock`` for writing."""
+    global simulation_summary_cache, simulation_summary_snapshot, simulation_matchup_table, simulation_composition_table
+    simulation_summary_cache = snapshot.raw_payload
+    simulation_matchup_table = snapshot.matchup_table
+    simulation_composition_table = snapshot.composition_table
+    simulation_summary_snapshot = snapshot
 
 
 def _safe_iso_timestamp(raw_ts: Optional[float]) -> Optional[str]:
@@ -2602,7 +3328,7 @@ def _model_status() -> Dict[str, Any]:
 
 
 def _telemetry_status() -> Dict[str, Any]:
-    """Summarize backlog characteristics for telemetry log."""
+    """Summarize backlog characteristics for telemetry log (read incrementally)."""
     stats: Dict[str, Any] = {
         "log_path": str(TELEMETRY_LOG_PATH),
         "log_exists": TELEMETRY_LOG_PATH.exists(),
@@ -2615,25 +3341,16 @@ def _telemetry_status() -> Dict[str, Any]:
         return stats
 
     try:
-        stats["size_bytes"] = TELEMETRY_LOG_PATH.stat().st_size
-    except OSError as exc:
-        stats["size_bytes_error"] = str(exc)
-
-    backlog = 0
-    last_line = ""
-    try:
-        with TELEMETRY_LOG_PATH.open("r", encoding="utf-8") as handle:
-            for backlog, line in enumerate(handle, start=1):
-                if line.strip():
-                    last_line = line
+        tail = _telemetry_tail.refresh()
     except Exception as exc:
         stats["read_error"] = str(exc)
         return stats
 
-    stats["backlog_events"] = backlog
-    if last_line:
+    stats["size_bytes"] = tail["size_bytes"]
+    stats["backlog_events"] = tail["lines"]
+    if tail["last_line"]:
         try:
-            record = json.loads(last_line)
+            record = json.loads(tail["last_line"])
             stats["last_event_ts"] = _safe_iso_timestamp(record.get("ts"))
         except Exception as exc:
             stats["last_event_error"] = str(exc)
@@ -2641,11 +3358,19 @@ def _telemetry_status() -> Dict[str, Any]:
     return stats
 
 
+# Only bytes appended since the previous /health poll are read.
+_telemetry_tail = LogTail(TELEMETRY_LOG_PATH)
+
+
 def _calibration_status() -> Dict[str, Any]:
     """Expose last calibration metadata + timestamp."""
+    return dict(_calibration_file_cache.get(CALIBRATION_REPORT_PATH))
+
+
+def _read_calibration_report(path: Path) -> Dict[str, Any]:
     status: Dict[str, Any] = {
-        "report_path": str(CALIBRATION_REPORT_PATH),
-        "report_exists": CALIBRATION_REPORT_PATH.exists(),
+        "report_path": str(path),
+        "report_exists": path.exists(),
         "last_report_ts": None,
         "samples": None,
         "ece": None,
@@ -2657,12 +3382,12 @@ def _calibration_status() -> Dict[str, Any]:
         return status
 
     try:
-        status["last_report_ts"] = _safe_iso_timestamp(CALIBRATION_REPORT_PATH.stat().st_mtime)
+        status["last_report_ts"] = _safe_iso_timestamp(path.stat().st_mtime)
     except OSError as exc:
         status["last_report_error"] = str(exc)
 
     try:
-        with CALIBRATION_REPORT_PATH.open("r", encoding="utf-8") as handle:
+        with path.open("r", encoding="utf-8") as handle:
             payload = json.load(handle)
         status.update({
             "samples": payload.get("samples"),
@@ -2676,6 +3401,15 @@ def _calibration_status() -> Dict[str, Any]:
     return status
 
 
+_calibration_file_cache = MtimeCache(_read_calibration_report)
+
+
+def _response_cache_status() -> Dict[str, Any]:
+    stats = response_cache.stats()
+    stats["last_invalidated_at"] = _safe_iso_timestamp(stats.get("last_invalidated_at"))
+    return stats
+
+
 def _build_health_payload() -> Dict[str, Any]:
     """Combine subsystem snapshots for /health."""
     service_state = "online" if predictor is not None else "degraded"
@@ -2686,6 +3420,9 @@ def _build_health_payload() -> Dict[str, Any]:
         "models": _model_status(),
         "telemetry": _telemetry_status(),
         "calibration": _calibration_status(),
+        "response_cache": _response_cache_status(),
+        "compute_pool": compute_pool.stats(),
+        "model_bundle": _model_bundle_status(),
         "simulation_summary": _load_simulation_summary(),
     }
 
@@ -2700,6 +3437,8 @@ if __name__ == "__main__":
     print("Endpoints:")
     print("  GET  / - Basic status ping")
     print("  GET  /health - Health metrics")
+    print("  GET  /health/live - Liveness probe")
+    print("  POST /admin/reload - Hot-reload models and data (X-Admin-Token)")
     print("  POST /draft/recommend - Get champion recommendations")
     print("  POST /draft/analyze - Analyze team compositions")
     print("  GET  /champions/{name} - Get champion details")
@@ -0,0 +1,124 @@
+"""Change-aware readers for files that /health reports on every poll."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """(mtime_ns, size, inode) of ``path``, or None if it cannot be stat'ed."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+class MtimeCache:
+    """Memoize ``loader(path)`` until the file's mtime, size or inode changes.
+
+    A missing file is cached too (as ``loader``'s result for the missing path),
+    so repeated polls of an absent report do not retry the parse.
+    """
+
+    def __init__(self, loader: Callable[[Path], Any]):
+        self._loader = loader
+        self._lock = Lock()
+        self._entries: Dict[Path, Tuple[Optional[Tuple[int, int, int]], Any]] = {}
+        self.loads = 0
+        self.hits = 0
+
+    def get(self, path: Path) -> Any:
+        path = Path(path)
+        signature = file_signature(path)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                return entry[1]
+        value = self._loader(path)
+        with self._lock:
+            self._entries[path] = (signature, value)
+            self.loads += 1
+        return value
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(Path(path), None)
+
+
+class LogTail:
+    """Line count and last non-empty line of an append-only log, read incrementally.
+
+    Each `refresh` reads only the bytes appended since the previous call. If the
+    file shrinks or is replaced (rotation/truncation), counting restarts from 0.
+    """
+
+    def __init__(self, path: Path, chunk_size: int = 1 << 20):
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self._lock = Lock()
+        self._reset(None)
+
+    def _reset(self, inode: Optional[int]) -> None:
+        self.inode = inode
+        self.offset = 0
+        self.complete_lines = 0
+        self.partial = b""
+        self.last_line = b""
+        self.bytes_read = 0
+
+    @property
+    def line_count(self) -> int:
+        """Lines in the file, counting an unterminated final line (like iterating it)."""
+        return self.complete_lines + (1 if self.partial else 0)
+
+    def refresh(self) -> Dict[str, Any]:
+        """Catch up with the file and return ``{"lines", "last_line", "size_bytes"}``."""
+        with self._lock:
+            try:
+                stat = os.stat(self.path)
+            except OSError:
+                self._reset(None)
+                return {"lines": 0, "last_line": None, "size_bytes": 0}
+            if stat.st_ino != self.inode or stat.st_size < self.offset:
+                self._reset(stat.st_ino)
+            if stat.st_size > self.offset:
+                with open(self.path, "rb") as handle:
+                    handle.seek(self.offset)
+                    while True:
+                        chunk = handle.read(self.chunk_size)
+                        if not chunk:
+                            break
+                        self._consume(chunk)
+                        self.offset += len(chunk)
+                        self.bytes_read += len(chunk)
+            last = self.partial if self.partial.strip() else self.last_line
+            return {
+                "lines": self.line_count,
+                "last_line": last.decode("utf-8", errors="replace") if last else None,
+                "size_bytes": self.offset,
+            }
+
+    def _consume(self, chunk: bytes) -> None:
+        data = self.partial + chunk
+        newlines = data.count(b"\n")
+        if not newlines:
+            self.partial = data
+            return
+        self.complete_lines += newlines
+        body, _, self.partial = data.rpartition(b"\n")
+        # Walk back over trailing blank lines to the last line with content.
+        end = len(body)
+        while end > 0:
+            start = body.rfind(b"\n", 0, end) + 1
+            if body[start:end].strip():
+                self.last_line = body[start:end]
+                break
+            end = start - 1
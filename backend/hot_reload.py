@@ -0,0 +1,126 @@
+"""Primitives for swapping loaded models/data while the API keeps serving."""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from backend.file_cache import file_signature
+
+
+class ReadWriteLock:
+    """Many concurrent readers or one writer; a waiting writer blocks new readers.
+
+    Requests hold the read side for their whole run, so a bundle swap (the
+    write side) waits for in-flight requests to finish on the old bundle and
+    requests arriving during the swap start on the new one.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+Signatures = Dict[Path, Optional[Tuple[int, int, int]]]
+
+
+def snapshot_signatures(paths: Iterable[Path]) -> Signatures:
+    return {Path(path): file_signature(Path(path)) for path in paths}
+
+
+class FileWatcher:
+    """Poll a set of files and call ``on_change`` once they change and settle.
+
+    ``paths`` is re-evaluated every poll so newly written files (e.g. a newer
+    simulation summary) are picked up. A change only fires after the
+    signatures stay identical for one further poll, so half-written model
+    pickles are not loaded.
+    """
+
+    def __init__(
+        self,
+        paths: Callable[[], List[Path]],
+        on_change: Callable[[List[Path]], None],
+        interval: float = 5.0
+    ) -> None:
+        self._paths = paths
+        self._on_change = on_change
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._baseline: Signatures = {}
+
+    def start(self, baseline: Optional[Signatures] = None) -> None:
+        if self._thread is not None:
+            return
+        self._baseline = baseline if baseline is not None else snapshot_signatures(self._paths())
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="model-bundle-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1.0)
+            self._thread = None
+
+    def rebase(self, baseline: Signatures) -> None:
+        """Adopt signatures from a reload triggered elsewhere (e.g. the admin endpoint)."""
+        self._baseline = dict(baseline)
+
+    def poll(self, pending: Optional[Signatures] = None) -> Optional[Signatures]:
+        """One watch step; returns the signatures still waiting to settle."""
+        current = snapshot_signatures(self._paths())
+        if current == self._baseline:
+            return None
+        if pending is None or current != pending:
+            return current
+        changed = sorted(
+            path for path in set(current) | set(self._baseline)
+            if current.get(path) != self._baseline.get(path)
+        )
+        self._baseline = current
+        self._on_change(changed)
+        return None
+
+    def _run(self) -> None:
+        pending: Optional[Signatures] = None
+        while not self._stop.wait(self.interval):
+            try:
+                pending = self.poll(pending)
+            except Exception as exc:
+                print(f"Model watcher error: {exc}")
+                pending = None
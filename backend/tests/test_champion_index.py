@@ -0,0 +1,72 @@
+import pytest
+
+from backend import draft_api
+
+
+def _champion(archetype, position, attributes, viable=()):
+    return {
+        "primary_archetype": archetype,
+        "primary_position": position,
+        "viable_positions": list(viable),
+        "archetype_attributes": list(attributes),
+    }
+
+
+@pytest.fixture
+def toy_champions(monkeypatch):
+    data = {
+        "assignments": {
+            "Ahri": _champion("burst_mage", "MIDDLE", ["damage_magic", "mobility_high"]),
+            "Jinx": _champion("marksman", "BOTTOM", ["damage_physical", "range_long"]),
+            "Leona": _champion("engage_tank", "UTILITY", ["cc_hard", "engage", "survive_tank"]),
+            "Janna": _champion("enchanter", "UTILITY", ["utility_peel", "utility_shields"]),
+            "Zed": _champion("burst_assassin", "MIDDLE", ["damage_physical", "mobility_high"]),
+            "Vi": _champion("diver", "JUNGLE", ["damage_physical", "cc_hard", "engage"], viable=["TOP"]),
+        }
+    }
+    monkeypatch.setattr(draft_api, "champion_data", data)
+    monkeypatch.setattr(draft_api, "simulation_matchup_table", {})
+    return data
+
+
+def test_index_rebuilds_when_champion_data_changes(toy_champions, monkeypatch):
+    index = draft_api._get_champion_index()
+
+    assert draft_api._get_champion_index() is index
+    assert index.champion_roles[index.positions["Vi"]] == ["JUNGLE", "TOP"]
+    assert index.role_mask("TOP")[index.positions["Vi"]]
+
+    monkeypatch.setattr(draft_api, "champion_data", {"assignments": dict(toy_champions["assignments"])})
+    assert draft_api._get_champion_index() is not index
+
+
+def test_batch_scores_apply_team_context_per_candidate(toy_champions):
+    our_team = ["Jinx", "Zed"]
+    enemy_team = ["Ahri"]
+    candidates = ["Ahri", "Leona", "Janna"]
+
+    context = draft_api._build_draft_context(our_team, enemy_team, ["BOTTOM", "MIDDLE"], "UTILITY")
+    scored = draft_api._score_champions_for_draft(candidates, context)
+    by_champion = dict(zip(candidates, scored))
+
+    assert "Introduces first magic damage threat" in by_champion["Ahri"][1]
+    assert "Lineup still lacks dependable magic damage" in by_champion["Leona"][1]
+    assert "Enchanter synergizes with marksman" in by_champion["Janna"][1]
+    assert by_champion["Leona"][2] == "UTILITY"
+    assert by_champion["Ahri"][2] == "MIDDLE"
+    assert "Prefers MIDDLE over requested UTILITY" in by_champion["Ahri"][1]
+
+    single = draft_api._score_champion_for_draft("Leona", our_team, enemy_team, ["BOTTOM", "MIDDLE"], "UTILITY")
+    assert single == by_champion["Leona"]
+
+
+def test_team_aggregates_are_cached_by_sorted_picks(toy_champions):
+    index = draft_api._get_champion_index()
+
+    first = index.team_aggregate(["Jinx", "Zed", "Leona"])
+    second = index.team_aggregate(["Leona", "Jinx", "Zed"])
+
+    assert first is second
+    assert first.profile == draft_api._summarize_team_profile(["Jinx", "Zed", "Leona"])
+    assert first.composition == draft_api._infer_mass_composition(["Jinx", "Zed", "Leona"])
+    assert first.tank_count == 1
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+sklearn = pytest.importorskip("sklearn")
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+
+from validation.compiled_models import BOOSTING_FALLBACK_ROWS, FOREST_FALLBACK_ROWS, compile_models
+
+
+def test_compiled_models_match_sklearn_probabilities():
+    rng = np.random.default_rng(11)
+    X = rng.normal(size=(600, 12))
+    y = (X[:, 0] + 0.5 * X[:, 3] - X[:, 7] + rng.normal(scale=0.8, size=600) > 0).astype(int)
+    models = {
+        "logistic": LogisticRegression(max_iter=500).fit(X, y),
+        "random_forest": RandomForestClassifier(n_estimators=20, max_depth=6, random_state=0).fit(X, y),
+        "gradient_boosting": GradientBoostingClassifier(n_estimators=30, max_depth=3, random_state=0).fit(X, y),
+    }
+
+    compiled = compile_models(models)
+
+    probe = rng.normal(size=(max(FOREST_FALLBACK_ROWS, BOOSTING_FALLBACK_ROWS) + 1, 12))
+    for name, model in models.items():
+        assert compiled[name] is not model
+        for batch in (probe[:1], probe[:64], probe):
+            np.testing.assert_allclose(compiled[name].predict_proba(batch), model.predict_proba(batch), atol=1e-12)
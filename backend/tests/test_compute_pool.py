@@ -0,0 +1,43 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from backend import draft_api
+from backend.compute_pool import ComputePool, PoolSaturated
+
+
+def test_pool_rejects_past_workers_plus_queue_and_frees_slots():
+    pool = ComputePool(max_workers=1, max_queue=1, name="test")
+    release = threading.Event()
+
+    async def scenario():
+        running = [asyncio.ensure_future(pool.run(release.wait, 5)) for _ in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(PoolSaturated):
+            await pool.run(lambda: None)
+        release.set()
+        await asyncio.gather(*running)
+        return await pool.run(lambda value: value * 2, 21)
+
+    try:
+        assert asyncio.run(scenario()) == 42
+    finally:
+        pool.shutdown()
+    stats = pool.stats()
+    assert stats["rejected"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["peak_in_flight"] == 2
+
+
+def test_saturated_pool_maps_to_429(monkeypatch):
+    pool = ComputePool(max_workers=1, max_queue=0)
+    pool.in_flight = pool.capacity
+    monkeypatch.setattr(draft_api, "compute_pool", pool)
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(draft_api._run_compute(lambda: None))
+
+    assert excinfo.value.status_code == 429
+    assert excinfo.value.headers["Retry-After"] == str(draft_api.COMPUTE_RETRY_AFTER_SECONDS)
@@ -0,0 +1,75 @@
+import numpy as np
+
+from validation import ml_simulation
+
+
+CHAMP_DATA = {
+    "assignments": {
+        "Aatrox": {"attributes": ["damage_physical", "range_melee", "scaling_mid", "cc_soft"]},
+        "Vi": {"attributes": ["damage_physical", "range_melee", "mobility_high", "cc_hard"]},
+        "Ahri": {"attributes": ["damage_magic", "range_medium", "mobility_high", "cc_hard"]},
+        "Jinx": {"attributes": ["damage_physical", "range_long", "scaling_late"]},
+        "Leona": {"attributes": ["cc_hard", "cc_aoe", "range_melee", "survive_tank"]},
+        "Ornn": {"attributes": ["cc_hard", "range_melee", "survive_tank", "scaling_late"]},
+        "Sejuani": {"attributes": ["cc_hard", "cc_aoe", "range_melee"]},
+        "Orianna": {"attributes": ["damage_magic", "range_medium", "cc_soft", "scaling_late"]},
+        "Caitlyn": {"attributes": ["damage_physical", "range_long", "scaling_early"]},
+        "Lulu": {"attributes": ["utility_peel", "cc_soft", "range_medium"]},
+    }
+}
+MATCHUP_STATS = {
+    "lane_matchups": {
+        "Top": {"Aatrox|Ornn": {"games": 12, "blue_wins": 8}},
+        "Middle": {"Ahri|Orianna": {"games": 30, "blue_wins": 11}},
+        "Bottom": {"Jinx|Caitlyn": {"games": 5, "blue_wins": 4}},
+    },
+    "duo_matchups": {
+        "Top_Jungle": {"Aatrox|Vi": {"games": 9, "wins": 7}},
+        "Jungle_Middle": {"Sejuani|Orianna": {"games": 20, "wins": 9}},
+        "Bottom_Support": {"Caitlyn|Lulu": {"games": 14, "wins": 10}},
+    },
+}
+LANES = ["Top", "Jungle", "Middle", "Bottom", "Support"]
+
+
+def test_matrix_builder_matches_per_game_feature_dicts(tmp_path, monkeypatch):
+    monkeypatch.setattr(ml_simulation, "_MATCHUP_CACHE_DIR", tmp_path)
+    blue_teams = [["Aatrox", "Vi", "Ahri", "Jinx", "Leona"], ["Ornn", "Sejuani", "Orianna", "Caitlyn", "Lulu"]]
+    red_teams = [["Ornn", "Sejuani", "Orianna", "Caitlyn", "Lulu"], ["Aatrox", "Vi", "Ahri", "Jinx", "Leona"]]
+
+    feature_names = set()
+    expected_dicts = []
+    for blue, red in zip(blue_teams, red_teams):
+        features, _ = ml_simulation.build_match_feature_dict(
+            dict(zip(LANES, blue)), dict(zip(LANES, red)), CHAMP_DATA, MATCHUP_STATS
+        )
+        feature_names.update(features)
+        expected_dicts.append(features)
+    feature_names = sorted(feature_names) + ["team_attr_unused"]
+    expected = np.array([ml_simulation.features_to_vector(f, feature_names) for f in expected_dicts])
+
+    builder = ml_simulation.TeamFeatureMatrixBuilder(
+        list(CHAMP_DATA["assignments"]), LANES, CHAMP_DATA, MATCHUP_STATS, feature_names
+    )
+    matrix = builder.build(builder.champion_indices(blue_teams), builder.champion_indices(red_teams))
+
+    assert np.array_equal(matrix, expected)
+    assert matrix[:, feature_names.index("lane_advantage_middle")].any()
+    assert matrix[:, feature_names.index("duo_synergy_delta_bottom_support")].any()
+
+
+def test_feature_index_dense_and_csr_rows_match_features_to_vector():
+    dicts = [
+        {"team_attr_cc_hard": 0.2, "lane_advantage_top": 0.0, "not_a_model_feature": 3.0},
+        {},
+        {"lane_advantage_top": -0.1, "duo_synergy_delta_top_jungle": 0.05},
+    ]
+    feature_names = ["duo_synergy_delta_top_jungle", "lane_advantage_top", "team_attr_cc_hard"]
+    index = ml_simulation.FeatureIndex(feature_names)
+    expected = np.array([ml_simulation.features_to_vector(f, feature_names) for f in dicts])
+
+    matrix = index.csr(dicts)
+
+    assert [index.vector(f) for f in dicts] == expected.tolist()
+    assert np.array_equal(matrix.toarray(), expected)
+    assert matrix.nnz == 3
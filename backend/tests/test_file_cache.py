@@ -0,0 +1,45 @@
+import os
+
+from backend.file_cache import LogTail, MtimeCache
+
+
+def test_log_tail_reads_only_appended_bytes_and_handles_truncation(tmp_path):
+    log = tmp_path / "events.jsonl"
+    log.write_bytes(b'{"ts": 1}\n\n{"ts": 2}\n')
+    tail = LogTail(log, chunk_size=4)
+
+    assert tail.refresh() == {"lines": 3, "last_line": '{"ts": 2}', "size_bytes": log.stat().st_size}
+
+    with log.open("ab") as handle:
+        handle.write(b'{"ts": 3}\n{"ts"')
+    before = tail.bytes_read
+    status = tail.refresh()
+    assert tail.bytes_read - before == 15
+    assert status["lines"] == 5
+    assert status["last_line"] == '{"ts"'
+
+    with log.open("ab") as handle:
+        handle.write(b': 4}\n\n')
+    assert tail.refresh()["last_line"] == '{"ts": 4}'
+    assert tail.line_count == sum(1 for _ in log.open("r", encoding="utf-8"))
+
+    log.write_bytes(b'{"ts": 9}\n')
+    assert tail.refresh() == {"lines": 1, "last_line": '{"ts": 9}', "size_bytes": 10}
+
+
+def test_mtime_cache_reloads_only_when_file_changes(tmp_path):
+    report = tmp_path / "report.json"
+    report.write_text("a", encoding="utf-8")
+    cache = MtimeCache(lambda path: path.read_text(encoding="utf-8") if path.exists() else None)
+
+    assert cache.get(report) == "a"
+    assert cache.get(report) == "a"
+    assert cache.loads == 1
+
+    report.write_text("bb", encoding="utf-8")
+    stat = report.stat()
+    os.utime(report, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert cache.get(report) == "bb"
+    report.unlink()
+    assert cache.get(report) is None
+    assert cache.loads == 3
@@ -0,0 +1,192 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from backend import draft_api
+from backend.response_cache import ResponseCache
+from backend.hot_reload import FileWatcher, ReadWriteLock, snapshot_signatures
+
+
+def test_watcher_fires_once_files_settle(tmp_path):
+    model = tmp_path / "model.pkl"
+    model.write_bytes(b"v1")
+    fired = []
+    paths = [model, tmp_path / "summary.json"]
+    watcher = FileWatcher(lambda: paths, fired.append)
+    watcher.rebase(snapshot_signatures(paths))
+
+    assert watcher.poll() is None
+    model.write_bytes(b"v2-partial")
+    pending = watcher.poll()
+    assert pending is not None and fired == []
+    model.write_bytes(b"v2-complete")
+    pending = watcher.poll(pending)
+    assert fired == []
+    assert watcher.poll(pending) is None
+    assert fired == [[model]]
+
+
+def test_swap_waits_for_in_flight_readers():
+    lock = ReadWriteLock()
+    events = []
+    reading = threading.Event()
+
+    def reader():
+        with lock.read():
+            reading.set()
+            time.sleep(0.05)
+            events.append("request done")
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    reading.wait()
+    with lock.write():
+        events.append("swapped")
+    thread.join()
+
+    assert events == ["request done", "swapped"]
+
+
+def _summary(tag):
+    return draft_api.SimulationSummarySnapshot(
+        signature=None,
+        payload={"tag": tag},
+        body=b"{}",
+        etag=f'"{tag}"',
+        raw_payload={"tag": tag},
+        matchup_table={("dive", "poke"): {"tag": tag}},
+        composition_table={"dive": {"tag": tag}},
+    )
+
+
+def _bundle(version, champions):
+    return draft_api.ModelBundle(
+        predictor=SimpleNamespace(tag=version),
+        champion_data=champions,
+        attribute_data={},
+        simulation_model=None,
+        simulation_feature_names=[],
+        blue_side_prior=0.5,
+        solo_queue_ban_stats={},
+        flex_priority_scores={},
+        champion_index=draft_api.ChampionIndex(champions["assignments"]),
+        simulation_summary=_summary(version),
+        summary_path=draft_api.SIMULATION_SUMMARY_PATH,
+        sources={},
+        version=version,
+        loaded_at=0.0,
+    )
+
+
+def _isolate_serving_globals(monkeypatch):
+    for name in ("model_bundle", "predictor", "champion_data", "attribute_data", "simulation_model",
+                 "simulation_feature_names", "blue_side_prior", "solo_queue_ban_stats", "flex_priority_scores",
+                 "SIMULATION_SUMMARY_PATH", "bundle_watcher", "_champion_index", "simulation_summary_cache",
+                 "simulation_summary_snapshot", "simulation_matchup_table", "simulation_composition_table"):
+        monkeypatch.setattr(draft_api, name, getattr(draft_api, name))
+    monkeypatch.setattr(draft_api, "reload_status", dict(draft_api.reload_status))
+    monkeypatch.setattr(draft_api, "response_cache", ResponseCache())
+
+
+def test_reload_swaps_bundle_and_keeps_old_one_on_failure(monkeypatch):
+    _isolate_serving_globals(monkeypatch)
+    monkeypatch.setattr(draft_api, "_build_model_bundle", lambda version: _bundle(version, {"assignments": {}}))
+
+    assert draft_api.reload_model_bundle("test")
+    first = draft_api.model_bundle
+    assert first.version == 1
+    assert draft_api.predictor is first.predictor
+    assert draft_api.champion_data is first.champion_data
+
+    def broken(version):
+        raise FileNotFoundError("trained_models.pkl")
+
+    monkeypatch.setattr(draft_api, "_build_model_bundle", broken)
+    assert draft_api.reload_model_bundle("test")
+    assert draft_api.model_bundle is first
+    assert draft_api.predictor is first.predictor
+    status = draft_api._model_bundle_status()
+    assert status["state"] == "failed"
+    assert status["version"] == 1
+    assert "trained_models.pkl" in status["last_error"]
+
+
+def _serving_tags():
+    """Bundle tag of every global a request reads; one tag means no mixing."""
+    return {
+        draft_api.predictor.tag,
+        draft_api.champion_data["tag"],
+        draft_api._get_champion_index().assignments["Ahri"]["tag"],
+        draft_api.simulation_summary_snapshot.payload["tag"],
+        draft_api.simulation_matchup_table[("dive", "poke")]["tag"],
+        draft_api.simulation_composition_table["dive"]["tag"],
+    }
+
+
+def test_request_sees_one_bundle_and_old_responses_do_not_survive_swap(monkeypatch):
+    _isolate_serving_globals(monkeypatch)
+    draft_api._install_model_bundle(_bundle(1, {"tag": 1, "assignments": {"Ahri": {"tag": 1}}}))
+    started = threading.Event()
+    release = threading.Event()
+
+    def old_request():
+        before = _serving_tags()
+        started.set()
+        release.wait(5)
+        draft_api.response_cache.put("draft", "computed on v1")
+        return before, _serving_tags()
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        request = pool.submit(draft_api._run_on_current_bundle, old_request)
+        started.wait(5)
+        swap = threading.Thread(
+            target=draft_api._install_model_bundle,
+            args=(_bundle(2, {"tag": 2, "assignments": {"Ahri": {"tag": 2}}}),)
+        )
+        swap.start()
+        time.sleep(0.05)
+        assert draft_api.model_bundle.version == 1
+        release.set()
+        swap.join(5)
+
+        assert request.result() == ({1}, {1})
+    assert draft_api._run_on_current_bundle(_serving_tags) == {2}
+    assert draft_api.response_cache.get("draft") is None
+
+
+def test_changed_summary_is_swapped_in_as_a_new_bundle(monkeypatch, tmp_path):
+    _isolate_serving_globals(monkeypatch)
+    summary_path = tmp_path / "mass_simulation_summary.json"
+    summary_path.write_text(json.dumps({"analysis": {"raw_matchups": {
+        "dive__vs__poke": {"games": 40, "avg_blue_win_prob": 0.6},
+    }}}), encoding="utf-8")
+    monkeypatch.setattr(draft_api, "SIMULATION_SUMMARY_PATH", summary_path)
+    first = _bundle(1, {"tag": 1, "assignments": {"Ahri": {"tag": 1}}})
+    draft_api._install_model_bundle(first)
+    started = threading.Event()
+    release = threading.Event()
+
+    def open_request():
+        started.set()
+        release.wait(5)
+        return draft_api.simulation_matchup_table[("dive", "poke")]
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        request = pool.submit(draft_api._run_on_current_bundle, open_request)
+        started.wait(5)
+        summary = pool.submit(draft_api._current_simulation_summary)
+        time.sleep(0.05)
+        assert not summary.done()
+        release.set()
+
+        assert request.result() == {"tag": 1}
+        snapshot = summary.result(5)
+
+    bundle = draft_api.model_bundle
+    assert bundle.version == 2 and bundle.simulation_summary is snapshot
+    assert bundle.predictor is first.predictor
+    assert draft_api.simulation_matchup_table[("dive", "poke")]["avg_blue_win_prob"] == 0.6
+    assert first.simulation_summary.matchup_table == {("dive", "poke"): {"tag": 1}}
+    assert draft_api._current_simulation_summary() is snapshot
@@ -0,0 +1,60 @@
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from validation import run_mass_simulation as rms
+
+
+def _run_main(monkeypatch, tmp_path, name, slow_task):
+    """Run ``main`` on threads with one slow task; return (summary, merge order, peak window)."""
+    real_chunk = rms._simulate_chunk_process
+    seeds = {rms._task_seed(7, task): task for task in range(8)}
+    lock = threading.Lock()
+    merged = []
+    window = {"submitted": 0, "peak": 0}
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            with lock:
+                window["submitted"] += 1
+                window["peak"] = max(window["peak"], window["submitted"] - len(merged))
+            return super().submit(fn, *args, **kwargs)
+
+    def chunk_process(size, seed, *args):
+        result = real_chunk(size, seed, *args)
+        if seeds[seed] == slow_task:
+            time.sleep(0.3)
+        result[0]["task"] = seeds[seed]
+        return result
+
+    def merge(target, source):
+        with lock:
+            merged.append(source.pop("task"))
+        real_merge(target, source)
+
+    real_merge = rms._merge_stats
+    monkeypatch.setattr(rms, "ProcessPoolExecutor", RecordingExecutor)
+    monkeypatch.setattr(rms, "_simulate_chunk_process", chunk_process)
+    monkeypatch.setattr(rms, "_merge_stats", merge)
+    output = tmp_path / f"{name}.json"
+    monkeypatch.setattr(sys, "argv", [
+        "run_mass_simulation.py", "--games", "400", "--chunk-size", "100", "--workers", "2",
+        "--max-in-flight", "2", "--worker-state", "reload", "--seed", "7",
+        "--progress-interval", "0", "--output", str(output),
+    ])
+    rms.main()
+    summary = json.loads(output.read_text(encoding="utf-8"))["summary"]
+    return summary, merged, window["peak"]
+
+
+def test_parallel_runs_merge_in_task_order_and_cap_parked_results(monkeypatch, tmp_path):
+    first, first_order, first_peak = _run_main(monkeypatch, tmp_path, "first", slow_task=0)
+    monkeypatch.undo()
+    second, second_order, second_peak = _run_main(monkeypatch, tmp_path, "second", slow_task=3)
+
+    assert first_order == second_order == list(range(8))
+    assert first == second
+    # Results finished behind the stalled task still count against --max-in-flight.
+    assert first_peak <= 2 and second_peak <= 2
@@ -0,0 +1,218 @@
+import random
+from statistics import NormalDist
+
+import numpy as np
+import pytest
+
+from validation import run_mass_simulation as rms
+
+
+def _codes(*names):
+    return np.array([rms.COMPOSITION_CODES[name] for name in names], dtype=np.int8)
+
+
+def test_merged_worker_stats_match_single_pass_and_summarize():
+    blue = _codes("dive", "dive", "poke", "mixed")
+    red = _codes("poke", "poke", "dive", "dive")
+    blue_probs = np.array([0.7, 0.4, 0.55, 0.3])
+    confidences = np.array([0.4, 0.2, 0.1, 0.4])
+
+    single = rms._create_empty_stats()
+    rms._accumulate_batch(single, blue, red, blue_probs, 1 - blue_probs, confidences)
+
+    merged = rms._create_empty_stats()
+    for part in (slice(0, 2), slice(2, 4)):
+        worker = rms._create_empty_stats()
+        rms._accumulate_batch(worker, blue[part], red[part], blue_probs[part], 1 - blue_probs[part], confidences[part])
+        rms._merge_stats(merged, worker)
+
+    assert merged["total_games"] == single["total_games"] == 4
+    for key in rms.MATCHUP_STAT_KEYS:
+        assert np.allclose(merged["matchups"][key], single["matchups"][key])
+
+    summary = rms.summarize(merged, top_k=5, confidence=0.95)
+    dive_vs_poke = summary["raw_matchups"]["dive__vs__poke"]
+    assert dive_vs_poke["games"] == 2
+    assert dive_vs_poke["avg_blue_win_prob"] == pytest.approx(0.55)
+    assert dive_vs_poke["favored_blue"] == 1 and dive_vs_poke["favored_red"] == 1
+    # dive appears as blue twice and as red twice (red win probs 0.45 and 0.7).
+    dive_total = summary["raw_compositions"]["dive"]
+    assert dive_total["games"] == 4
+    assert dive_total["avg_blue_probability"] == pytest.approx((0.7 + 0.4 + 0.45 + 0.7) / 4)
+
+
+def test_vectorized_composition_codes_match_per_team_classifier():
+    champion_data = {"assignments": {
+        "Vi": {"primary_archetype": "diver", "attributes": ["range_melee"]},
+        "Zed": {"primary_archetype": "assassin", "attributes": ["range_melee"]},
+        "Xerath": {"primary_archetype": "artillery_mage", "attributes": ["range_long"]},
+        "Jinx": {"primary_archetype": "marksman", "attributes": ["range_long"]},
+        "Leona": {"primary_archetype": "tank", "attributes": ["range_melee"]},
+        "Lulu": {"primary_archetype": "enchanter", "attributes": ["range_medium"]},
+        "Darius": {"primary_archetype": "juggernaut", "attributes": ["range_melee"]},
+        "Fiora": {"primary_archetype": "skirmisher", "attributes": ["range_melee"]},
+    }}
+    names = list(champion_data["assignments"])
+    teams = [
+        ["Vi", "Zed", "Jinx"],
+        ["Xerath", "Jinx", "Leona"],
+        ["Leona", "Jinx", "Lulu"],
+        ["Darius", "Fiora", "Lulu"],
+        ["Vi", "Darius", "Lulu"],
+    ]
+    flag_table = rms.build_composition_flag_table(names, champion_data)
+    indices = np.array([[names.index(name) for name in team] for team in teams])
+
+    codes = rms.classify_compositions(flag_table, indices)
+
+    expected = [rms._infer_composition_type(team, champion_data) for team in teams]
+    assert [rms.COMPOSITION_TYPES[code] for code in codes] == expected
+    assert expected == ["dive", "poke", "protect_the_carry", "bruiser", "mixed"]
+
+
+def test_trainer_batches_match_per_game_feature_diffs(tmp_path):
+    from backend.tests.test_feature_matrix import CHAMP_DATA
+    from validation.ml_simulation import extract_features_from_team, features_to_vector
+
+    names = list(CHAMP_DATA["assignments"])
+    blue_teams = [names[:5], names[5:]]
+    red_teams = [names[5:], names[:5]]
+    feature_names = sorted(set().union(*(
+        extract_features_from_team(rms.team_list_to_position_dict(team), CHAMP_DATA) for team in blue_teams
+    )))
+    trainer = rms.SimulationTrainer(CHAMP_DATA, feature_names, 1.0, tmp_path / "model.pkl", None, random.Random(0))
+
+    def _vector(team):
+        return features_to_vector(extract_features_from_team(rms.team_list_to_position_dict(team), CHAMP_DATA), feature_names)
+
+    expected = np.array([np.subtract(_vector(b), _vector(r)) for b, r in zip(blue_teams, red_teams)])
+    blue = trainer.diff_builder.champion_indices(blue_teams)
+    red = trainer.diff_builder.champion_indices(red_teams)
+    assert np.array_equal(trainer.feature_diffs(blue, red, trainer.diff_builder.champion_names), expected)
+
+    trainer.process_batch(blue, red, np.array([0.8, 0.2]), trainer.diff_builder.champion_names)
+    report = trainer.get_partial_report()
+    assert report["samples"] == 2
+    assert report["avg_ensemble_prob"] == pytest.approx(0.5)
+
+
+def test_resume_state_round_trips_accumulators_and_trainer(tmp_path):
+    from backend.tests.test_feature_matrix import CHAMP_DATA
+
+    stats = rms._create_empty_stats()
+    rms._accumulate_batch(stats, _codes("dive", "poke"), _codes("mixed", "dive"), np.array([0.6, 0.3]), np.array([0.4, 0.7]), np.array([0.2, 0.4]))
+    trainer = rms.SimulationTrainer(CHAMP_DATA, ["attr_cc_hard"], 1.0, tmp_path / "model.pkl", None, random.Random(0))
+    trainer.fit_batch(np.array([[0.2], [-0.4]]), np.array([0.6, 0.3]))
+    path = tmp_path / "state.npz"
+
+    rms.save_resume_state(path, stats, {"next_task": 3}, trainer.get_state())
+    loaded, meta, trainer_state = rms.load_resume_state(path)
+
+    assert meta == {"next_task": 3}
+    assert loaded["total_games"] == 2
+    assert loaded["blue_win_prob_sq_sum"] == stats["blue_win_prob_sq_sum"]
+    for key in rms.MATCHUP_STAT_KEYS:
+        assert np.array_equal(loaded["matchups"][key], stats["matchups"][key])
+    resumed = rms.SimulationTrainer(CHAMP_DATA, ["attr_cc_hard"], 1.0, tmp_path / "model.pkl", None, random.Random(9))
+    resumed.load_state(trainer_state)
+    assert np.array_equal(resumed.np_rng.random(4), trainer.np_rng.random(4))
+    assert np.array_equal(resumed.model.coef_, trainer.model.coef_)
+
+
+def test_antithetic_pairs_are_single_units_for_variance():
+    # Two drafts, each scored blue-vs-red then with sides swapped.
+    blue_codes = _codes("dive", "poke", "mixed", "dive")
+    red_codes = _codes("mixed", "dive", "dive", "poke")
+    blue_probs = np.array([0.7, 0.4, 0.35, 0.62])
+    stats = rms._create_empty_stats()
+    rms._accumulate_units(stats, blue_codes, red_codes, blue_probs, 1 - blue_probs, antithetic=True)
+
+    strata = stats["strata"]
+    assert strata["units"].sum() == 2
+    dive_mixed = (rms.COMPOSITION_CODES["dive"], rms.COMPOSITION_CODES["mixed"])
+    assert strata["unit_sum"][dive_mixed] == pytest.approx((0.7 + 0.35) / 2)
+    # Team-level units average each team's blue and red appearances.
+    dive = rms.COMPOSITION_CODES["dive"]
+    assert stats["team_units"]["units"][dive] == 2
+    assert stats["team_units"]["unit_sum"][dive] == pytest.approx((0.7 + 0.65) / 2 + (0.6 + 0.62) / 2)
+
+    mean, margin = rms._overall_mean_and_margin(stats, 0.95, {"antithetic": True})
+    assert mean == pytest.approx(blue_probs.mean())
+    assert margin is not None
+
+
+def test_stratified_estimator_reduces_to_pooled_for_one_stratum():
+    values = np.array([0.2, 0.5, 0.9, 0.4])
+    units = np.array([[4, 0], [0, 0]])
+    unit_sum = np.array([[values.sum(), 0.0], [0.0, 0.0]])
+    unit_sq_sum = np.array([[np.square(values).sum(), 0.0], [0.0, 0.0]])
+    weights = np.array([[0.7, 0.1], [0.1, 0.1]])
+
+    stratified = rms._stratified_mean_and_margin(units, unit_sum, unit_sq_sum, weights, 0.95)
+    pooled = rms._compute_mean_and_margin(values.sum(), np.square(values).sum(), 4, 0.95)
+    assert stratified == pytest.approx(pooled)
+
+
+def test_adaptive_allocation_targets_cells_short_of_margin():
+    stats = rms._create_empty_stats()
+    population = np.full((len(rms.COMPOSITION_TYPES),) * 2, 1 / len(rms.COMPOSITION_TYPES) ** 2)
+    # Every cell gets 400 games; dive-vs-poke is noisy, the rest are nearly constant.
+    generator = np.random.default_rng(3)
+    for blue, red in np.ndindex(population.shape):
+        noisy = (blue, red) == (rms.COMPOSITION_CODES["dive"], rms.COMPOSITION_CODES["poke"])
+        probs = 0.5 + generator.normal(0, 0.2 if noisy else 0.001, 400)
+        codes = np.full(400, blue, dtype=np.int8), np.full(400, red, dtype=np.int8)
+        rms._accumulate_batch(stats, *codes, probs, 1 - probs, np.abs(probs - 0.5))
+
+    margins = rms._cell_blue_margins(stats, 0.95)
+    summary = rms.summarize(stats, top_k=5, confidence=0.95)
+    assert margins[0, 1] == pytest.approx(summary["raw_matchups"]["dive__vs__poke"]["blue_ci_half_width"])
+
+    allocation = rms._adaptive_allocation(stats, 0.95, 0.01, population)
+    assert allocation[0, 1] == pytest.approx(1.0)
+    assert np.array_equal(rms._adaptive_allocation(stats, 0.95, 0.05, population), population)
+
+
+def test_skewed_allocation_reports_population_weighted_compositions():
+    comp_count = len(rms.COMPOSITION_TYPES)
+    frequencies = np.array([0.1, 0.15, 0.2, 0.4, 0.15])
+    population = np.outer(frequencies, frequencies)
+    # Allocation heavily oversamples cells with a bruiser in them.
+    bruiser = rms.COMPOSITION_CODES["bruiser"]
+    generator = np.random.default_rng(5)
+    stats = rms._create_empty_stats()
+    cells = {}
+    for blue, red in np.ndindex(comp_count, comp_count):
+        games = 600 if bruiser in (blue, red) else 30
+        probs = np.clip(0.3 + 0.1 * blue - 0.05 * red + generator.normal(0, 0.05, games), 0.01, 0.99)
+        conf = np.abs(probs - 0.5) + 0.1 * blue
+        codes = np.full(games, blue, dtype=np.int8), np.full(games, red, dtype=np.int8)
+        rms._accumulate_batch(stats, *codes, probs, 1 - probs, conf)
+        rms._accumulate_units(stats, *codes, probs, 1 - probs)
+        cells[blue, red] = (probs, conf)
+
+    summary = rms.summarize(stats, top_k=5, confidence=0.95, design={"antithetic": False, "strata_weights": population})
+
+    z = NormalDist().inv_cdf(0.975)
+    for code, comp in enumerate(rms.COMPOSITION_TYPES):
+        # Blue-side cells (code, r) and red-side cells (b, code); a mirror game is one unit.
+        strata = []
+        for other in range(comp_count):
+            if other == code:
+                strata.append((2 * population[code, code], (cells[code, code][0] + 1 - cells[code, code][0]) / 2))
+            else:
+                strata.append((population[code, other], cells[code, other][0]))
+                strata.append((population[other, code], 1 - cells[other, code][0]))
+        total_weight = sum(weight for weight, _ in strata)
+        mean = sum(weight * values.mean() for weight, values in strata) / total_weight
+        variance = sum((weight / total_weight) ** 2 * values.var(ddof=1) / values.size for weight, values in strata)
+        reported = summary["raw_compositions"][comp]
+        assert reported["avg_blue_probability"] == pytest.approx(mean)
+        assert reported["ci_half_width"] == pytest.approx(z * np.sqrt(variance))
+        assert reported["games"] == round(stats["total_games"] * 2 * frequencies[code])
+
+    raw = stats["composition_totals"]
+    raw_bruiser = raw["blue_prob_sum"][bruiser] / raw["games"][bruiser]
+    assert abs(summary["raw_compositions"]["bruiser"]["avg_blue_probability"] - raw_bruiser) > 0.002
+    expected_confidence = sum(population[cell] * conf.mean() for cell, (_, conf) in cells.items())
+    assert summary["overall"]["avg_confidence"] == pytest.approx(expected_confidence)
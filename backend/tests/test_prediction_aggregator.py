@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from validation.ml_simulation import PredictionAggregator
+
+
+def _game(row, blue_prob):
+    return {
+        "game_id": row + 1,
+        "prediction": {
+            "ensemble_prediction": "blue" if blue_prob >= 0.5 else "red",
+            "blue_probability": blue_prob,
+            "red_probability": 1 - blue_prob,
+        },
+    }
+
+
+def test_block_add_keeps_same_games_as_per_game_add():
+    blue_probs = np.random.default_rng(4).uniform(0.2, 0.8, 500)
+    per_game = PredictionAggregator(sample_limit=30, extremes_limit=5)
+    for row, prob in enumerate(blue_probs):
+        per_game.add_game(_game(row, float(prob)))
+
+    built = []
+
+    def materialize(record):
+        built.append(record["row"])
+        return _game(record["row"], record["blue_probability"])
+
+    blocked = PredictionAggregator(sample_limit=30, extremes_limit=5, materialize=materialize)
+    for start in range(0, 500, 128):
+        probs = blue_probs[start:start + 128]
+        blocked.add_block(probs, probs >= 0.5, lambda row, start=start: {"row": start + row, "blue_probability": float(probs[row])})
+
+    # Workers export lightweight records; only the final cut is expanded.
+    assert all("prediction" not in record for record in blocked.export_state()["samples"])
+    expected, actual = per_game.finalize(), blocked.finalize()
+    for key in ("samples", "most_confident_blue", "most_confident_red", "closest_games"):
+        assert [g["game_id"] for g in actual[key]] == [g["game_id"] for g in expected[key]]
+    assert actual["blue_wins_predicted"] == expected["blue_wins_predicted"]
+    assert actual["confidence_distribution"] == expected["confidence_distribution"]
+    assert actual["average_confidence"] == pytest.approx(expected["average_confidence"])
+    assert len(built) == len(set(built)) <= 30 + 3 * 5
@@ -0,0 +1,50 @@
+from backend import draft_api
+from backend import response_cache as cache_module
+from backend.response_cache import ResponseCache
+
+
+def test_lru_eviction_and_hit_rate():
+    cache = ResponseCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == round(2 / 3, 4)
+
+
+def test_entries_expire_and_clear_records_invalidation(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: clock[0])
+    cache = ResponseCache(max_entries=4, ttl_seconds=10)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    clock[0] += 11
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+    cache.clear("simulation_tables")
+    stats = cache.stats()
+    assert stats["entries"] == 0
+    assert stats["invalidations"] == 1
+    assert stats["last_invalidation_reason"] == "simulation_tables"
+
+
+def test_draft_cache_key_ignores_ban_order():
+    first = draft_api.RecommendationRequest(draft_state=draft_api.DraftState(
+        blue_picks=["Jinx"], blue_roles=["BOTTOM"], blue_bans=["Zed", "Yasuo"], next_pick="red"
+    ))
+    second = draft_api.RecommendationRequest(draft_state=draft_api.DraftState(
+        blue_picks=["Jinx"], blue_roles=["BOTTOM"], blue_bans=["Yasuo", "Zed"], next_pick="red"
+    ))
+    other_limit = first.copy(update={"limit": 10})
+
+    assert draft_api._recommend_cache_key(first) == draft_api._recommend_cache_key(second)
+    assert draft_api._recommend_cache_key(first) != draft_api._recommend_cache_key(other_limit)
@@ -0,0 +1,45 @@
+import pickle
+
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+
+from validation import ml_simulation
+from validation import run_mass_simulation as rms
+from validation.ensemble_prediction import EnsemblePredictor
+from validation.sampling_utils import build_role_pools_indices, sample_team_indices
+
+from backend.tests.test_feature_matrix import CHAMP_DATA, LANES, MATCHUP_STATS
+
+
+def test_workers_attach_exported_tables_without_rebuilding(tmp_path, monkeypatch):
+    monkeypatch.setattr(ml_simulation, "_MATCHUP_CACHE_DIR", tmp_path / "lookup")
+    names = list(CHAMP_DATA["assignments"])
+    role_pools = {role: names[i:i + 4] for i, role in enumerate(rms.ROLE_ORDER)}
+    role_arrays, idx_to_champion = build_role_pools_indices(role_pools, rms.ROLE_ORDER)
+    feature_names = ["lane_advantage_middle", "duo_synergy_delta_bottom_support", "team_attr_cc_hard"]
+
+    rng = np.random.default_rng(0)
+    model = LogisticRegression().fit(rng.normal(size=(40, 3)), np.arange(40) % 2)
+    models_path = tmp_path / "models.pkl"
+    with open(models_path, "wb") as f:
+        pickle.dump({"models": {"logistic": model}, "feature_names": feature_names}, f)
+    predictor = EnsemblePredictor({"logistic": model}, feature_names, CHAMP_DATA, {}, {}, MATCHUP_STATS, logit_shift=0.1)
+    builder = ml_simulation.TeamFeatureMatrixBuilder(idx_to_champion, LANES, CHAMP_DATA, MATCHUP_STATS, feature_names)
+    flags = rms.build_composition_flag_table(idx_to_champion, CHAMP_DATA)
+
+    shared_dir = tmp_path / "shared"
+    shared_dir.mkdir()
+    training_builder = rms.build_training_diff_builder(idx_to_champion, CHAMP_DATA, ["attr_cc_hard", "range_range_melee"])
+    rms.export_shared_worker_state(
+        shared_dir, predictor, str(models_path), role_arrays, idx_to_champion, builder, flags, training_builder
+    )
+    state = rms.attach_shared_worker_state(shared_dir)
+
+    assert isinstance(state["composition_flags"], np.memmap)
+    assert isinstance(state["feature_builder"].shared_counts, np.memmap)
+    blue, red = sample_team_indices(np.random.default_rng(1), role_arrays, rms.ROLE_ORDER, 64)
+    expected = builder.build(blue, red)
+    assert np.array_equal(state["feature_builder"].build(blue, red), expected)
+    for ours, theirs in zip(state["predictor"].batch_predict_from_vectors(expected), predictor.batch_predict_from_vectors(expected)):
+        assert np.array_equal(ours, theirs)
+    assert np.array_equal(state["training_builder"].build(blue, red), training_builder.build(blue, red))
@@ -0,0 +1,48 @@
+import json
+
+import numpy as np
+
+from validation.simulation_io import load_simulation_payload, write_simulation_payload
+
+
+def test_npz_payload_round_trips_tables_and_irregular_fields(tmp_path):
+    samples = [
+        {
+            "game_id": game_id,
+            "blue_team": {"Top": "Fiora", "Support": "Nami" if game_id % 2 else "Lulu"},
+            "prediction": {
+                "blue_probability": 0.25 * game_id,
+                "ensemble_prediction": None if game_id == 2 else "blue",
+                "feature_breakdown": {"duo": {"blue_champions": ["Fiora", "Nami"]}} if game_id == 1 else {},
+            },
+        }
+        for game_id in (1, 2, 3)
+    ]
+    payload = {
+        "metadata": {"games": 3, "target_margin": None, "interrupted": False},
+        "analysis": {
+            "samples": samples,
+            "raw_matchups": {
+                "dive__vs__poke": {"blue_comp": "dive", "red_comp": "poke", "games": 2, "blue_ci_half_width": None},
+                "poke__vs__dive": {"blue_comp": "poke", "red_comp": "dive", "games": 1, "blue_ci_half_width": 0.1},
+            },
+            "closest_games": [],
+        },
+    }
+    path = tmp_path / "summary.npz"
+
+    write_simulation_payload(path, payload)
+
+    assert load_simulation_payload(path) == payload
+    with np.load(path) as arrays:
+        header = json.loads(arrays["header"].tobytes())
+    assert [table["kind"] for table in header["tables"]] == ["list", "dict"]
+
+
+def test_save_checkpoint_writes_to_requested_directory(tmp_path):
+    from validation.ml_simulation import save_checkpoint
+
+    save_checkpoint({"total_games": 5}, 5, 10, 0, 0, checkpoint_dir=tmp_path / "scratch")
+
+    written = tmp_path / "scratch" / "simulation_checkpoint_0000005.json"
+    assert json.loads(written.read_text(encoding="utf-8"))["analysis"] == {"total_games": 5}
@@ -0,0 +1,49 @@
+import json
+import os
+
+from fastapi.testclient import TestClient
+
+from backend import draft_api
+
+
+def _write_summary(path, blue_prob):
+    summary = {
+        "metadata": {"games": 1000},
+        "analysis": {
+            "raw_matchups": {
+                "dive__vs__poke": {"blue_comp": "dive", "red_comp": "poke", "games": 40, "avg_blue_win_prob": blue_prob},
+            },
+        },
+    }
+    path.write_text(json.dumps(summary), encoding="utf-8")
+
+
+def test_summary_served_from_snapshot_with_etag_and_hot_reload(tmp_path, monkeypatch):
+    summary_path = tmp_path / "mass_simulation_summary.json"
+    _write_summary(summary_path, 0.55)
+    monkeypatch.setattr(draft_api, "SIMULATION_SUMMARY_PATH", summary_path)
+    monkeypatch.setattr(draft_api, "simulation_summary_snapshot", None)
+    monkeypatch.setattr(draft_api, "simulation_matchup_table", {})
+    client = TestClient(draft_api.app)
+
+    first = client.get("/simulations/summary")
+    assert first.status_code == 200
+    assert first.json()["metadata"]["total_games"] == 1000
+    etag = first.headers["etag"]
+
+    loads = []
+    real_load = draft_api.load_simulation_payload
+    monkeypatch.setattr(draft_api, "load_simulation_payload", lambda path: loads.append(path) or real_load(path))
+    cached = client.get("/simulations/summary", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert loads == []
+
+    _write_summary(summary_path, 0.6)
+    stat = summary_path.stat()
+    os.utime(summary_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    reloaded = client.get("/simulations/summary", headers={"If-None-Match": etag})
+    assert reloaded.status_code == 200
+    assert reloaded.headers["etag"] != etag
+    assert loads == [summary_path]
+    assert draft_api.simulation_matchup_table[("dive", "poke")]["avg_blue_win_prob"] == 0.6
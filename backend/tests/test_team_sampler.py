@@ -0,0 +1,33 @@
+import numpy as np
+
+from validation.sampling_utils import sample_team_indices
+
+
+def test_sampled_teams_respect_pools_without_repeats():
+    role_arrays = {
+        "TOP": np.array([0, 1, 2], dtype=np.int32),
+        "JUNGLE": np.array([1, 2, 3], dtype=np.int32),
+        "MIDDLE": np.array([2, 3, 4], dtype=np.int32),
+    }
+    order = ["TOP", "JUNGLE", "MIDDLE"]
+
+    blue, red = sample_team_indices(np.random.default_rng(5), role_arrays, order, 5000)
+
+    assert blue.shape == red.shape == (5000, 3)
+    for teams in (blue, red):
+        assert all(len(set(row)) == 3 for row in teams.tolist())
+        for column, role in enumerate(order):
+            assert np.isin(teams[:, column], role_arrays[role]).all()
+
+
+def test_collision_redraws_match_sequential_exclusion():
+    role_arrays = {"A": np.array([0, 1]), "B": np.array([0, 1, 2])}
+
+    blue, _ = sample_team_indices(np.random.default_rng(11), role_arrays, ["A", "B"], 40000)
+
+    # Sequential sampling gives B uniform over the two champions A didn't take.
+    for first in (0, 1):
+        rows = blue[blue[:, 0] == first]
+        counts = np.bincount(rows[:, 1], minlength=3) / len(rows)
+        assert counts[first] == 0
+        assert np.allclose(np.delete(counts, first), 0.5, atol=0.02)
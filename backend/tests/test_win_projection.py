@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+from scipy import sparse
+
+from backend import draft_api
+from validation.ensemble_prediction import PredictionResult
+
+
+class StubPredictor:
+    """Deterministic stand-in exposing the EnsemblePredictor inference surface."""
+
+    def __init__(self):
+        self.batch_calls = 0
+
+    def build_feature_dict(self, blue_team, blue_roles, red_team, red_roles, *, include_feature_breakdown=True):
+        return {"size": float(len(blue_team) - len(red_team)), "name": float(len(blue_team[0]))}, None
+
+    def build_feature_vector(self, blue_team, blue_roles, red_team, red_roles, *, include_feature_breakdown=True):
+        features, _ = self.build_feature_dict(blue_team, blue_roles, red_team, red_roles)
+        return [features["size"], features["name"]], None
+
+    def build_sparse_feature_matrix(self, feature_dicts):
+        return sparse.csr_matrix([[features["size"], features["name"]] for features in feature_dicts])
+
+    @staticmethod
+    def _probability(vector):
+        return 1.0 / (1.0 + np.exp(-(0.3 * vector[0] + 0.01 * vector[1])))
+
+    def predict(self, blue_team, blue_roles, red_team, red_roles, **kwargs):
+        vector, _ = self.build_feature_vector(blue_team, blue_roles, red_team, red_roles)
+        prob = float(self._probability(vector))
+        return PredictionResult(
+            winner="blue" if prob > 0.5 else "red",
+            confidence=abs(prob - 0.5) * 2,
+            blue_win_probability=prob,
+            red_win_probability=1 - prob,
+            model_breakdown={},
+            reasoning=["stub"],
+        )
+
+    def batch_predict_from_vectors(self, feature_vectors):
+        self.batch_calls += 1
+        matrix = feature_vectors.toarray() if sparse.issparse(feature_vectors) else np.asarray(feature_vectors, dtype=float)
+        probs = np.array([self._probability(row) for row in matrix])
+        return probs, 1.0 - probs, np.abs(probs - 0.5) * 2
+
+
+@pytest.fixture
+def stub_predictor(monkeypatch):
+    stub = StubPredictor()
+    monkeypatch.setattr(draft_api, "predictor", stub)
+    monkeypatch.setattr(draft_api, "simulation_model", None)
+    return stub
+
+
+def test_batched_projection_matches_single_projection(stub_predictor):
+    draft = draft_api.DraftState(
+        blue_picks=["Jinx", "Leona"],
+        blue_roles=["BOTTOM", "UTILITY"],
+        red_picks=["Zed", "Ornn", "Vi"],
+        red_roles=["MIDDLE", "TOP", "JUNGLE"],
+        next_pick="blue",
+    )
+    candidates = [
+        ("blue", "Orianna", "MIDDLE"),
+        ("blue", "Sejuani", None),
+        ("red", "Caitlyn", "BOTTOM"),
+    ]
+
+    batched = draft_api._project_pick_win_probabilities(draft, candidates)
+
+    assert stub_predictor.batch_calls == 1
+    for (team, champion, role), projection in zip(candidates, batched):
+        single = draft_api._predict_blue_win_probability(
+            *draft_api._build_pick_projection_draft(draft, team, champion, role)
+        )
+        assert projection["blue"] == pytest.approx(single["blue"])
+        assert projection["confidence"] == pytest.approx(single["confidence"])
+        assert projection["favored"] == single["favored"]
+
+
+def test_batched_projection_keeps_early_draft_fallbacks(stub_predictor):
+    blind = draft_api.DraftState(next_pick="blue")
+    full = draft_api.DraftState(
+        blue_picks=["Aatrox", "Vi", "Ahri", "Jinx", "Leona"],
+        next_pick="red",
+    )
+
+    assert draft_api._project_pick_win_probabilities(blind, [("blue", "Jinx", None)]) == [
+        {"blue": 0.5, "red": 0.5}
+    ]
+    early = draft_api._project_pick_win_probabilities(full, [("blue", "Ornn", None), ("red", "Ornn", None)])
+    assert early[0] is None
+    assert early[1]["blue"] == pytest.approx(0.5)
+    assert stub_predictor.batch_calls == 0
+
+
+def test_key_champions_score_all_swaps_in_one_batch(stub_predictor):
+    # The stub favors blue by the length of blue's first pick, so swapping
+    # Mordekaiser for the placeholder is the only swap that moves the odds.
+    blue_team = ["Mordekaiser", "Vi", "Ahri", "Jinx", "Leona"]
+    red_team = ["Ornn", "Sejuani", "Orianna", "Caitlyn", "Lulu"]
+    roles = ["TOP", "JUNGLE", "MIDDLE", "BOTTOM", "UTILITY"]
+    base = draft_api._predict_blue_win_probability(blue_team, roles, red_team, roles)
+    swapped, swapped_roles, _ = draft_api._swap_champion_for_impact(blue_team, roles, 0)
+    alt = draft_api._predict_blue_win_probability(swapped, swapped_roles, red_team, roles)
+    stub_predictor.batch_calls = 0
+
+    result = draft_api._identify_key_champions(blue_team, roles, red_team, roles, base)
+
+    assert stub_predictor.batch_calls == 1
+    assert base["favored"] == "blue"
+    assert result["favored_playmaker"]["champion"] == "Mordekaiser"
+    assert result["favored_playmaker"]["impact"] == pytest.approx(base["blue"] - alt["blue"])
+    assert "underdog_threat" not in result
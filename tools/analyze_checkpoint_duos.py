@@ -2,10 +2,17 @@
 
 import argparse
 import json
+import sys
 from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from validation.simulation_io import load_simulation_payload
+
 ROLE_ORDER = ["Top", "Jungle", "Middle", "Bottom", "Support"]
 DUO_SYNERGY_PAIRS: List[Tuple[str, str]] = [
     ("Top", "Jungle"),
@@ -30,7 +37,7 @@ def _duo_entry(duo_stats: Dict, pair_key: str, champs: Tuple[str, str]) -> Dict:
 
 
 def analyze_checkpoint(checkpoint_path: Path, stats_path: Path, top_n: int) -> Dict:
-    checkpoint = _load_json(checkpoint_path)
+    checkpoint = load_simulation_payload(checkpoint_path)
     stats = _load_json(stats_path)
     lane_stats = stats.get("lane_matchups", {})
     duo_stats = stats.get("duo_matchups", {})
@@ -113,7 +120,7 @@ def analyze_checkpoint(checkpoint_path: Path, stats_path: Path, top_n: int) -> D
 
 def main():
     parser = argparse.ArgumentParser(description="Analyze checkpoint samples for red-leaning matchups")
-    parser.add_argument("--checkpoint", default="data/simulations/checkpoints/simulation_checkpoint_1000000.json", help="Checkpoint JSON to inspect")
+    parser.add_argument("--checkpoint", default="data/simulations/checkpoints/simulation_checkpoint_1000000.json", help="Checkpoint (.json or .npz) to inspect")
     parser.add_argument("--stats", default="data/matches/lane_duo_stats.json", help="Lane/duo stats JSON path")
     parser.add_argument("--top", type=int, default=10, help="Number of entries to display per category")
     parser.add_argument("--output", help="Optional path to dump the structured summary as JSON")
@@ -0,0 +1,205 @@
+"""Flat-array inference for the ensemble's trained sklearn models.
+
+`predict_proba` on sklearn estimators spends most of its time validating input
+and dispatching per tree, which dominates single-draft and small-batch calls.
+The compiled models here keep only coefficient vectors and packed tree node
+arrays and evaluate them with vectorized NumPy, matching sklearn's outputs to
+floating-point rounding. Dense arrays and scipy CSR matrices are both accepted.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from scipy import sparse
+
+FLOAT32_EPS = float(np.finfo(np.float32).eps)
+# Above these batch sizes sklearn's Cython tree walk beats NumPy traversal, so
+# compiled tree ensembles hand large batches back to the original estimator.
+FOREST_FALLBACK_ROWS = 1024
+BOOSTING_FALLBACK_ROWS = 256
+
+
+def _expit(values: np.ndarray) -> np.ndarray:
+    out = np.empty_like(values)
+    positive = values >= 0
+    out[positive] = 1.0 / (1.0 + np.exp(-values[positive]))
+    exp_values = np.exp(values[~positive])
+    out[~positive] = exp_values / (1.0 + exp_values)
+    return out
+
+
+def _as_matrix(X: Any) -> Any:
+    if sparse.issparse(X):
+        return sparse.csr_matrix(X, dtype=np.float64)
+    matrix = np.asarray(X, dtype=np.float64)
+    if matrix.ndim == 1:
+        matrix = matrix[None, :]
+    return matrix
+
+
+def _binary_proba(blue: np.ndarray) -> np.ndarray:
+    return np.column_stack([1.0 - blue, blue])
+
+
+class CompiledLogisticRegression:
+    """Binary logistic regression as one coefficient vector."""
+
+    def __init__(self, coef: np.ndarray, intercept: float, classes: np.ndarray) -> None:
+        self.coef = np.ascontiguousarray(coef, dtype=np.float64)
+        self.intercept = float(intercept)
+        self.classes_ = classes
+
+    @classmethod
+    def from_sklearn(cls, model: Any) -> "CompiledLogisticRegression":
+        return cls(model.coef_[0], model.intercept_[0], model.classes_)
+
+    def predict_proba(self, X: Any) -> np.ndarray:
+        return _binary_proba(_expit(np.asarray(_as_matrix(X) @ self.coef) + self.intercept))
+
+
+class CompiledTreeEnsemble:
+    """Trees packed into flat node arrays and traversed for all rows and trees at once.
+
+    Leaves point to themselves, so every row reaches its leaf after `max_depth`
+    steps. Random forests average per-tree class-1 fractions; gradient boosting
+    sums scaled leaf values on top of the prior log-odds and applies a sigmoid.
+    Batches larger than `fallback_rows` go to `fallback` (the sklearn model).
+    """
+
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        leaf_value: np.ndarray,
+        roots: np.ndarray,
+        max_depth: int,
+        classes: np.ndarray,
+        kind: str,
+        scale: float = 1.0,
+        offset: float = 0.0,
+        fallback: Optional[Any] = None,
+        fallback_rows: int = 0
+    ) -> None:
+        self.feature = feature
+        self.threshold = threshold
+        # children[2 * node + went_right] is the next node.
+        self.children = np.column_stack([left, right]).ravel()
+        self.leaf_value = leaf_value
+        self.roots = roots
+        self.max_depth = max_depth
+        self.classes_ = classes
+        self.kind = kind
+        self.scale = scale
+        self.offset = offset
+        self.fallback = fallback
+        self.fallback_rows = fallback_rows
+
+    @classmethod
+    def _pack(cls, trees: List[Any], leaf_values: List[np.ndarray], classes: np.ndarray, kind: str, **kwargs: Any) -> "CompiledTreeEnsemble":
+        features, thresholds, lefts, rights, roots = [], [], [], [], []
+        base = 0
+        max_depth = 0
+        for tree in trees:
+            nodes = np.arange(tree.node_count)
+            leaf = tree.children_left < 0
+            lefts.append(np.where(leaf, nodes, tree.children_left) + base)
+            rights.append(np.where(leaf, nodes, tree.children_right) + base)
+            features.append(np.where(leaf, 0, tree.feature))
+            thresholds.append(tree.threshold)
+            roots.append(base)
+            base += tree.node_count
+            max_depth = max(max_depth, tree.max_depth)
+        return cls(
+            np.concatenate(features).astype(np.intp),
+            np.concatenate(thresholds).astype(np.float64),
+            np.concatenate(lefts).astype(np.intp),
+            np.concatenate(rights).astype(np.intp),
+            np.concatenate(leaf_values).astype(np.float64),
+            np.array(roots, dtype=np.intp),
+            max_depth,
+            classes,
+            kind,
+            **kwargs
+        )
+
+    @classmethod
+    def from_random_forest(cls, model: Any) -> "CompiledTreeEnsemble":
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        values = []
+        for tree in trees:
+            counts = tree.value[:, 0, :]
+            values.append(counts[:, 1] / counts.sum(axis=1))
+        return cls._pack(trees, values, model.classes_, "forest", fallback=model, fallback_rows=FOREST_FALLBACK_ROWS)
+
+    @classmethod
+    def from_gradient_boosting(cls, model: Any) -> "CompiledTreeEnsemble":
+        trees = [estimator.tree_ for estimator in model.estimators_[:, 0]]
+        values = [tree.value[:, 0, 0] for tree in trees]
+        offset = 0.0
+        if model.init_ != "zero":
+            prior = float(model.init_.predict_proba(np.zeros((1, model.n_features_in_)))[0, 1])
+            prior = min(max(prior, FLOAT32_EPS), 1 - FLOAT32_EPS)
+            offset = float(np.log(prior / (1 - prior)))
+        return cls._pack(
+            trees,
+            values,
+            model.classes_,
+            "boosting",
+            scale=float(model.learning_rate),
+            offset=offset,
+            fallback=model,
+            fallback_rows=BOOSTING_FALLBACK_ROWS
+        )
+
+    def leaf_values(self, X: Any) -> np.ndarray:
+        """(N, n_trees) value of the leaf each row reaches in each tree."""
+        matrix = _as_matrix(X)
+        if sparse.issparse(matrix):
+            matrix = matrix.toarray()
+        # sklearn trees compare float32 inputs against float64 thresholds.
+        matrix = matrix.astype(np.float32)
+        flat = matrix.ravel()
+        row_starts = (np.arange(matrix.shape[0]) * matrix.shape[1])[:, None]
+        nodes = np.broadcast_to(self.roots, (matrix.shape[0], self.roots.size))
+        for _ in range(self.max_depth):
+            went_right = ~(flat[row_starts + self.feature[nodes]] <= self.threshold[nodes])
+            nodes = self.children[2 * nodes + went_right]
+        return self.leaf_value[nodes]
+
+    def predict_proba(self, X: Any) -> np.ndarray:
+        matrix = _as_matrix(X)
+        if self.fallback is not None and matrix.shape[0] > self.fallback_rows:
+            # sklearn walks CSR input natively, without densifying the batch.
+            return self.fallback.predict_proba(matrix)
+        values = self.leaf_values(matrix)
+        if self.kind == "forest":
+            return _binary_proba(values.mean(axis=1))
+        return _binary_proba(_expit(self.offset + self.scale * values.sum(axis=1)))
+
+
+def compile_model(model: Any) -> Optional[Any]:
+    """Compiled equivalent of a fitted binary sklearn model, or None if unsupported."""
+    classes = getattr(model, "classes_", None)
+    if classes is None or len(classes) != 2:
+        return None
+    name = type(model).__name__
+    if name == "LogisticRegression":
+        return CompiledLogisticRegression.from_sklearn(model)
+    if name == "RandomForestClassifier":
+        return CompiledTreeEnsemble.from_random_forest(model)
+    if name == "GradientBoostingClassifier" and getattr(model, "loss", None) == "log_loss":
+        return CompiledTreeEnsemble.from_gradient_boosting(model)
+    return None
+
+
+def compile_models(models: Dict[str, Any]) -> Dict[str, Any]:
+    """Swap every supported model for its compiled form; others are kept as-is."""
+    compiled: Dict[str, Any] = {}
+    for name, model in models.items():
+        replacement = compile_model(model)
+        compiled[name] = replacement if replacement is not None else model
+    return compiled
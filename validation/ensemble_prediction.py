@@ -14,16 +14,29 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
+from scipy import sparse
+
 try:
-    from validation.ml_simulation import build_match_feature_dict, features_to_vector
+    from validation.ml_simulation import (
+        FeatureIndex,
+        TeamFeatureMatrixBuilder,
+        build_match_feature_dict,
+    )
+    from validation.compiled_models import compile_models
 except ModuleNotFoundError:
     import sys as _sys
     from pathlib import Path as _Path
 
     _sys.path.insert(0, str(_Path(__file__).parent.parent))
-    from validation.ml_simulation import build_match_feature_dict, features_to_vector
+    from validation.ml_simulation import (
+        FeatureIndex,
+        TeamFeatureMatrixBuilder,
+        build_match_feature_dict,
+    )
+    from validation.compiled_models import compile_models
 
 
+INFERENCE_BACKENDS = ["sklearn", "compiled"]
 BLUE_PRIOR_FALLBACK = 0.4545
 EPSILON = 1e-6
 
@@ -71,10 +84,16 @@ class EnsemblePredictor:
         relationships: Dict,
         matchup_stats: Optional[Dict],
         blue_side_prior: Optional[float] = None,
-        logit_shift: float = 0.0
+        logit_shift: float = 0.0,
+        inference_backend: str = "sklearn"
     ):
-        self.models = models
+        if inference_backend not in INFERENCE_BACKENDS:
+            raise ValueError(f"Unknown inference backend: {inference_backend}")
+        self.inference_backend = inference_backend
+        # Compiled models answer predict_proba from flat arrays (see compiled_models).
+        self.models = compile_models(models) if inference_backend == "compiled" else models
         self.feature_names = feature_names
+        self.feature_index = FeatureIndex(feature_names)
         self.champion_data = champion_data
         self.attribute_data = attribute_data
         self.relationships = relationships
@@ -104,7 +123,7 @@ class EnsemblePredictor:
                 mapping[lane] = champion
         return mapping
 
-    def build_feature_vector(
+    def build_feature_dict(
         self,
         blue_team: List[str],
         blue_roles: List[str],
@@ -112,7 +131,7 @@ class EnsemblePredictor:
         red_roles: List[str],
         *,
         include_feature_breakdown: bool = True
-    ) -> Tuple[List[float], Optional[Dict]]:
+    ) -> Tuple[Dict[str, float], Optional[Dict]]:
         blue_team_dict = self._to_lane_map(blue_team, blue_roles)
         red_team_dict = self._to_lane_map(red_team, red_roles)
         feature_dict, feature_breakdown = build_match_feature_dict(
@@ -122,8 +141,44 @@ class EnsemblePredictor:
             self.matchup_stats,
             include_details=include_feature_breakdown
         )
-        feature_vector = features_to_vector(feature_dict, self.feature_names)
-        return feature_vector, feature_breakdown if include_feature_breakdown else None
+        return feature_dict, feature_breakdown if include_feature_breakdown else None
+
+    def build_feature_vector(
+        self,
+        blue_team: List[str],
+        blue_roles: List[str],
+        red_team: List[str],
+        red_roles: List[str],
+        *,
+        include_feature_breakdown: bool = True
+    ) -> Tuple[List[float], Optional[Dict]]:
+        feature_dict, feature_breakdown = self.build_feature_dict(
+            blue_team,
+            blue_roles,
+            red_team,
+            red_roles,
+            include_feature_breakdown=include_feature_breakdown
+        )
+        return self.feature_index.vector(feature_dict), feature_breakdown
+
+    def build_sparse_feature_matrix(self, feature_dicts: List[Dict[str, float]]) -> sparse.csr_matrix:
+        """CSR matrix of `build_feature_dict` outputs, accepted by `batch_predict_from_vectors`."""
+        return self.feature_index.csr(feature_dicts)
+
+    def feature_matrix_builder(
+        self,
+        champion_names: List[str],
+        roles: List[str]
+    ) -> TeamFeatureMatrixBuilder:
+        """Vectorized `build_feature_vector` for teams encoded as indices into champion_names."""
+        lanes = [role.title() for role in roles]
+        return TeamFeatureMatrixBuilder(
+            champion_names,
+            lanes,
+            self.champion_data,
+            self.matchup_stats,
+            self.feature_names
+        )
 
     def predict(
         self,
@@ -176,9 +231,12 @@ class EnsemblePredictor:
 
     def batch_predict_from_vectors(
         self,
-        feature_vectors: List[List[float]] | np.ndarray
+        feature_vectors: List[List[float]] | np.ndarray | sparse.spmatrix
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-        matrix = np.asarray(feature_vectors, dtype=float)
+        if sparse.issparse(feature_vectors):
+            matrix = sparse.csr_matrix(feature_vectors, dtype=float)
+        else:
+            matrix = np.asarray(feature_vectors, dtype=float)
         if matrix.ndim != 2:
             raise ValueError("feature_vectors must be a 2D array")
         model_probs = {}
@@ -450,7 +508,8 @@ def load_ensemble_predictor(
     attribute_path: str = "data/processed/archetype_attributes.json",
     relationships_path: str = "data/processed/role_aware_relationships.json",
     matchups_path: str = "data/matches/lane_duo_stats.json",
-    calibration_path: str = "data/simulations/calibration.json"
+    calibration_path: str = "data/simulations/calibration.json",
+    inference_backend: str = "sklearn"
 ) -> EnsemblePredictor:
     """
     Load trained models and create ensemble predictor.
@@ -460,6 +519,7 @@ def load_ensemble_predictor(
         champion_path: Path to champion archetype data
         attribute_path: Path to attribute definitions
         relationships_path: Path to role-aware relationships
+        inference_backend: "sklearn" or "compiled" (flat-array inference)
     
     Returns:
         Configured EnsemblePredictor instance
@@ -515,7 +575,8 @@ def load_ensemble_predictor(
         relationships=relationships,
         matchup_stats=matchup_stats,
         blue_side_prior=blue_side_prior,
-        logit_shift=logit_shift
+        logit_shift=logit_shift,
+        inference_backend=inference_backend
     )
 
 
@@ -11,13 +11,14 @@ import hashlib
 import math
 import os
 import random
+import sys
 import time
 from collections import Counter, defaultdict
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import UTC, datetime
 from itertools import count
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import heapq
 
@@ -28,12 +29,19 @@ try:
     from sklearn.model_selection import cross_val_score, train_test_split
     from sklearn.metrics import classification_report, confusion_matrix, roc_auc_score
     import numpy as np
+    from scipy import sparse
     SKLEARN_AVAILABLE = True
 except ImportError:
     SKLEARN_AVAILABLE = False
     print("⚠ scikit-learn not installed. Will use simple scoring method.")
     print("To install: pip install scikit-learn numpy")
 
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from validation.sampling_utils import build_role_pools_indices, sample_team_indices
+from validation.simulation_io import save_simulation_npz
 
 ROLE_ORDER = ['Top', 'Jungle', 'Middle', 'Bottom', 'Support']
 DUO_SYNERGY_PAIRS = [
@@ -43,6 +51,7 @@ DUO_SYNERGY_PAIRS = [
     ('Support', 'Jungle')
 ]
 MATCHUP_PRIOR_WEIGHT = 4.0  # Laplace smoothing weight for matchup win rates
+PREDICTION_BLOCK_SIZE = 8192  # Drafts generated and scored per model call in batched simulation
 _MATCHUP_CACHE_DIR = Path("data/cache/matchup_lookup")
 
 
@@ -127,8 +136,25 @@ def _laplace_rate(successes: float, total: float, prior_weight: float = MATCHUP_
     return (successes + 0.5 * prior_weight) / (total + prior_weight)
 
 
-_MATCHUP_LOOKUP_CACHE: Dict[int, 'MatchupLookup'] = {}
-_MATCHUP_DIGEST_CACHE: Dict[int, str] = {}
+# Caches keyed by payload identity. Entries keep their payload alive so its id()
+# cannot be reused by a different dict after the backend hot-reloads its data.
+_IDENTITY_CACHE_SIZE = 4
+_MATCHUP_LOOKUP_CACHE: Dict[int, Tuple[Dict, 'MatchupLookup']] = {}
+_MATCHUP_DIGEST_CACHE: Dict[int, Tuple[Dict, str]] = {}
+
+
+def _identity_cache_get(cache: Dict[int, Tuple[Any, Any]], payload: Any) -> Any:
+    entry = cache.get(id(payload))
+    if entry is not None and entry[0] is payload:
+        return entry[1]
+    return None
+
+
+def _identity_cache_put(cache: Dict[int, Tuple[Any, Any]], payload: Any, value: Any) -> None:
+    cache.pop(id(payload), None)
+    cache[id(payload)] = (payload, value)
+    while len(cache) > _IDENTITY_CACHE_SIZE:
+        cache.pop(next(iter(cache)))
 
 
 class MatchupLookup:
@@ -324,13 +350,12 @@ def lookup_duo_synergy(
 
 
 def _matchup_digest(matchup_stats: Dict) -> str:
-    cache_key = id(matchup_stats)
-    digest = _MATCHUP_DIGEST_CACHE.get(cache_key)
+    digest = _identity_cache_get(_MATCHUP_DIGEST_CACHE, matchup_stats)
     if digest is not None:
         return digest
     serialized = json.dumps(matchup_stats, sort_keys=True, separators=(',', ':')).encode('utf-8')
     digest = hashlib.blake2s(serialized, digest_size=16).hexdigest()
-    _MATCHUP_DIGEST_CACHE[cache_key] = digest
+    _identity_cache_put(_MATCHUP_DIGEST_CACHE, matchup_stats, digest)
     return digest
 
 
@@ -342,8 +367,7 @@ def _matchup_cache_path(matchup_stats: Dict) -> Path:
 def _get_matchup_lookup(matchup_stats: Dict) -> Optional[MatchupLookup]:
     if not matchup_stats:
         return None
-    key = id(matchup_stats)
-    cached = _MATCHUP_LOOKUP_CACHE.get(key)
+    cached = _identity_cache_get(_MATCHUP_LOOKUP_CACHE, matchup_stats)
     if cached is not None:
         return cached
     cache_path = _matchup_cache_path(matchup_stats)
@@ -360,7 +384,7 @@ def _get_matchup_lookup(matchup_stats: Dict) -> Optional[MatchupLookup]:
         except Exception:
             # Ignore cache write failures; in-memory lookup still works
             pass
-    _MATCHUP_LOOKUP_CACHE[key] = lookup
+    _identity_cache_put(_MATCHUP_LOOKUP_CACHE, matchup_stats, lookup)
     return lookup
 
 
@@ -475,13 +499,12 @@ def build_match_feature_dict(
     return diff_features, matchup_details
 
 
-_CHAMP_ATTR_CACHE: Dict[int, Dict[str, Tuple[Tuple[str, ...], frozenset]]] = {}
+_CHAMP_ATTR_CACHE: Dict[int, Tuple[Dict, Dict[str, Tuple[Tuple[str, ...], frozenset]]]] = {}
 
 
 def _get_champion_attribute_cache(champ_data: Dict) -> Dict[str, Tuple[Tuple[str, ...], frozenset]]:
     """Cache champion attribute tuples/sets per champion_data payload."""
-    key = id(champ_data)
-    cached = _CHAMP_ATTR_CACHE.get(key)
+    cached = _identity_cache_get(_CHAMP_ATTR_CACHE, champ_data)
     if cached is not None:
         return cached
     assignments = champ_data.get('assignments', {})
@@ -489,7 +512,7 @@ def _get_champion_attribute_cache(champ_data: Dict) -> Dict[str, Tuple[Tuple[str
     for champion, info in assignments.items():
         attrs = tuple(info.get('attributes', []) or [])
         champ_cache[champion] = (attrs, frozenset(attrs))
-    _CHAMP_ATTR_CACHE[key] = champ_cache
+    _identity_cache_put(_CHAMP_ATTR_CACHE, champ_data, champ_cache)
     return champ_cache
 
 
@@ -552,6 +575,241 @@ def features_to_vector(features: Dict[str, float], feature_names: List[str]) ->
     return [features.get(name, 0.0) for name in feature_names]
 
 
+class FeatureIndex:
+    """Fixed feature name -> column mapping, built once per model.
+
+    Feature dicts only carry the features a draft actually touches, so both
+    builders walk the dict instead of every model feature. Names the model was
+    not trained on are dropped, as in `features_to_vector`.
+    """
+
+    def __init__(self, feature_names: List[str]) -> None:
+        self.feature_names = list(feature_names)
+        self.columns = {name: idx for idx, name in enumerate(self.feature_names)}
+
+    def __len__(self) -> int:
+        return len(self.feature_names)
+
+    def vector(self, features: Dict[str, float]) -> List[float]:
+        """Dense row, equal to ``features_to_vector(features, feature_names)``."""
+        row = [0.0] * len(self.feature_names)
+        columns = self.columns
+        for name, value in features.items():
+            column = columns.get(name)
+            if column is not None:
+                row[column] = value
+        return row
+
+    def csr(self, feature_dicts: List[Dict[str, float]]) -> "sparse.csr_matrix":
+        """(N, F) CSR matrix holding only the non-zero features of each dict."""
+        columns = self.columns
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+        for features in feature_dicts:
+            for name, value in features.items():
+                column = columns.get(name)
+                if column is not None and value:
+                    indices.append(column)
+                    data.append(value)
+            indptr.append(len(indices))
+        matrix = sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int32)),
+            shape=(len(feature_dicts), len(self.feature_names))
+        )
+        matrix.sort_indices()
+        return matrix
+
+
+TEAM_BUCKET_FEATURES = [
+    ('damage', ['damage_physical', 'damage_magic', 'damage_mixed', 'damage_true']),
+    ('range', ['range_melee', 'range_short', 'range_medium', 'range_long']),
+    ('mobility', ['mobility_high', 'mobility_medium', 'mobility_low']),
+    ('scaling', ['scaling_early', 'scaling_mid', 'scaling_late']),
+    ('cc', ['cc_hard', 'cc_soft', 'cc_aoe', 'cc_single']),
+]
+
+
+class TeamFeatureMatrixBuilder:
+    """Build `build_match_feature_dict` vectors for whole batches of index-encoded teams.
+
+    Teams are (N, len(lanes)) integer arrays indexing ``champion_names``; column k
+    holds the champion playing ``lanes[k]``. Produces the same (N, F) matrix as
+    calling ``features_to_vector(build_match_feature_dict(...))`` per game.
+    """
+
+    def __init__(
+        self,
+        champion_names: List[str],
+        lanes: List[str],
+        champ_data: Dict,
+        matchup_stats: Dict,
+        feature_names: List[str]
+    ) -> None:
+        if len(set(lanes)) != len(lanes):
+            raise ValueError("lanes must be unique")
+        self.champion_names = list(champion_names)
+        self.champion_positions = {name: idx for idx, name in enumerate(self.champion_names)}
+        self.lanes = list(lanes)
+        self.feature_names = list(feature_names)
+        column_of = {name: idx for idx, name in enumerate(self.feature_names)}
+        champ_cache = _get_champion_attribute_cache(champ_data)
+
+        vocabulary = sorted({
+            attr
+            for champion in self.champion_names
+            for attr in champ_cache.get(champion, ((), frozenset()))[0]
+        })
+        attr_index = {attr: idx for idx, attr in enumerate(vocabulary)}
+        size = len(self.champion_names)
+        self.attr_counts = np.zeros((size, len(vocabulary)), dtype=np.int32)
+        attr_sets = np.zeros((size, len(vocabulary)), dtype=bool)
+        for row, champion in enumerate(self.champion_names):
+            attrs, attr_set = champ_cache.get(champion, ((), frozenset()))
+            for attr in attrs:
+                self.attr_counts[row, attr_index[attr]] += 1
+            for attr in attr_set:
+                attr_sets[row, attr_index[attr]] = True
+        # shared_counts[i, j] == len(attr_set(i) & attr_set(j))
+        as_int = attr_sets.astype(np.int32)
+        self.shared_counts = as_int @ as_int.T
+
+        # Count-based team features: (attribute column, feature column) pairs.
+        attr_targets: List[Tuple[int, int]] = []
+        for attr, idx in attr_index.items():
+            column = column_of.get(f"team_attr_{attr}")
+            if column is not None:
+                attr_targets.append((idx, column))
+        for prefix, attrs in TEAM_BUCKET_FEATURES:
+            for attr in attrs:
+                column = column_of.get(f"team_{prefix}_{attr}")
+                if attr in attr_index and column is not None:
+                    attr_targets.append((attr_index[attr], column))
+        self.attr_source = np.array([src for src, _ in attr_targets], dtype=np.intp)
+        self.attr_columns = np.array([dst for _, dst in attr_targets], dtype=np.intp)
+
+        self.role_pairs: List[Tuple[int, int, int]] = []
+        for i in range(len(self.lanes)):
+            for j in range(i + 1, len(self.lanes)):
+                column = column_of.get(f"team_role_pair_{self.lanes[i]}_{self.lanes[j]}_shared")
+                if column is not None:
+                    self.role_pairs.append((i, j, column))
+
+        lane_slot = {lane: idx for idx, lane in enumerate(self.lanes)}
+        lookup = _get_matchup_lookup(matchup_stats)
+        self.lookup_rows = np.full(size, -1, dtype=np.intp)
+        lookup_size = 0
+        if lookup is not None:
+            lookup_size = len(lookup.idx_to_champ)
+            for row, champion in enumerate(self.champion_names):
+                idx = lookup.champ_to_idx.get(champion)
+                if idx is not None:
+                    self.lookup_rows[row] = idx
+        # Unknown champions point at an all-zero padding row/column.
+        self.lookup_rows[self.lookup_rows < 0] = lookup_size
+
+        def _padded(values: np.ndarray, games: np.ndarray) -> np.ndarray:
+            table = np.zeros((lookup_size + 1, lookup_size + 1), dtype=np.float64)
+            table[:lookup_size, :lookup_size] = np.where(games != 0, values, 0.0)
+            return table
+
+        self.lane_terms: List[Tuple[int, np.ndarray, int]] = []
+        self.duo_terms: List[Tuple[int, int, np.ndarray, int]] = []
+        if lookup is not None:
+            for role in ROLE_ORDER:
+                column = column_of.get(f"lane_advantage_{role.lower()}")
+                if role not in lane_slot or column is None or role not in lookup.lane_advantage:
+                    continue
+                table = _padded(lookup.lane_advantage[role], lookup.lane_games[role])
+                self.lane_terms.append((lane_slot[role], table, column))
+            for role_a, role_b in DUO_SYNERGY_PAIRS:
+                pair_key = f"{role_a}_{role_b}"
+                column = column_of.get(f"duo_synergy_delta_{pair_key.lower()}")
+                if role_a not in lane_slot or role_b not in lane_slot or column is None:
+                    continue
+                if pair_key not in lookup.duo_synergy:
+                    continue
+                table = _padded(lookup.duo_synergy[pair_key], lookup.duo_games[pair_key])
+                self.duo_terms.append((lane_slot[role_a], lane_slot[role_b], table, column))
+
+    def to_arrays(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        """Split the builder into JSON-serializable metadata and its lookup arrays."""
+        arrays = {
+            "attr_counts": self.attr_counts,
+            "shared_counts": self.shared_counts,
+            "attr_source": self.attr_source,
+            "attr_columns": self.attr_columns,
+            "lookup_rows": self.lookup_rows,
+        }
+        for k, (_, table, _) in enumerate(self.lane_terms):
+            arrays[f"lane_{k}"] = table
+        for k, (_, _, table, _) in enumerate(self.duo_terms):
+            arrays[f"duo_{k}"] = table
+        meta = {
+            "champion_names": self.champion_names,
+            "lanes": self.lanes,
+            "feature_names": self.feature_names,
+            "role_pairs": [list(pair) for pair in self.role_pairs],
+            "lane_terms": [[slot, column] for slot, _, column in self.lane_terms],
+            "duo_terms": [[slot_a, slot_b, column] for slot_a, slot_b, _, column in self.duo_terms],
+        }
+        return meta, arrays
+
+    @classmethod
+    def from_arrays(cls, meta: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> "TeamFeatureMatrixBuilder":
+        """Rebuild from `to_arrays` output without copying the arrays (memmaps stay memmaps)."""
+        builder = cls.__new__(cls)
+        builder.champion_names = list(meta["champion_names"])
+        builder.champion_positions = {name: idx for idx, name in enumerate(builder.champion_names)}
+        builder.lanes = list(meta["lanes"])
+        builder.feature_names = list(meta["feature_names"])
+        builder.attr_counts = arrays["attr_counts"]
+        builder.shared_counts = arrays["shared_counts"]
+        builder.attr_source = arrays["attr_source"]
+        builder.attr_columns = arrays["attr_columns"]
+        builder.lookup_rows = arrays["lookup_rows"]
+        builder.role_pairs = [tuple(pair) for pair in meta["role_pairs"]]
+        builder.lane_terms = [
+            (slot, arrays[f"lane_{k}"], column) for k, (slot, column) in enumerate(meta["lane_terms"])
+        ]
+        builder.duo_terms = [
+            (slot_a, slot_b, arrays[f"duo_{k}"], column)
+            for k, (slot_a, slot_b, column) in enumerate(meta["duo_terms"])
+        ]
+        return builder
+
+    def champion_indices(self, teams: List[List[str]]) -> np.ndarray:
+        """Encode name lists (ordered like ``lanes``) as an index array."""
+        positions = self.champion_positions
+        return np.array([[positions[champion] for champion in team] for team in teams], dtype=np.intp)
+
+    def build(self, blue: np.ndarray, red: np.ndarray) -> np.ndarray:
+        blue = np.asarray(blue, dtype=np.intp)
+        red = np.asarray(red, dtype=np.intp)
+        matrix = np.zeros((blue.shape[0], len(self.feature_names)), dtype=np.float64)
+
+        if self.attr_columns.size:
+            blue_counts = self.attr_counts[blue].sum(axis=1)[:, self.attr_source]
+            red_counts = self.attr_counts[red].sum(axis=1)[:, self.attr_source]
+            matrix[:, self.attr_columns] = blue_counts / 5.0 - red_counts / 5.0
+
+        for i, j, column in self.role_pairs:
+            blue_shared = self.shared_counts[blue[:, i], blue[:, j]] / 10.0
+            red_shared = self.shared_counts[red[:, i], red[:, j]] / 10.0
+            matrix[:, column] = blue_shared - red_shared
+
+        blue_lookup = self.lookup_rows[blue]
+        red_lookup = self.lookup_rows[red]
+        for slot, table, column in self.lane_terms:
+            matrix[:, column] = table[blue_lookup[:, slot], red_lookup[:, slot]]
+        for slot_a, slot_b, table, column in self.duo_terms:
+            blue_synergy = table[blue_lookup[:, slot_a], blue_lookup[:, slot_b]]
+            red_synergy = table[red_lookup[:, slot_a], red_lookup[:, slot_b]]
+            matrix[:, column] = blue_synergy - red_synergy
+
+        return matrix
+
+
 def train_ml_models(matches: List[Dict], champ_data: Dict, matchup_stats: Dict):
     """
     Train multiple ML models on real match data
@@ -691,12 +949,105 @@ def predict_match_ml(
         }
 
 
+class BatchMatchPredictor:
+    """Score blocks of random drafts with one feature-matrix build and one call per model.
+
+    Produces the same numbers as `predict_match_ml`. Kept drafts are stored as
+    lightweight `record`s (champion indices and probabilities); `game` expands a
+    record into the full game dict, `feature_breakdown` included.
+    """
+
+    def __init__(
+        self,
+        champ_data: Dict,
+        models: Dict,
+        feature_names: List[str],
+        matchup_stats: Dict,
+        role_champions: Dict[str, List[str]]
+    ) -> None:
+        self.models = models
+        self.matchup_stats = matchup_stats
+        self.role_arrays, idx_to_champion = build_role_pools_indices(role_champions, ROLE_ORDER)
+        self.champion_names = np.array(idx_to_champion, dtype=object)
+        self.builder = TeamFeatureMatrixBuilder(idx_to_champion, ROLE_ORDER, champ_data, matchup_stats, feature_names)
+
+    def sample_block(self, generator: np.random.Generator, size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Draw `size` (blue, red) drafts as index arrays ordered like ROLE_ORDER."""
+        return sample_team_indices(generator, self.role_arrays, ROLE_ORDER, size)
+
+    def predict_block(self, blue: np.ndarray, red: np.ndarray) -> Dict[str, Any]:
+        """Per-model and ensemble blue probabilities for a block of drafts."""
+        matrix = self.builder.build(blue, red)
+        model_blue: Dict[str, np.ndarray] = {}
+        model_votes: Dict[str, np.ndarray] = {}
+        for name, model in self.models.items():
+            proba = model.predict_proba(matrix)
+            model_blue[name] = proba[:, 1]
+            # Same label `model.predict` returns: the class with the highest probability.
+            model_votes[name] = model.classes_[np.argmax(proba, axis=1)] == 1
+        blue_votes = np.sum(list(model_votes.values()), axis=0)
+        return {
+            "blue": blue,
+            "red": red,
+            "blue_probability": np.mean(list(model_blue.values()), axis=0),
+            "ensemble_blue": blue_votes >= 2,
+            "model_blue": model_blue,
+            "model_votes": model_votes
+        }
+
+    def record(self, block: Dict[str, Any], row: int, game_id: int) -> Dict:
+        """Lightweight record of one draft in `block`; cheap to keep and to pickle."""
+        return {
+            'game_id': game_id,
+            'blue': block["blue"][row].tolist(),
+            'red': block["red"][row].tolist(),
+            'blue_probability': float(block["blue_probability"][row]),
+            'ensemble_blue': bool(block["ensemble_blue"][row]),
+            'model_blue': {name: float(probs[row]) for name, probs in block["model_blue"].items()},
+            'model_votes': {name: bool(votes[row]) for name, votes in block["model_votes"].items()}
+        }
+
+    def game(self, record: Dict) -> Dict:
+        """Expand a `record` into the `predict_match_ml` game format."""
+        blue_team = dict(zip(ROLE_ORDER, self.champion_names[record['blue']]))
+        red_team = dict(zip(ROLE_ORDER, self.champion_names[record['red']]))
+        _, explanation = compute_matchup_features(blue_team, red_team, self.matchup_stats, include_details=True)
+        blue_prob = record['blue_probability']
+        return {
+            'game_id': record['game_id'],
+            'blue_team': blue_team,
+            'red_team': red_team,
+            'prediction': {
+                'ensemble_prediction': 'blue' if record['ensemble_blue'] else 'red',
+                'blue_probability': blue_prob,
+                'red_probability': float(1 - blue_prob),
+                'individual_predictions': {
+                    name: 'blue' if vote else 'red' for name, vote in record['model_votes'].items()
+                },
+                'individual_probabilities': {
+                    name: {'blue': prob, 'red': float(1 - prob)} for name, prob in record['model_blue'].items()
+                },
+                'feature_breakdown': explanation
+            }
+        }
+
+
 class PredictionAggregator:
-    """Streaming aggregator so we can simulate millions of drafts without O(n) memory."""
+    """Streaming aggregator so we can simulate millions of drafts without O(n) memory.
+
+    Kept games may be full game dicts (`add_game`) or lightweight records
+    (`add_block`); `materialize` expands records into game dicts in `finalize`.
+    """
 
-    def __init__(self, sample_limit: int = 2000, extremes_limit: int = 10):
+    def __init__(
+        self,
+        sample_limit: int = 2000,
+        extremes_limit: int = 10,
+        materialize: Optional[Callable[[Dict], Dict]] = None
+    ):
         self.sample_limit = sample_limit
         self.extremes_limit = extremes_limit
+        self.materialize = materialize
         self.sample_games: List[Dict] = []
         self.total_games = 0
         self.blue_wins = 0
@@ -751,6 +1102,47 @@ class PredictionAggregator:
             if -closeness > self._closest[0][0]:
                 heapq.heapreplace(self._closest, entry)
 
+    def add_block(self, blue_probs: np.ndarray, ensemble_blue: np.ndarray, make_record: Callable[[int], Dict]):
+        """Add a block of scored games, calling `make_record(row)` only for games that are kept."""
+        size = len(blue_probs)
+        if not size:
+            return
+        red_probs = 1 - blue_probs
+        confidence = np.maximum(blue_probs, red_probs)
+        self.total_games += size
+        self.blue_wins += int(np.count_nonzero(ensemble_blue))
+        self.confidence_sum += float(confidence.sum())
+        self.blue_prob_sum += float(blue_probs.sum())
+        high = confidence >= 0.6
+        medium = ~high & (confidence >= 0.55)
+        self.high_conf += int(high.sum())
+        self.medium_conf += int(medium.sum())
+        self.low_conf += size - int(high.sum()) - int(medium.sum())
+
+        records: Dict[int, Dict] = {}
+
+        def _game(row: int) -> Dict:
+            if row not in records:
+                records[row] = make_record(row)
+            return records[row]
+
+        for row in range(min(size, max(self.sample_limit - len(self.sample_games), 0))):
+            self.sample_games.append(_game(row))
+
+        if self.extremes_limit <= 0:
+            return
+        closeness = -np.abs(blue_probs - 0.5)
+        for heap, keys in ((self._top_blue, blue_probs), (self._top_red, red_probs), (self._closest, closeness)):
+            # Only a block's `extremes_limit` largest keys can displace heap entries.
+            limit = min(self.extremes_limit, size)
+            candidates = np.sort(np.argpartition(-keys, limit - 1)[:limit])
+            for row in candidates.tolist():
+                key = float(keys[row])
+                if len(heap) < self.extremes_limit:
+                    heapq.heappush(heap, (key, next(self._counter), _game(row)))
+                elif key > heap[0][0]:
+                    heapq.heapreplace(heap, (key, next(self._counter), _game(row)))
+
     def _ordered(self, heap: List[Tuple[float, int, Dict]], reverse: bool = True) -> List[Dict]:
         if not heap:
             return []
@@ -772,10 +1164,27 @@ class PredictionAggregator:
         }
 
     def finalize(self) -> Dict:
-        return build_analysis_from_states([self.export_state()], self.sample_limit, self.extremes_limit)
+        return build_analysis_from_states(
+            [self.export_state()], self.sample_limit, self.extremes_limit, self.materialize
+        )
+
 
+def _kept_blue_probability(game: Dict) -> float:
+    prediction = game.get('prediction')
+    return prediction['blue_probability'] if prediction else game['blue_probability']
 
-def build_analysis_from_states(states: List[Dict], sample_limit: int, extremes_limit: int) -> Dict:
+
+def _kept_red_probability(game: Dict) -> float:
+    prediction = game.get('prediction')
+    return prediction['red_probability'] if prediction else 1 - game['blue_probability']
+
+
+def build_analysis_from_states(
+    states: List[Dict],
+    sample_limit: int,
+    extremes_limit: int,
+    materialize: Optional[Callable[[Dict], Dict]] = None
+) -> Dict:
     total_games = sum(state.get('total_games', 0) for state in states)
     if total_games == 0:
         return {}
@@ -802,20 +1211,37 @@ def build_analysis_from_states(states: List[Dict], sample_limit: int, extremes_l
 
     top_blue = _select(
         _collect('top_blue'),
-        key_func=lambda g: g['prediction']['blue_probability'],
+        key_func=_kept_blue_probability,
         reverse=True
     )
     top_red = _select(
         _collect('top_red'),
-        key_func=lambda g: g['prediction']['red_probability'],
+        key_func=_kept_red_probability,
         reverse=True
     )
     closest = _select(
         _collect('closest'),
-        key_func=lambda g: abs(g['prediction']['blue_probability'] - 0.5),
+        key_func=lambda g: abs(_kept_blue_probability(g) - 0.5),
         reverse=False
     )
 
+    if materialize is not None:
+        # Expand only the records that made the final cut, each once.
+        expanded: Dict[int, Dict] = {}
+
+        def _expand(games: List[Dict]) -> List[Dict]:
+            result = []
+            for game in games:
+                if 'prediction' in game:
+                    result.append(game)
+                    continue
+                if id(game) not in expanded:
+                    expanded[id(game)] = materialize(game)
+                result.append(expanded[id(game)])
+            return result
+
+        samples, top_blue, top_red, closest = (_expand(games) for games in (samples, top_blue, top_red, closest))
+
     blue_win_rate = blue_wins / total_games
     avg_confidence = confidence_sum / total_games
 
@@ -851,11 +1277,15 @@ def format_duration(seconds: float) -> str:
     return f"{sec}s"
 
 
+DEFAULT_CHECKPOINT_DIR = Path("data/simulations/checkpoints")
+
+
 def save_checkpoint(analysis: Dict, games_completed: int, total_games: int,
-                    sample_limit: int, extremes_limit: int):
+                    sample_limit: int, extremes_limit: int, output_format: str = "json",
+                    checkpoint_dir: Path = DEFAULT_CHECKPOINT_DIR):
     if not analysis:
         return
-    checkpoint_dir = Path("data/simulations/checkpoints")
+    checkpoint_dir = Path(checkpoint_dir)
     checkpoint_dir.mkdir(parents=True, exist_ok=True)
     payload = {
         'checkpoint_games_completed': games_completed,
@@ -865,12 +1295,31 @@ def save_checkpoint(analysis: Dict, games_completed: int, total_games: int,
         'extremes_limit': extremes_limit,
         'analysis': analysis
     }
-    checkpoint_path = checkpoint_dir / f"simulation_checkpoint_{games_completed:07d}.json"
-    with checkpoint_path.open('w', encoding='utf-8') as handle:
-        json.dump(payload, handle, indent=2)
+    checkpoint_path = checkpoint_dir / f"simulation_checkpoint_{games_completed:07d}.{output_format}"
+    if output_format == "npz":
+        save_simulation_npz(checkpoint_path, payload)
+    else:
+        with checkpoint_path.open('w', encoding='utf-8') as handle:
+            json.dump(payload, handle, indent=2)
     print(f"  💾 Checkpoint saved ({games_completed:,}/{total_games:,}) -> {checkpoint_path}")
 
 
+def _add_predicted_block(
+    aggregator: PredictionAggregator,
+    predictor: BatchMatchPredictor,
+    generator: np.random.Generator,
+    first_game_id: int,
+    size: int
+) -> None:
+    blue, red = predictor.sample_block(generator, size)
+    block = predictor.predict_block(blue, red)
+    aggregator.add_block(
+        block["blue_probability"],
+        block["ensemble_blue"],
+        lambda row: predictor.record(block, row, first_game_id + row)
+    )
+
+
 def _simulate_prediction_chunk(
     start_game_id: int,
     n_games: int,
@@ -883,9 +1332,17 @@ def _simulate_prediction_chunk(
     role_champions: Dict[str, List[str]],
     seed: int
 ) -> Dict:
-    rng = random.Random(seed)
     aggregator = PredictionAggregator(sample_limit=sample_limit, extremes_limit=extremes_limit)
 
+    if SKLEARN_AVAILABLE and models:
+        predictor = BatchMatchPredictor(champ_data, models, feature_names, matchup_stats, role_champions)
+        generator = np.random.default_rng(seed)
+        for offset in range(0, n_games, PREDICTION_BLOCK_SIZE):
+            size = min(PREDICTION_BLOCK_SIZE, n_games - offset)
+            _add_predicted_block(aggregator, predictor, generator, start_game_id + offset, size)
+        return aggregator.export_state()
+
+    rng = random.Random(seed)
     for i in range(n_games):
         game_id = start_game_id + i
         blue_team = generate_random_team(champ_data, role_champions, rng)
@@ -913,31 +1370,47 @@ def simulate_predictions(
     extremes_limit: int = 10,
     workers: int = 1,
     chunk_size: int = 50000,
-    checkpoint_interval: int = 100000
+    checkpoint_interval: int = 100000,
+    checkpoint_format: str = "json",
+    checkpoint_dir: Path = DEFAULT_CHECKPOINT_DIR
 ) -> Dict:
     print(f"\nGenerating {n_games:,} random games...")
     role_champions = build_role_champion_pool(champ_data)
     start_time = time.perf_counter()
+    # Without models we fall back to per-game prediction, which keeps full game dicts.
+    predictor = None
+    if SKLEARN_AVAILABLE and models:
+        predictor = BatchMatchPredictor(champ_data, models, feature_names, matchup_stats, role_champions)
+    materialize = predictor.game if predictor is not None else None
 
     if workers <= 1:
-        aggregator = PredictionAggregator(sample_limit=sample_limit, extremes_limit=extremes_limit)
+        aggregator = PredictionAggregator(sample_limit=sample_limit, extremes_limit=extremes_limit, materialize=materialize)
         progress_interval = 1000 if n_games <= 10000 else 50000
         next_checkpoint = checkpoint_interval if checkpoint_interval else float('inf')
-
-        for i in range(n_games):
-            blue_team = generate_random_team(champ_data, role_champions)
-            red_team = generate_random_team(champ_data, role_champions)
-            prediction = predict_match_ml(blue_team, red_team, models, feature_names, champ_data, matchup_stats)
-
-            game = {
-                'game_id': i + 1,
-                'blue_team': blue_team,
-                'red_team': red_team,
-                'prediction': prediction
-            }
-            aggregator.add_game(game)
-
-            games_done = i + 1
+        if predictor is not None:
+            generator = np.random.default_rng()
+
+        games_done = 0
+        while games_done < n_games:
+            if predictor is not None:
+                # Blocks end on progress/checkpoint boundaries so reports land on the same counts.
+                next_report = (games_done // progress_interval + 1) * progress_interval
+                size = int(min(PREDICTION_BLOCK_SIZE, n_games - games_done, next_report - games_done, next_checkpoint - games_done))
+                _add_predicted_block(aggregator, predictor, generator, games_done + 1, size)
+                games_done += size
+            else:
+                blue_team = generate_random_team(champ_data, role_champions)
+                red_team = generate_random_team(champ_data, role_champions)
+                prediction = predict_match_ml(blue_team, red_team, models, feature_names, champ_data, matchup_stats)
+
+                game = {
+                    'game_id': games_done + 1,
+                    'blue_team': blue_team,
+                    'red_team': red_team,
+                    'prediction': prediction
+                }
+                aggregator.add_game(game)
+                games_done += 1
 
             if games_done % progress_interval == 0 or games_done == n_games:
                 elapsed = time.perf_counter() - start_time
@@ -949,7 +1422,7 @@ def simulate_predictions(
 
             if checkpoint_interval and games_done >= next_checkpoint:
                 snapshot = aggregator.finalize()
-                save_checkpoint(snapshot, games_done, n_games, sample_limit, extremes_limit)
+                save_checkpoint(snapshot, games_done, n_games, sample_limit, extremes_limit, checkpoint_format, checkpoint_dir)
                 next_checkpoint += checkpoint_interval
 
         print(f"✓ Generated and predicted {n_games:,} games")
@@ -1006,10 +1479,10 @@ def simulate_predictions(
             while checkpoint_interval and games_completed >= (checkpoints_written + 1) * checkpoint_interval:
                 checkpoints_written += 1
                 checkpoint_games = min(checkpoints_written * checkpoint_interval, games_completed)
-                snapshot = build_analysis_from_states(partial_states, sample_limit, extremes_limit)
-                save_checkpoint(snapshot, checkpoint_games, n_games, sample_limit, extremes_limit)
+                snapshot = build_analysis_from_states(partial_states, sample_limit, extremes_limit, materialize)
+                save_checkpoint(snapshot, checkpoint_games, n_games, sample_limit, extremes_limit, checkpoint_format, checkpoint_dir)
 
-    analysis = build_analysis_from_states(partial_states, sample_limit, extremes_limit)
+    analysis = build_analysis_from_states(partial_states, sample_limit, extremes_limit, materialize)
     print(f"✓ Generated and predicted {n_games:,} games (multi-process)")
     return analysis
 
@@ -1024,6 +1497,8 @@ def main():
     parser.add_argument('--workers', type=int, default=default_workers, help='Number of worker processes for simulation')
     parser.add_argument('--chunk-size', type=int, default=50000, help='Games per worker chunk when running in parallel')
     parser.add_argument('--checkpoint-interval', type=int, default=100000, help='Games between checkpoints (set 0 to disable)')
+    parser.add_argument('--checkpoint-format', choices=['json', 'npz'], default='json', help='Write checkpoints as indented JSON or columnar .npz')
+    parser.add_argument('--checkpoint-dir', type=Path, default=DEFAULT_CHECKPOINT_DIR, help='Directory for checkpoints (use a scratch directory for test runs so tracked checkpoints are not overwritten)')
     parser.add_argument('--matchups-path', default='data/matches/lane_duo_stats.json', help='Lane/duo matchup stats JSON path')
     args = parser.parse_args()
     print("=" * 80)
@@ -1076,7 +1551,9 @@ def main():
         extremes_limit=args.extremes_limit,
         workers=args.workers,
         chunk_size=args.chunk_size,
-        checkpoint_interval=args.checkpoint_interval
+        checkpoint_interval=args.checkpoint_interval,
+        checkpoint_format=args.checkpoint_format,
+        checkpoint_dir=args.checkpoint_dir
     )
     
     # Analyze predictions
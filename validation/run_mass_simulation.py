@@ -8,17 +8,20 @@ aggregates archetype matchup statistics (e.g., Protect-the-Carry vs Dive).
 from __future__ import annotations
 
 import argparse
+import copy
 import json
 import math
+import os
+import pickle
 import random
 import sys
+import tempfile
 import time
 import numpy as np
 from collections import defaultdict
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
 from statistics import NormalDist
-from types import SimpleNamespace
 from typing import Any, Dict, List, Tuple, Optional
 
 import joblib
@@ -29,9 +32,10 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from validation.ensemble_prediction import load_ensemble_predictor, PredictionResult
-from validation.ml_simulation import extract_features_from_team, features_to_vector
-from validation.sampling_utils import build_role_pools_indices, sample_teams_numpy
+from validation.ensemble_prediction import INFERENCE_BACKENDS, EnsemblePredictor, load_ensemble_predictor
+from validation.ml_simulation import TeamFeatureMatrixBuilder, extract_features_from_team
+from validation.sampling_utils import build_role_pools_indices, sample_team_indices
+from validation.simulation_io import SUMMARY_FORMATS, write_simulation_payload
 
 ROLE_ORDER = ["TOP", "JUNGLE", "MIDDLE", "BOTTOM", "UTILITY"]
 POSITION_MAP = {
@@ -54,6 +58,29 @@ ROLE_TO_POSITION = {
     "UTILITY": "Support"
 }
 
+COMPOSITION_TYPES = ["dive", "poke", "protect_the_carry", "bruiser", "mixed"]
+COMPOSITION_CODES = {comp: code for code, comp in enumerate(COMPOSITION_TYPES)}
+MATCHUP_STAT_KEYS = [
+    "games",
+    "blue_win_prob_sum",
+    "blue_win_prob_sq_sum",
+    "red_win_prob_sum",
+    "red_win_prob_sq_sum",
+    "blue_pred_wins",
+    "confidence_sum"
+]
+COMPOSITION_STAT_KEYS = ["games", "blue_prob_sum", "blue_prob_sq_sum"]
+# Independent sampling units (games, or side-swapped pairs in antithetic mode),
+# grouped by stratum cell / by team composition for the variance estimators.
+UNIT_STAT_KEYS = ["units", "unit_sum", "unit_sq_sum"]
+STAT_GROUPS = ("matchups", "composition_totals", "strata", "team_units", "composition_strata")
+SAMPLING_MODES = ["iid", "antithetic"]
+ALLOCATION_MODES = ["proportional", "adaptive"]
+ADAPTIVE_MIN_CELL_GAMES = 100
+SHARED_STATE_MANIFEST = "worker_state.json"
+RESUME_SCALAR_KEYS = ["blue_win_prob_sum", "blue_win_prob_sq_sum", "confidence_sum", "confidence_sq_sum"]
+RESUME_STATE_VERSION = 3
+
 _WORKER_STATE_CACHE: Dict[str, Dict[str, Any]] = {}
 
 
@@ -79,30 +106,150 @@ def _warm_predictor(predictor, role_pools: Dict[str, List[str]]) -> None:
     predictor.batch_predict_from_vectors([feature_vector])
 
 
-def _get_worker_state(matchups_path: str) -> Dict[str, Any]:
-    state = _WORKER_STATE_CACHE.get(matchups_path)
+def _get_worker_state(
+    matchups_path: str,
+    shared_state_dir: Optional[str] = None,
+    inference_backend: str = "sklearn"
+) -> Dict[str, Any]:
+    cache_key = shared_state_dir or matchups_path
+    state = _WORKER_STATE_CACHE.get(cache_key)
     if state is not None:
         return state
+    if shared_state_dir is not None:
+        state = attach_shared_worker_state(Path(shared_state_dir))
+        _WORKER_STATE_CACHE[cache_key] = state
+        return state
     champion_data = load_champion_data()
     role_pools = build_role_pools(champion_data)
     role_arrays, idx_to_champion = build_role_pools_indices(role_pools, ROLE_ORDER)
-    predictor = load_ensemble_predictor(matchups_path=matchups_path)
+    predictor = load_ensemble_predictor(matchups_path=matchups_path, inference_backend=inference_backend)
     _warm_predictor(predictor, role_pools)
     state = {
         "champion_data": champion_data,
         "role_pools": role_pools,
         "predictor": predictor,
         "role_arrays": role_arrays,
-        "idx_to_champion": idx_to_champion
+        "idx_to_champion": idx_to_champion,
+        "feature_builder": predictor.feature_matrix_builder(idx_to_champion, ROLE_ORDER),
+        "composition_flags": build_composition_flag_table(idx_to_champion, champion_data),
+        "training_builder": None
     }
-    _WORKER_STATE_CACHE[matchups_path] = state
+    _WORKER_STATE_CACHE[cache_key] = state
     return state
 
 
-def _simulate_chunk_process(chunk_size: int, seed: int, training_sample_rate: float, matchups_path: str):
-    state = _get_worker_state(matchups_path)
+def export_shared_worker_state(
+    directory: Path,
+    predictor: EnsemblePredictor,
+    models_path: str,
+    role_arrays: Dict[str, np.ndarray],
+    idx_to_champion: List[str],
+    feature_builder: TeamFeatureMatrixBuilder,
+    composition_flags: np.ndarray,
+    training_builder: Optional[TeamFeatureMatrixBuilder] = None
+) -> None:
+    """Write the parent's lookup tables as .npy files that workers memory-map read-only."""
+    builder_meta, builder_arrays = feature_builder.to_arrays()
+    arrays = {f"builder_{name}": array for name, array in builder_arrays.items()}
+    training_meta, training_arrays = training_builder.to_arrays() if training_builder is not None else (None, {})
+    arrays.update({f"training_{name}": array for name, array in training_arrays.items()})
+    arrays["composition_flags"] = composition_flags
+    for role in ROLE_ORDER:
+        arrays[f"role_{role}"] = role_arrays[role]
+    for name, array in arrays.items():
+        np.save(directory / f"{name}.npy", np.ascontiguousarray(array))
+    manifest = {
+        "models_path": str(Path(models_path).resolve()),
+        "blue_side_prior": predictor.blue_side_prior,
+        "logit_shift": predictor.logit_shift,
+        "inference_backend": predictor.inference_backend,
+        "idx_to_champion": list(idx_to_champion),
+        "builder": builder_meta,
+        "builder_arrays": sorted(builder_arrays),
+        "training": training_meta,
+        "training_arrays": sorted(training_arrays)
+    }
+    with open(directory / SHARED_STATE_MANIFEST, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+
+
+def attach_shared_worker_state(directory: Path) -> Dict[str, Any]:
+    """Build worker state from `export_shared_worker_state` output without copying the tables.
+
+    Only the model pickle is loaded per process; champion JSON, lane/duo stats and
+    the derived feature tables are never parsed or rebuilt in the worker.
+    """
+    with open(directory / SHARED_STATE_MANIFEST, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    def _attach(name: str) -> np.ndarray:
+        return np.load(directory / f"{name}.npy", mmap_mode="r")
+
+    builder = TeamFeatureMatrixBuilder.from_arrays(
+        manifest["builder"],
+        {name: _attach(f"builder_{name}") for name in manifest["builder_arrays"]}
+    )
+    training_builder = None
+    if manifest.get("training") is not None:
+        training_builder = TeamFeatureMatrixBuilder.from_arrays(
+            manifest["training"],
+            {name: _attach(f"training_{name}") for name in manifest["training_arrays"]}
+        )
+    idx_to_champion = manifest["idx_to_champion"]
+    role_arrays = {role: _attach(f"role_{role}") for role in ROLE_ORDER}
+    with open(manifest["models_path"], "rb") as f:
+        model_data = pickle.load(f)
+    predictor = EnsemblePredictor(
+        models=model_data["models"],
+        feature_names=model_data["feature_names"],
+        champion_data={},
+        attribute_data={},
+        relationships={},
+        matchup_stats=None,
+        blue_side_prior=manifest["blue_side_prior"],
+        logit_shift=manifest["logit_shift"],
+        inference_backend=manifest["inference_backend"]
+    )
+    if predictor.feature_names != builder.feature_names:
+        raise ValueError("Shared feature tables do not match the model's feature names")
+    predictor.batch_predict_from_vectors(np.zeros((1, len(builder.feature_names))))
+    return {
+        "champion_data": {},
+        "role_pools": {role: [idx_to_champion[idx] for idx in role_arrays[role]] for role in ROLE_ORDER},
+        "predictor": predictor,
+        "role_arrays": role_arrays,
+        "idx_to_champion": idx_to_champion,
+        "feature_builder": builder,
+        "composition_flags": _attach("composition_flags"),
+        "training_builder": training_builder
+    }
+
+
+def _simulate_chunk_process(
+    chunk_size: int,
+    seed: int,
+    training_sample_rate: float,
+    matchups_path: str,
+    shared_state_dir: Optional[str] = None,
+    training_feature_names: Optional[List[str]] = None,
+    antithetic: bool = False,
+    allocation_weights: Optional[np.ndarray] = None,
+    team_frequencies: Optional[np.ndarray] = None,
+    inference_backend: str = "sklearn"
+):
+    state = _get_worker_state(matchups_path, shared_state_dir, inference_backend)
+    training_builder = state["training_builder"]
+    if training_sample_rate > 0 and training_builder is None:
+        if training_feature_names is None:
+            raise ValueError("training_feature_names are required when the worker state has no training tables")
+        training_builder = build_training_diff_builder(
+            state["idx_to_champion"],
+            state["champion_data"],
+            training_feature_names
+        )
+        state["training_builder"] = training_builder
     worker_stats = _create_empty_stats()
-    payload = [] if training_sample_rate > 0 else None
+    batches: Optional[List[Tuple[np.ndarray, np.ndarray]]] = [] if training_sample_rate > 0 else None
     simulate_chunk(
         chunk_size,
         state["champion_data"],
@@ -111,12 +258,25 @@ def _simulate_chunk_process(chunk_size: int, seed: int, training_sample_rate: fl
         rng=None,
         stats=worker_stats,
         trainer=None,
-        training_payload=payload,
+        training_payload=batches,
         training_sample_rate=training_sample_rate,
         seed=seed,
         role_arrays=state["role_arrays"],
-        idx_to_champion=state["idx_to_champion"]
+        idx_to_champion=state["idx_to_champion"],
+        feature_builder=state["feature_builder"],
+        composition_flags=state["composition_flags"],
+        training_builder=training_builder,
+        antithetic=antithetic,
+        allocation_weights=allocation_weights,
+        team_frequencies=team_frequencies
     )
+    # Ship one float32 diff matrix and one probability vector instead of per-game dicts.
+    payload = None
+    if batches:
+        payload = {
+            "diffs": np.concatenate([diffs for diffs, _ in batches]),
+            "blue_probs": np.concatenate([probs for _, probs in batches])
+        }
     return worker_stats, payload
 
 
@@ -134,17 +294,149 @@ def _format_duration(seconds: Optional[float]) -> Optional[str]:
 
 
 def _create_empty_stats() -> Dict[str, Any]:
+    """Running sums; matchup arrays are indexed [blue_code, red_code] by COMPOSITION_CODES."""
+    comp_count = len(COMPOSITION_TYPES)
     return {
         "total_games": 0,
         "blue_win_prob_sum": 0.0,
         "blue_win_prob_sq_sum": 0.0,
         "confidence_sum": 0.0,
         "confidence_sq_sum": 0.0,
-        "matchups": {},
-        "composition_totals": {}
+        "matchups": {
+            key: np.zeros((comp_count, comp_count), dtype=np.int64 if key in ("games", "blue_pred_wins") else np.float64)
+            for key in MATCHUP_STAT_KEYS
+        },
+        "composition_totals": {
+            key: np.zeros(comp_count, dtype=np.int64 if key == "games" else np.float64)
+            for key in COMPOSITION_STAT_KEYS
+        },
+        "strata": {
+            key: np.zeros((comp_count, comp_count), dtype=np.int64 if key == "units" else np.float64)
+            for key in UNIT_STAT_KEYS
+        },
+        "team_units": {
+            key: np.zeros(comp_count, dtype=np.int64 if key == "units" else np.float64)
+            for key in UNIT_STAT_KEYS
+        },
+        # Indexed [composition, blue_code, red_code]: units of each stratum credited to a composition.
+        "composition_strata": {
+            key: np.zeros((comp_count, comp_count, comp_count), dtype=np.int64 if key == "units" else np.float64)
+            for key in UNIT_STAT_KEYS
+        }
     }
 
 
+def _accumulate_batch(
+    stats: Dict[str, Any],
+    blue_codes: np.ndarray,
+    red_codes: np.ndarray,
+    blue_probs: np.ndarray,
+    red_probs: np.ndarray,
+    confidences: np.ndarray
+) -> None:
+    """Fold a batch of scored games into ``stats`` with bincounts over composition codes."""
+    games = int(blue_codes.shape[0])
+    if games == 0:
+        return
+    comp_count = len(COMPOSITION_TYPES)
+    blue_probs = np.asarray(blue_probs, dtype=np.float64)
+    red_probs = np.asarray(red_probs, dtype=np.float64)
+    confidences = np.asarray(confidences, dtype=np.float64)
+
+    stats["total_games"] += games
+    stats["blue_win_prob_sum"] += float(blue_probs.sum())
+    stats["blue_win_prob_sq_sum"] += float(np.square(blue_probs).sum())
+    stats["confidence_sum"] += float(confidences.sum())
+    stats["confidence_sq_sum"] += float(np.square(confidences).sum())
+
+    cells = blue_codes.astype(np.intp) * comp_count + red_codes.astype(np.intp)
+    size = comp_count * comp_count
+    shape = (comp_count, comp_count)
+
+    def _cell_sum(weights: Optional[np.ndarray] = None) -> np.ndarray:
+        return np.bincount(cells, weights=weights, minlength=size).reshape(shape)
+
+    matchups = stats["matchups"]
+    matchups["games"] += _cell_sum()
+    matchups["blue_win_prob_sum"] += _cell_sum(blue_probs)
+    matchups["blue_win_prob_sq_sum"] += _cell_sum(np.square(blue_probs))
+    matchups["red_win_prob_sum"] += _cell_sum(red_probs)
+    matchups["red_win_prob_sq_sum"] += _cell_sum(np.square(red_probs))
+    matchups["blue_pred_wins"] += np.bincount(cells[blue_probs > 0.5], minlength=size).reshape(shape)
+    matchups["confidence_sum"] += _cell_sum(confidences)
+
+    # Each side's composition is credited with its own win probability.
+    totals = stats["composition_totals"]
+    both_codes = np.concatenate([blue_codes, red_codes]).astype(np.intp)
+    both_probs = np.concatenate([blue_probs, red_probs])
+    totals["games"] += np.bincount(both_codes, minlength=comp_count)
+    totals["blue_prob_sum"] += np.bincount(both_codes, weights=both_probs, minlength=comp_count)
+    totals["blue_prob_sq_sum"] += np.bincount(both_codes, weights=np.square(both_probs), minlength=comp_count)
+
+
+def _accumulate_units(
+    stats: Dict[str, Any],
+    blue_codes: np.ndarray,
+    red_codes: np.ndarray,
+    blue_probs: np.ndarray,
+    red_probs: np.ndarray,
+    antithetic: bool = False
+) -> None:
+    """Fold independent sampling units into the strata/team_units sums.
+
+    In antithetic mode the first half of the batch holds the drafts and the second
+    half the same drafts with sides swapped; each pair is one unit, stratified by
+    the first orientation's cell, and each team's unit value is the mean of its
+    win probabilities on both sides.
+    """
+    comp_count = len(COMPOSITION_TYPES)
+    blue_probs = np.asarray(blue_probs, dtype=np.float64)
+    red_probs = np.asarray(red_probs, dtype=np.float64)
+    if antithetic:
+        half = blue_probs.shape[0] // 2
+        blue_codes = blue_codes[:half]
+        red_codes = red_codes[:half]
+        unit_values = (blue_probs[:half] + blue_probs[half:]) / 2.0
+        blue_team_values = (blue_probs[:half] + red_probs[half:]) / 2.0
+        red_team_values = (red_probs[:half] + blue_probs[half:]) / 2.0
+    else:
+        unit_values = blue_probs
+        blue_team_values = blue_probs
+        red_team_values = red_probs
+    if unit_values.shape[0] == 0:
+        return
+
+    cells = blue_codes.astype(np.intp) * comp_count + red_codes.astype(np.intp)
+    size = comp_count * comp_count
+    strata = stats["strata"]
+    strata["units"] += np.bincount(cells, minlength=size).reshape(comp_count, comp_count)
+    strata["unit_sum"] += np.bincount(cells, weights=unit_values, minlength=size).reshape(comp_count, comp_count)
+    strata["unit_sq_sum"] += np.bincount(cells, weights=np.square(unit_values), minlength=size).reshape(comp_count, comp_count)
+
+    team_codes = np.concatenate([blue_codes, red_codes]).astype(np.intp)
+    team_values = np.concatenate([blue_team_values, red_team_values])
+    team_units = stats["team_units"]
+    team_units["units"] += np.bincount(team_codes, minlength=comp_count)
+    team_units["unit_sum"] += np.bincount(team_codes, weights=team_values, minlength=comp_count)
+    team_units["unit_sq_sum"] += np.bincount(team_codes, weights=np.square(team_values), minlength=comp_count)
+
+    # Each unit credits its stratum once per composition it contains; a mirror
+    # unit counts once, with the mean of both teams' values.
+    mirror = blue_codes == red_codes
+    credited_codes = np.concatenate([blue_codes, red_codes[~mirror]]).astype(np.intp)
+    credited_cells = np.concatenate([cells, cells[~mirror]])
+    credited_values = np.concatenate([
+        np.where(mirror, (blue_team_values + red_team_values) / 2.0, blue_team_values),
+        red_team_values[~mirror]
+    ])
+    index = credited_codes * size + credited_cells
+    shape = (comp_count, comp_count, comp_count)
+    comp_strata = stats["composition_strata"]
+    comp_strata["units"] += np.bincount(index, minlength=comp_count * size).reshape(shape)
+    comp_strata["unit_sum"] += np.bincount(index, weights=credited_values, minlength=comp_count * size).reshape(shape)
+    comp_strata["unit_sq_sum"] += np.bincount(index, weights=np.square(credited_values), minlength=comp_count * size).reshape(shape)
+
+
 def _merge_stats(target: Dict[str, Any], source: Dict[str, Any]) -> None:
     scalar_keys = [
         "total_games",
@@ -155,56 +447,15 @@ def _merge_stats(target: Dict[str, Any], source: Dict[str, Any]) -> None:
     ]
     for key in scalar_keys:
         target[key] += source.get(key, 0)
-
-    for matchup_key, entry in source.get("matchups", {}).items():
-        dest_entry = target["matchups"].setdefault(matchup_key, {
-            "games": 0,
-            "blue_win_prob_sum": 0.0,
-            "blue_win_prob_sq_sum": 0.0,
-            "red_win_prob_sum": 0.0,
-            "red_win_prob_sq_sum": 0.0,
-            "blue_pred_wins": 0,
-            "favored_counts": {"blue": 0, "red": 0}
-        })
-        dest_entry["games"] += entry["games"]
-        dest_entry["blue_win_prob_sum"] += entry["blue_win_prob_sum"]
-        dest_entry["blue_win_prob_sq_sum"] += entry["blue_win_prob_sq_sum"]
-        dest_entry["red_win_prob_sum"] += entry["red_win_prob_sum"]
-        dest_entry["red_win_prob_sq_sum"] += entry["red_win_prob_sq_sum"]
-        dest_entry["blue_pred_wins"] += entry["blue_pred_wins"]
-        for color in ("blue", "red"):
-            dest_entry["favored_counts"][color] += entry["favored_counts"].get(color, 0)
-
-    for comp_key, entry in source.get("composition_totals", {}).items():
-        dest_entry = target["composition_totals"].setdefault(comp_key, {
-            "games": 0,
-            "blue_prob_sum": 0.0,
-            "blue_prob_sq_sum": 0.0
-        })
-        dest_entry["games"] += entry["games"]
-        dest_entry["blue_prob_sum"] += entry["blue_prob_sum"]
-        dest_entry["blue_prob_sq_sum"] += entry["blue_prob_sq_sum"]
+    for group in STAT_GROUPS:
+        for key, values in source.get(group, {}).items():
+            target[group][key] += values
 
 
-def _apply_training_payload(trainer: Optional[SimulationTrainer], payload: Optional[List[Dict[str, Any]]]) -> None:
+def _apply_training_payload(trainer: Optional[SimulationTrainer], payload: Optional[Dict[str, np.ndarray]]) -> None:
     if trainer is None or not payload:
         return
-    for sample in payload:
-        stub_result = SimpleNamespace(blue_win_probability=sample["blue_prob"])
-        trainer.process_game(sample["blue_team"], sample["red_team"], stub_result)
-
-
-def _split_chunk_sizes(total: int, workers: int) -> List[int]:
-    if workers <= 1 or total <= 0:
-        return [max(total, 0)]
-    base = total // workers
-    remainder = total % workers
-    sizes = []
-    for i in range(workers):
-        part = base + (1 if i < remainder else 0)
-        if part > 0:
-            sizes.append(part)
-    return sizes
+    trainer.fit_batch(payload["diffs"], payload["blue_probs"])
 
 
 def load_champion_data() -> Dict:
@@ -225,6 +476,160 @@ def _compute_mean_and_margin(sum_val: float, sum_sq: float, n: int, confidence:
     return mean, z * std_error
 
 
+def _stratified_mean_and_margin(
+    units: np.ndarray,
+    unit_sum: np.ndarray,
+    unit_sq_sum: np.ndarray,
+    weights: np.ndarray,
+    confidence: float
+) -> Tuple[float, float | None]:
+    """Stratified estimator: sum_h W_h * mean_h with variance sum_h W_h^2 * s_h^2 / n_h."""
+    units = units.ravel().astype(np.float64)
+    unit_sum = unit_sum.ravel()
+    unit_sq_sum = unit_sq_sum.ravel()
+    sampled = units > 0
+    if not sampled.any():
+        return 0.0, None
+    # Strata that were never drawn have negligible weight; renormalize over the rest.
+    stratum_weights = weights.ravel()[sampled]
+    stratum_weights = stratum_weights / stratum_weights.sum()
+    n = units[sampled]
+    stratum_means = unit_sum[sampled] / n
+    mean = float(stratum_weights @ stratum_means)
+    total = n.sum()
+    if total < 2:
+        return mean, None
+    # Strata with a single unit borrow the pooled variance.
+    pooled = max((unit_sq_sum.sum() - unit_sum.sum() ** 2 / total) / (total - 1), 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        within = (unit_sq_sum[sampled] - unit_sum[sampled] ** 2 / n) / (n - 1)
+    stratum_variance = np.where(n >= 2, np.maximum(within, 0.0), pooled)
+    variance = float(np.sum(np.square(stratum_weights) * stratum_variance / n))
+    z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+    return mean, z * math.sqrt(variance)
+
+
+def _overall_mean_and_margin(
+    stats: Dict[str, Any],
+    confidence: float,
+    design: Optional[Dict[str, Any]] = None
+) -> Tuple[float, float | None]:
+    """Overall blue win rate and CI half-width using the estimator that matches the sampling design."""
+    antithetic = bool(design and design.get("antithetic"))
+    strata_weights = design.get("strata_weights") if design else None
+    if strata_weights is not None:
+        strata = stats["strata"]
+        return _stratified_mean_and_margin(
+            strata["units"], strata["unit_sum"], strata["unit_sq_sum"], np.asarray(strata_weights), confidence
+        )
+    if antithetic:
+        strata = stats["strata"]
+        return _compute_mean_and_margin(
+            float(strata["unit_sum"].sum()), float(strata["unit_sq_sum"].sum()), int(strata["units"].sum()), confidence
+        )
+    return _compute_mean_and_margin(
+        stats["blue_win_prob_sum"],
+        stats["blue_win_prob_sq_sum"],
+        stats["total_games"],
+        confidence
+    )
+
+
+def _composition_appearances() -> np.ndarray:
+    """(K, K, K) teams of each composition per game in cell [blue, red] (2 in mirror cells)."""
+    codes = np.arange(len(COMPOSITION_TYPES))
+    return (
+        (codes[:, None, None] == codes[None, :, None]).astype(np.float64)
+        + (codes[:, None, None] == codes[None, None, :])
+    )
+
+
+def _stratified_composition_estimate(
+    stats: Dict[str, Any],
+    code: int,
+    strata_weights: np.ndarray,
+    confidence: float
+) -> Tuple[float, float | None, float]:
+    """Population-weighted (mean, CI half-width, appearances per game) for one composition.
+
+    Each cell's mean is weighted by its population share times how many of the
+    composition's teams a game in that cell holds, so the adaptive allocation
+    does not leak into the estimate.
+    """
+    weights = np.asarray(strata_weights) * _composition_appearances()[code]
+    comp_strata = stats["composition_strata"]
+    mean, margin = _stratified_mean_and_margin(
+        comp_strata["units"][code], comp_strata["unit_sum"][code], comp_strata["unit_sq_sum"][code], weights, confidence
+    )
+    return mean, margin, float(weights.sum())
+
+
+def _stratified_average_confidence(stats: Dict[str, Any], strata_weights: np.ndarray) -> float:
+    """Mean model confidence with each cell weighted by its population share."""
+    games = stats["matchups"]["games"].astype(np.float64)
+    sampled = games > 0
+    if not sampled.any():
+        return 0.0
+    weights = np.asarray(strata_weights)[sampled]
+    cell_means = stats["matchups"]["confidence_sum"][sampled] / games[sampled]
+    return float(weights @ cell_means / weights.sum())
+
+
+def _cell_blue_margins(
+    stats: Dict[str, Any],
+    confidence: float,
+    design: Optional[Dict[str, Any]] = None
+) -> np.ndarray:
+    """(K, K) blue-win CI half-widths exactly as `summarize` reports them (inf if undefined)."""
+    comp_count = len(COMPOSITION_TYPES)
+    antithetic = bool(design and design.get("antithetic"))
+    matchups = stats["matchups"]
+    strata = stats["strata"]
+    margins = np.full((comp_count, comp_count), np.inf)
+    for cell in np.ndindex(comp_count, comp_count):
+        if antithetic and cell[0] == cell[1]:
+            _, margin = _compute_mean_and_margin(
+                float(strata["unit_sum"][cell]), float(strata["unit_sq_sum"][cell]), int(strata["units"][cell]), confidence
+            )
+        else:
+            _, margin = _compute_mean_and_margin(
+                float(matchups["blue_win_prob_sum"][cell]),
+                float(matchups["blue_win_prob_sq_sum"][cell]),
+                int(matchups["games"][cell]),
+                confidence
+            )
+        if margin is not None:
+            margins[cell] = margin
+    return margins
+
+
+def _adaptive_allocation(
+    stats: Dict[str, Any],
+    confidence: float,
+    cell_target_margin: float,
+    population_weights: np.ndarray
+) -> np.ndarray:
+    """Allocation weights proportional to each cell's remaining games to reach the target margin."""
+    matchups = stats["matchups"]
+    games = matchups["games"].astype(np.float64)
+    total = float(games.sum())
+    pooled = 0.25
+    if total >= 2:
+        sums = float(matchups["blue_win_prob_sum"].sum())
+        pooled = max((float(matchups["blue_win_prob_sq_sum"].sum()) - sums * sums / total) / (total - 1), 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = (matchups["blue_win_prob_sq_sum"] - matchups["blue_win_prob_sum"] ** 2 / games) / (games - 1)
+    variance = np.where(games >= 2, np.maximum(variance, 0.0), pooled)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+    required = variance * (z / cell_target_margin) ** 2
+    deficit = np.maximum(required - games, 0.0)
+    deficit = np.maximum(deficit, ADAPTIVE_MIN_CELL_GAMES - games)
+    deficit[population_weights <= 0] = 0.0
+    if deficit.sum() <= 0:
+        return population_weights
+    return deficit / deficit.sum()
+
+
 def build_role_pools(champion_data: Dict) -> Dict[str, List[str]]:
     assignments = champion_data.get("assignments", {})
     pools: Dict[str, List[str]] = {role: [] for role in ROLE_ORDER}
@@ -265,6 +670,71 @@ def team_list_to_position_dict(team: List[str]) -> Dict[str, str]:
     return {ROLE_TO_POSITION[role]: champ for role, champ in zip(ROLE_ORDER, team)}
 
 
+def build_training_diff_builder(
+    champion_names: List[str],
+    champion_data: Dict,
+    feature_names: List[str]
+) -> TeamFeatureMatrixBuilder:
+    """Builder for SimulationTrainer rows over ``champion_names`` (ROLE_ORDER columns)."""
+    # Trainer features are blue-minus-red extract_features_from_team vectors, which
+    # is exactly the "team_" block of the match features the builder produces.
+    return TeamFeatureMatrixBuilder(
+        champion_names,
+        [ROLE_TO_POSITION[role] for role in ROLE_ORDER],
+        champion_data,
+        {},
+        [f"team_{name}" for name in feature_names]
+    )
+
+
+def _task_seed(seed: int, task_index: int) -> int:
+    """Seed for one simulation task, independent of scheduling order."""
+    return int(np.random.SeedSequence([seed, task_index]).generate_state(1, np.uint64)[0])
+
+
+def save_resume_state(
+    path: Path,
+    stats: Dict[str, Any],
+    meta: Dict[str, Any],
+    trainer_state: Optional[Dict[str, Any]] = None
+) -> None:
+    """Atomically write raw accumulators, run bookkeeping and trainer state to one .npz file."""
+    arrays = {
+        "total_games": np.array(stats["total_games"], dtype=np.int64),
+        "scalar_sums": np.array([stats[key] for key in RESUME_SCALAR_KEYS], dtype=np.float64),
+        "meta": np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8),
+        "trainer": np.frombuffer(pickle.dumps(trainer_state), dtype=np.uint8)
+    }
+    for group in STAT_GROUPS:
+        for key, values in stats[group].items():
+            arrays[f"{group}__{key}"] = values
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, path)
+
+
+def load_resume_state(path: Path) -> Tuple[Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]:
+    stats = _create_empty_stats()
+    with np.load(path) as data:
+        stats["total_games"] = int(data["total_games"])
+        for key, value in zip(RESUME_SCALAR_KEYS, data["scalar_sums"].tolist()):
+            stats[key] = value
+        for group in STAT_GROUPS:
+            for key in stats[group]:
+                stats[group][key] = data[f"{group}__{key}"].copy()
+        meta = json.loads(data["meta"].tobytes().decode("utf-8"))
+        trainer_state = pickle.loads(data["trainer"].tobytes())
+    return stats, meta, trainer_state
+
+
+def _dump_model_snapshot(snapshot: Dict[str, Any], snapshot_path: Path) -> str:
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(snapshot, snapshot_path)
+    return str(snapshot_path)
+
+
 class SimulationTrainer:
     def __init__(
         self,
@@ -281,6 +751,7 @@ class SimulationTrainer:
         self.model_path = model_path
         self.report_path = report_path
         self.rng = rng
+        self.np_rng = np.random.default_rng(rng.getrandbits(64))
         self.model = SGDClassifier(loss="log_loss", penalty="l2", alpha=1e-4, random_state=42)
         self.classes = np.array([0, 1], dtype=int)
         self._initialized = False
@@ -290,38 +761,62 @@ class SimulationTrainer:
         self.ensemble_prob_sum = 0.0
         self.calibration_loss = 0.0
         self.brier_sum = 0.0
-
-    def _vectorize(self, team: Dict[str, str]) -> List[float]:
-        features = extract_features_from_team(team, self.champion_data)
-        return features_to_vector(features, self.feature_names)
-
-    def process_game(self, blue_team_list: List[str], red_team_list: List[str], result: PredictionResult) -> None:
-        if self.sample_rate == 0.0 or self.rng.random() > self.sample_rate:
+        self.diff_builder = build_training_diff_builder(
+            list(champion_data.get("assignments", {})),
+            champion_data,
+            feature_names
+        )
+        self._row_maps: Dict[Tuple[str, ...], np.ndarray] = {}
+
+    def _champion_rows(self, champion_names: List[str]) -> np.ndarray:
+        key = tuple(champion_names)
+        rows = self._row_maps.get(key)
+        if rows is None:
+            rows = self.diff_builder.champion_indices([champion_names])[0]
+            self._row_maps[key] = rows
+        return rows
+
+    def feature_diffs(self, blue_indices: np.ndarray, red_indices: np.ndarray, champion_names: List[str]) -> np.ndarray:
+        """Blue-minus-red trainer feature rows for index-encoded teams (ROLE_ORDER columns)."""
+        rows = self._champion_rows(champion_names)
+        return self.diff_builder.build(rows[blue_indices], rows[red_indices])
+
+    def fit_batch(self, diffs: np.ndarray, blue_probs: np.ndarray) -> None:
+        """Draw labels from ``blue_probs`` and fit the whole batch with one partial_fit."""
+        blue_probs = np.asarray(blue_probs, dtype=np.float64)
+        if blue_probs.shape[0] == 0:
             return
-
-        blue_team = team_list_to_position_dict(blue_team_list)
-        red_team = team_list_to_position_dict(red_team_list)
-        blue_vec = self._vectorize(blue_team)
-        red_vec = self._vectorize(red_team)
-        diff = np.array([[b - r for b, r in zip(blue_vec, red_vec)]], dtype=float)
-
-        blue_prob = float(result.blue_win_probability)
-        label = 1 if self.rng.random() < blue_prob else 0
-        y = np.array([label], dtype=int)
+        labels = (self.np_rng.random(blue_probs.shape[0]) < blue_probs).astype(int)
 
         if not self._initialized:
-            self.model.partial_fit(diff, y, classes=self.classes)
+            self.model.partial_fit(diffs, labels, classes=self.classes)
             self._initialized = True
         else:
-            self.model.partial_fit(diff, y)
+            self.model.partial_fit(diffs, labels)
 
-        pred_prob = float(self.model.predict_proba(diff)[0][1])
-        self.samples += 1
-        self.label_sum += label
-        self.pred_sum += pred_prob
-        self.ensemble_prob_sum += blue_prob
-        self.calibration_loss += (pred_prob - blue_prob) ** 2
-        self.brier_sum += (pred_prob - label) ** 2
+        pred_probs = self.model.predict_proba(diffs)[:, 1]
+        self.samples += int(labels.shape[0])
+        self.label_sum += float(labels.sum())
+        self.pred_sum += float(pred_probs.sum())
+        self.ensemble_prob_sum += float(blue_probs.sum())
+        self.calibration_loss += float(np.square(pred_probs - blue_probs).sum())
+        self.brier_sum += float(np.square(pred_probs - labels).sum())
+
+    def process_batch(
+        self,
+        blue_indices: np.ndarray,
+        red_indices: np.ndarray,
+        blue_probs: np.ndarray,
+        champion_names: List[str]
+    ) -> None:
+        """Subsample a batch of simulated games at ``sample_rate`` and train on the kept rows."""
+        if self.sample_rate == 0.0 or blue_indices.shape[0] == 0:
+            return
+        keep = self.np_rng.random(blue_indices.shape[0]) <= self.sample_rate
+        if not keep.any():
+            return
+        diffs = self.feature_diffs(blue_indices[keep], red_indices[keep], champion_names)
+        self.fit_batch(diffs, np.asarray(blue_probs)[keep])
 
     def _build_report(self) -> Dict:
         return {
@@ -339,15 +834,41 @@ class SimulationTrainer:
             return None
         return self._build_report()
 
-    def snapshot_model(self, snapshot_path: Path) -> Optional[str]:
+    def model_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Detached copy of the current model that another thread can dump."""
         if not self._initialized:
             return None
-        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
-        joblib.dump({
-            "model": self.model,
-            "feature_names": self.feature_names
-        }, snapshot_path)
-        return str(snapshot_path)
+        return {
+            "model": copy.deepcopy(self.model),
+            "feature_names": list(self.feature_names)
+        }
+
+    def get_state(self) -> Dict[str, Any]:
+        """Everything needed to continue training bit-for-bit after a restart."""
+        return {
+            "model": copy.deepcopy(self.model) if self._initialized else None,
+            "rng_state": copy.deepcopy(self.np_rng.bit_generator.state),
+            "samples": self.samples,
+            "label_sum": self.label_sum,
+            "pred_sum": self.pred_sum,
+            "ensemble_prob_sum": self.ensemble_prob_sum,
+            "calibration_loss": self.calibration_loss,
+            "brier_sum": self.brier_sum
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        if state["model"] is not None:
+            self.model = state["model"]
+            self._initialized = True
+        self.np_rng.bit_generator.state = state["rng_state"]
+        for key in ("samples", "label_sum", "pred_sum", "ensemble_prob_sum", "calibration_loss", "brier_sum"):
+            setattr(self, key, state[key])
+
+    def snapshot_model(self, snapshot_path: Path) -> Optional[str]:
+        snapshot = self.model_snapshot()
+        if snapshot is None:
+            return None
+        return _dump_model_snapshot(snapshot, snapshot_path)
 
     def finalize(self) -> Dict:
         if self.samples == 0:
@@ -402,6 +923,122 @@ def _infer_composition_type(champions: List[str], champion_data: Dict) -> str:
     return "mixed"
 
 
+COMPOSITION_FLAG_COLUMNS = ["dive", "artillery", "ranged", "tank", "marksman", "enchanter", "bruiser"]
+
+
+def build_composition_flag_table(champion_names: List[str], champion_data: Dict) -> np.ndarray:
+    """Per-champion 0/1 flags (COMPOSITION_FLAG_COLUMNS) used by `classify_compositions`."""
+    assignments = champion_data.get("assignments", {})
+    table = np.zeros((len(champion_names), len(COMPOSITION_FLAG_COLUMNS)), dtype=np.int8)
+    for row, champion in enumerate(champion_names):
+        info = assignments.get(champion, {})
+        archetype = info.get("primary_archetype") or ""
+        attrs = info.get("archetype_attributes")
+        if attrs is None:
+            attrs = info.get("attributes", [])
+        table[row] = [
+            "diver" in archetype or "assassin" in archetype,
+            archetype == "artillery_mage",
+            any(attr.startswith("range_") for attr in attrs or []),
+            "tank" in archetype or "warden" in archetype,
+            archetype == "marksman",
+            archetype == "enchanter",
+            "skirmisher" in archetype or "juggernaut" in archetype
+        ]
+    return table
+
+
+def classify_compositions(flag_table: np.ndarray, teams: np.ndarray) -> np.ndarray:
+    """Vectorized `_infer_composition_type` for an (N, 5) champion index array.
+
+    Returns COMPOSITION_CODES as an int8 array of length N.
+    """
+    counts = flag_table[teams].sum(axis=1, dtype=np.int32)
+    dive, artillery, ranged, tank, marksman, enchanter, bruiser = counts.T
+    labels = np.select(
+        [
+            dive >= 2,
+            (artillery > 0) & (ranged >= 2),
+            (tank > 0) & (marksman > 0) & (enchanter > 0),
+            bruiser >= 2
+        ],
+        [
+            COMPOSITION_CODES["dive"],
+            COMPOSITION_CODES["poke"],
+            COMPOSITION_CODES["protect_the_carry"],
+            COMPOSITION_CODES["bruiser"]
+        ],
+        default=COMPOSITION_CODES["mixed"]
+    )
+    return labels.astype(np.int8)
+
+
+def estimate_composition_frequencies(
+    generator: np.random.Generator,
+    role_arrays: Dict[str, np.ndarray],
+    flag_table: np.ndarray,
+    teams: int,
+    batch_size: int = 50000
+) -> np.ndarray:
+    """Composition mix of a random team, from a pilot that only samples and classifies."""
+    counts = np.zeros(len(COMPOSITION_TYPES), dtype=np.int64)
+    remaining = teams
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        blue, _ = sample_team_indices(generator, role_arrays, ROLE_ORDER, size)
+        counts += np.bincount(classify_compositions(flag_table, blue), minlength=len(COMPOSITION_TYPES))
+        remaining -= size
+    return counts / max(teams, 1)
+
+
+def _sample_stratified_pairs(
+    generator: np.random.Generator,
+    role_arrays: Dict[str, np.ndarray],
+    flag_table: np.ndarray,
+    allocation_weights: np.ndarray,
+    units: int,
+    team_frequencies: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Draw `units` (blue, red) team pairs split across composition cells by `allocation_weights`."""
+    comp_count = len(COMPOSITION_TYPES)
+    # Systematic allocation: every cell gets floor or ceil of units * A_h.
+    cumulative = np.cumsum(allocation_weights.ravel())
+    cumulative /= cumulative[-1]
+    points = (generator.random() + np.arange(units)) / units
+    cells = np.minimum(np.searchsorted(cumulative, points, side="right"), cumulative.size - 1)
+    blue_codes = cells // comp_count
+    red_codes = cells % comp_count
+    need = np.bincount(blue_codes, minlength=comp_count) + np.bincount(red_codes, minlength=comp_count)
+
+    # Teams are i.i.d. per side, so one pool bucketed by composition serves both sides.
+    if team_frequencies is None:
+        team_frequencies = allocation_weights.sum(axis=1)
+    frequencies = np.maximum(team_frequencies, 1e-6)
+    pools: List[List[np.ndarray]] = [[] for _ in range(comp_count)]
+    have = np.zeros(comp_count, dtype=np.int64)
+    while (have < need).any():
+        deficit = np.maximum(need - have, 0)
+        draw = int(min(max(np.max(deficit / frequencies) * 1.2, 64), 1_000_000))
+        teams, _ = sample_team_indices(generator, role_arrays, ROLE_ORDER, draw)
+        codes = classify_compositions(flag_table, teams)
+        for code in np.flatnonzero(deficit):
+            matched = teams[codes == code]
+            pools[code].append(matched)
+            have[code] += matched.shape[0]
+
+    blue = np.empty((units, len(ROLE_ORDER)), dtype=np.int32)
+    red = np.empty((units, len(ROLE_ORDER)), dtype=np.int32)
+    for code in range(comp_count):
+        if need[code] == 0:
+            continue
+        pool = np.concatenate(pools[code])
+        blue_rows = np.flatnonzero(blue_codes == code)
+        red_rows = np.flatnonzero(red_codes == code)
+        blue[blue_rows] = pool[:blue_rows.size]
+        red[red_rows] = pool[blue_rows.size:blue_rows.size + red_rows.size]
+    return blue, red
+
+
 def build_team(role_pools: Dict[str, List[str]], rng: random.Random) -> List[str]:
     assignments = []
     used = set()
@@ -423,125 +1060,97 @@ def simulate_chunk(
     rng: Optional[random.Random],
     stats: Dict,
     trainer: Optional[SimulationTrainer] = None,
-    training_payload: Optional[List[Dict[str, Any]]] = None,
+    training_payload: Optional[List[Tuple[np.ndarray, np.ndarray]]] = None,
     training_sample_rate: float = 0.0,
     seed: Optional[int] = None,
     role_arrays: Optional[Dict[str, np.ndarray]] = None,
-    idx_to_champion: Optional[List[str]] = None
+    idx_to_champion: Optional[List[str]] = None,
+    feature_builder: Optional[TeamFeatureMatrixBuilder] = None,
+    composition_flags: Optional[np.ndarray] = None,
+    training_builder: Optional[TeamFeatureMatrixBuilder] = None,
+    antithetic: bool = False,
+    allocation_weights: Optional[np.ndarray] = None,
+    team_frequencies: Optional[np.ndarray] = None
 ) -> None:
     local_rng = rng if rng is not None else random.Random(seed)
     np_rng = None
     use_numpy_sampling = role_arrays is not None and idx_to_champion is not None
     if use_numpy_sampling:
         np_rng = np.random.default_rng(seed)
-    batch_vectors: List[List[float]] = []
-    batch_metadata: List[Dict[str, Any]] = []
+    if feature_builder is None:
+        feature_builder = predictor.feature_matrix_builder(
+            idx_to_champion or sorted({c for champs in role_pools.values() for c in champs}),
+            ROLE_ORDER
+        )
+    elif use_numpy_sampling and feature_builder.champion_names != list(idx_to_champion):
+        raise ValueError("feature_builder must use the same champion indices as role_arrays")
     BATCH_SIZE = min(1024, chunk_size)
-
-    def _flush_batch() -> None:
-        nonlocal batch_vectors, batch_metadata
-        if not batch_vectors:
+    champion_names = feature_builder.champion_names
+    if composition_flags is None:
+        composition_flags = build_composition_flag_table(champion_names, champion_data)
+    if allocation_weights is not None and not use_numpy_sampling:
+        raise ValueError("Stratified sampling requires role_arrays and idx_to_champion")
+    if antithetic and chunk_size % 2:
+        raise ValueError("Antithetic sampling needs an even chunk_size")
+    collect_payload = trainer is None and training_payload is not None and training_sample_rate > 0
+    if collect_payload:
+        if training_builder is None or training_builder.champion_names != champion_names:
+            raise ValueError("training_builder must use the same champion indices as feature_builder")
+        payload_rng = np.random.default_rng(local_rng.getrandbits(64))
+
+    def _flush_batch(blue_indices: np.ndarray, red_indices: np.ndarray) -> None:
+        if blue_indices.shape[0] == 0:
             return
-        blue_probs, red_probs, confidences = predictor.batch_predict_from_vectors(batch_vectors)
-        for idx, meta in enumerate(batch_metadata):
-            blue_prob = float(blue_probs[idx])
-            red_prob = float(red_probs[idx])
-            confidence = float(confidences[idx])
-            winner = "blue" if blue_prob > 0.5 else "red"
-
-            stats["total_games"] += 1
-            stats["blue_win_prob_sum"] += blue_prob
-            stats["blue_win_prob_sq_sum"] += blue_prob ** 2
-            stats["confidence_sum"] += confidence
-            stats["confidence_sq_sum"] += confidence ** 2
-
-            match_key = f"{meta['blue_comp']}__vs__{meta['red_comp']}"
-            entry = stats["matchups"].setdefault(match_key, {
-                "games": 0,
-                "blue_win_prob_sum": 0.0,
-                "blue_win_prob_sq_sum": 0.0,
-                "red_win_prob_sum": 0.0,
-                "red_win_prob_sq_sum": 0.0,
-                "blue_pred_wins": 0,
-                "favored_counts": {"blue": 0, "red": 0}
-            })
-            entry["games"] += 1
-            entry["blue_win_prob_sum"] += blue_prob
-            entry["blue_win_prob_sq_sum"] += blue_prob ** 2
-            entry["red_win_prob_sum"] += red_prob
-            entry["red_win_prob_sq_sum"] += red_prob ** 2
-            entry["blue_pred_wins"] += 1 if winner == "blue" else 0
-            entry["favored_counts"][winner] += 1
-
-            stats["composition_totals"].setdefault(meta['blue_comp'], {"games": 0, "blue_prob_sum": 0.0, "blue_prob_sq_sum": 0.0})
-            stats["composition_totals"].setdefault(meta['red_comp'], {"games": 0, "blue_prob_sum": 0.0, "blue_prob_sq_sum": 0.0})
-            stats["composition_totals"][meta['blue_comp']]["games"] += 1
-            stats["composition_totals"][meta['blue_comp']]["blue_prob_sum"] += blue_prob
-            stats["composition_totals"][meta['blue_comp']]["blue_prob_sq_sum"] += blue_prob ** 2
-            stats["composition_totals"][meta['red_comp']]["games"] += 1
-            stats["composition_totals"][meta['red_comp']]["blue_prob_sum"] += red_prob
-            stats["composition_totals"][meta['red_comp']]["blue_prob_sq_sum"] += red_prob ** 2
-
-            if trainer is not None:
-                stub_result = SimpleNamespace(
-                    blue_win_probability=blue_prob,
-                    red_win_probability=red_prob,
-                    winner=winner,
-                    confidence=confidence
-                )
-                trainer.process_game(meta["blue_team"], meta["red_team"], stub_result)
-            elif training_payload is not None and training_sample_rate > 0:
-                if local_rng.random() <= training_sample_rate:
-                    training_payload.append({
-                        "blue_team": list(meta["blue_team"]),
-                        "red_team": list(meta["red_team"]),
-                        "blue_prob": blue_prob
-                    })
-
-        batch_vectors = []
-        batch_metadata = []
+        if antithetic:
+            blue_indices, red_indices = (
+                np.concatenate([blue_indices, red_indices]),
+                np.concatenate([red_indices, blue_indices])
+            )
+        feature_matrix = feature_builder.build(blue_indices, red_indices)
+        blue_probs, red_probs, confidences = predictor.batch_predict_from_vectors(feature_matrix)
+        blue_codes = classify_compositions(composition_flags, blue_indices)
+        red_codes = classify_compositions(composition_flags, red_indices)
+        _accumulate_batch(stats, blue_codes, red_codes, blue_probs, red_probs, confidences)
+        _accumulate_units(stats, blue_codes, red_codes, blue_probs, red_probs, antithetic)
+
+        if trainer is not None:
+            trainer.process_batch(blue_indices, red_indices, blue_probs, champion_names)
+        elif collect_payload:
+            keep = payload_rng.random(blue_indices.shape[0]) <= training_sample_rate
+            if keep.any():
+                diffs = training_builder.build(blue_indices[keep], red_indices[keep])
+                training_payload.append((diffs.astype(np.float32), np.asarray(blue_probs)[keep]))
 
     remaining = chunk_size
     while remaining > 0:
         sample_size = min(BATCH_SIZE, remaining)
-        if use_numpy_sampling and np_rng is not None:
-            blue_batch, red_batch = sample_teams_numpy(np_rng, role_arrays, idx_to_champion, ROLE_ORDER, sample_size)
+        # Each antithetic unit is one draft scored from both sides.
+        units = sample_size // 2 if antithetic else sample_size
+        if allocation_weights is not None:
+            blue_indices, red_indices = _sample_stratified_pairs(
+                np_rng, role_arrays, composition_flags, allocation_weights, units, team_frequencies
+            )
+        elif use_numpy_sampling and np_rng is not None:
+            blue_indices, red_indices = sample_team_indices(np_rng, role_arrays, ROLE_ORDER, units)
         else:
-            blue_batch = [build_team(role_pools, local_rng) for _ in range(sample_size)]
-            red_batch = [build_team(role_pools, local_rng) for _ in range(sample_size)]
-        for blue_team, red_team in zip(blue_batch, red_batch):
-            feature_vector, _ = predictor.build_feature_vector(
-                blue_team,
-                ROLE_ORDER,
-                red_team,
-                ROLE_ORDER,
-                include_feature_breakdown=False
+            blue_indices = feature_builder.champion_indices(
+                [build_team(role_pools, local_rng) for _ in range(units)]
+            )
+            red_indices = feature_builder.champion_indices(
+                [build_team(role_pools, local_rng) for _ in range(units)]
             )
-            blue_comp = _infer_composition_type(blue_team, champion_data)
-            red_comp = _infer_composition_type(red_team, champion_data)
-            batch_vectors.append(feature_vector)
-            batch_metadata.append({
-                "blue_team": list(blue_team),
-                "red_team": list(red_team),
-                "blue_comp": blue_comp,
-                "red_comp": red_comp
-            })
-            if len(batch_vectors) >= BATCH_SIZE:
-                _flush_batch()
+        _flush_batch(blue_indices, red_indices)
         remaining -= sample_size
 
-    _flush_batch()
 
-
-def summarize(stats: Dict, top_k: int, confidence: float) -> Dict:
+def summarize(stats: Dict, top_k: int, confidence: float, design: Optional[Dict[str, Any]] = None) -> Dict:
     total_games = stats["total_games"]
+    antithetic = bool(design and design.get("antithetic"))
+    strata_weights = design.get("strata_weights") if design else None
     avg_confidence = stats["confidence_sum"] / total_games if total_games else 0.0
-    avg_blue, overall_margin = _compute_mean_and_margin(
-        stats["blue_win_prob_sum"],
-        stats["blue_win_prob_sq_sum"],
-        total_games,
-        confidence
-    )
+    if strata_weights is not None:
+        avg_confidence = _stratified_average_confidence(stats, strata_weights)
+    avg_blue, overall_margin = _overall_mean_and_margin(stats, confidence, design)
     overall = {
         "total_games": total_games,
         "avg_blue_win_probability": avg_blue,
@@ -552,15 +1161,26 @@ def summarize(stats: Dict, top_k: int, confidence: float) -> Dict:
 
     matchup_summaries = []
     raw_matchups = {}
-    for key, entry in stats["matchups"].items():
-        blue_comp, red_comp = key.split("__vs__")
-        games = entry["games"]
+    matchups = stats["matchups"]
+    for blue_code, red_code in zip(*np.nonzero(matchups["games"])):
+        blue_comp = COMPOSITION_TYPES[blue_code]
+        red_comp = COMPOSITION_TYPES[red_code]
+        cell = (blue_code, red_code)
+        games = int(matchups["games"][cell])
+        blue_wins = int(matchups["blue_pred_wins"][cell])
         blue_avg, blue_margin = _compute_mean_and_margin(
-            entry["blue_win_prob_sum"], entry["blue_win_prob_sq_sum"], games, confidence
+            float(matchups["blue_win_prob_sum"][cell]), float(matchups["blue_win_prob_sq_sum"][cell]), games, confidence
         )
         red_avg, red_margin = _compute_mean_and_margin(
-            entry["red_win_prob_sum"], entry["red_win_prob_sq_sum"], games, confidence
+            float(matchups["red_win_prob_sum"][cell]), float(matchups["red_win_prob_sq_sum"][cell]), games, confidence
         )
+        if antithetic and blue_code == red_code:
+            # Both games of a mirror-composition pair land here; the pair is the unit.
+            strata = stats["strata"]
+            _, blue_margin = _compute_mean_and_margin(
+                float(strata["unit_sum"][cell]), float(strata["unit_sq_sum"][cell]), int(strata["units"][cell]), confidence
+            )
+            red_margin = blue_margin
         matchup_summaries.append({
             "blue_comp": blue_comp,
             "red_comp": red_comp,
@@ -569,10 +1189,10 @@ def summarize(stats: Dict, top_k: int, confidence: float) -> Dict:
             "avg_red_win_prob": red_avg,
             "blue_ci_half_width": blue_margin,
             "red_ci_half_width": red_margin,
-            "blue_pred_win_rate": entry["blue_pred_wins"] / games,
-            "blue_favored_fraction": entry["favored_counts"].get("blue", 0) / games
+            "blue_pred_win_rate": blue_wins / games,
+            "blue_favored_fraction": blue_wins / games
         })
-        raw_matchups[key] = {
+        raw_matchups[f"{blue_comp}__vs__{red_comp}"] = {
             "blue_comp": blue_comp,
             "red_comp": red_comp,
             "games": games,
@@ -580,9 +1200,9 @@ def summarize(stats: Dict, top_k: int, confidence: float) -> Dict:
             "avg_red_win_prob": red_avg,
             "blue_ci_half_width": blue_margin,
             "red_ci_half_width": red_margin,
-            "blue_pred_win_rate": entry["blue_pred_wins"] / games,
-            "favored_blue": entry["favored_counts"].get("blue", 0),
-            "favored_red": entry["favored_counts"].get("red", 0)
+            "blue_pred_win_rate": blue_wins / games,
+            "favored_blue": blue_wins,
+            "favored_red": games - blue_wins
         }
 
     matchup_summaries.sort(key=lambda m: m["avg_blue_win_prob"], reverse=True)
@@ -591,18 +1211,32 @@ def summarize(stats: Dict, top_k: int, confidence: float) -> Dict:
 
     comp_totals = []
     raw_compositions = {}
-    for comp, entry in stats["composition_totals"].items():
+    totals = stats["composition_totals"]
+    for code in np.flatnonzero(totals["games"]):
+        comp = COMPOSITION_TYPES[code]
+        games = int(totals["games"][code])
         blue_avg, blue_margin = _compute_mean_and_margin(
-            entry["blue_prob_sum"], entry["blue_prob_sq_sum"], entry["games"], confidence
+            float(totals["blue_prob_sum"][code]), float(totals["blue_prob_sq_sum"][code]), games, confidence
         )
+        if strata_weights is not None:
+            # Stratified runs (adaptive ones especially) oversample some cells, so
+            # reweight by population and report the population-equivalent game count.
+            blue_avg, blue_margin, appearances = _stratified_composition_estimate(stats, code, strata_weights, confidence)
+            games = int(round(total_games * appearances))
+        elif antithetic:
+            # A team's blue and red appearances are correlated; average them per team.
+            team_units = stats["team_units"]
+            _, blue_margin = _compute_mean_and_margin(
+                float(team_units["unit_sum"][code]), float(team_units["unit_sq_sum"][code]), int(team_units["units"][code]), confidence
+            )
         comp_totals.append({
             "composition": comp,
-            "games": entry["games"],
+            "games": games,
             "avg_blue_probability": blue_avg,
             "ci_half_width": blue_margin
         })
         raw_compositions[comp] = {
-            "games": entry["games"],
+            "games": games,
             "avg_blue_probability": blue_avg,
             "ci_half_width": blue_margin
         }
@@ -646,12 +1280,10 @@ def _write_summary_file(
     if extra_metadata:
         metadata.update(extra_metadata)
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump({
-            "metadata": metadata,
-            "summary": summary
-        }, f, indent=2)
+    write_simulation_payload(output_path, {
+        "metadata": metadata,
+        "summary": summary
+    })
 
 
 def main():
@@ -660,6 +1292,9 @@ def main():
     parser.add_argument("--max-games", type=int, help="Hard ceiling when using --target-margin; defaults to --games")
     parser.add_argument("--chunk-size", type=int, default=5000, help="Games per progress chunk")
     parser.add_argument("--workers", type=int, default=1, help="Number of worker threads for simulation (predictor shared in-process)")
+    parser.add_argument("--max-in-flight", type=int, help="Simulation tasks queued or running at once when --workers > 1 (default: 2x workers)")
+    parser.add_argument("--worker-state", choices=["shared", "reload"], default="shared", help="How worker processes get lookup tables: memory-map the parent's copy (shared) or rebuild them from the data files (reload)")
+    parser.add_argument("--inference-backend", choices=INFERENCE_BACKENDS, default="compiled", help="Score drafts with the pickled sklearn models or their compiled flat-array equivalents")
     parser.add_argument("--progress-interval", type=int, default=5000, help="How many simulated games between heartbeat logs (0 disables)")
     parser.add_argument("--seed", type=int, default=42, help="Random seed")
     parser.add_argument("--top-k", type=int, default=15, help="Number of matchup rows to keep per extremity")
@@ -672,7 +1307,15 @@ def main():
     parser.add_argument("--checkpoint-ci-step", type=float, help="Save a checkpoint whenever the CI half-width improves by at least this amount (e.g., 0.01 for ±1pp)")
     parser.add_argument("--checkpoint-ci-decimals", type=int, help="Save a checkpoint whenever the CI half-width (percentage) decreases when rounded to this many decimals")
     parser.add_argument("--checkpoint-min-games", type=int, default=0, help="Minimum completed games before checkpointing can trigger")
+    parser.add_argument("--sampling", choices=SAMPLING_MODES, default="iid", help="iid drafts, or antithetic pairs that score every draft from both sides")
+    parser.add_argument("--stratify", action="store_true", help="Allocate drafts proportionally across composition-matchup cells and use stratified CI estimates")
+    parser.add_argument("--allocation", choices=ALLOCATION_MODES, default="proportional", help="Split drafts across composition-matchup cells by population share, or adaptively toward cells whose CI is still wider than --cell-target-margin (implies --stratify)")
+    parser.add_argument("--cell-target-margin", type=float, help="Per-matchup blue WR CI half-width that --allocation adaptive aims for; the run stops once every cell reaches it")
+    parser.add_argument("--strata-pilot-teams", type=int, default=400000, help="Teams classified (not scored) to estimate composition frequencies for --stratify")
+    parser.add_argument("--state-path", type=Path, help="Binary .npz file where resumable accumulator state is saved after every chunk")
+    parser.add_argument("--resume", action="store_true", help="Continue from the state saved at --state-path")
     parser.add_argument("--output", type=Path, default=Path("data/simulations/mass_simulation_summary.json"))
+    parser.add_argument("--output-format", choices=SUMMARY_FORMATS, default="json", help="Write the summary and checkpoints as indented JSON or columnar .npz")
     args = parser.parse_args()
 
     checkpoint_flags = [args.checkpoint_ci_step, args.checkpoint_ci_decimals]
@@ -688,14 +1331,38 @@ def main():
         parser.error("Specify only one of --checkpoint-ci-step or --checkpoint-ci-decimals")
     if args.checkpoint_min_games < 0:
         parser.error("--checkpoint-min-games cannot be negative")
+    if args.max_in_flight is not None and args.max_in_flight < 1:
+        parser.error("--max-in-flight must be at least 1")
+    if args.strata_pilot_teams < 1:
+        parser.error("--strata-pilot-teams must be positive")
+    adaptive = args.allocation == "adaptive"
+    if adaptive and (args.cell_target_margin is None or args.cell_target_margin <= 0):
+        parser.error("--allocation adaptive requires a positive --cell-target-margin")
+    if args.cell_target_margin is not None and not adaptive:
+        parser.error("--cell-target-margin is only used with --allocation adaptive")
+    # Adaptive allocation oversamples some cells, so estimates must reweight by population share.
+    args.stratify = args.stratify or adaptive
+    if args.resume and args.state_path is None:
+        parser.error("--resume requires --state-path")
+    if args.resume and not args.state_path.exists():
+        parser.error(f"No resume state found at {args.state_path}")
+
+    args.output = args.output.with_suffix(f".{args.output_format}")
 
     rng = random.Random(args.seed)
     matchups_path = "data/matches/lane_duo_stats.json"
+    models_path = "data/simulations/trained_models.pkl"
     champion_data = load_champion_data()
     role_pools = build_role_pools(champion_data)
     role_arrays, idx_to_champion = build_role_pools_indices(role_pools, ROLE_ORDER)
-    predictor = load_ensemble_predictor(matchups_path=matchups_path)
+    predictor = load_ensemble_predictor(
+        models_path=models_path,
+        matchups_path=matchups_path,
+        inference_backend=args.inference_backend
+    )
     _warm_predictor(predictor, role_pools)
+    feature_builder = predictor.feature_matrix_builder(idx_to_champion, ROLE_ORDER)
+    composition_flags = build_composition_flag_table(idx_to_champion, champion_data)
     trainer: Optional[SimulationTrainer] = None
 
     if args.train_model_path:
@@ -712,11 +1379,30 @@ def main():
 
     stats = _create_empty_stats()
 
+    antithetic = args.sampling == "antithetic"
+    design: Dict[str, Any] = {"antithetic": antithetic, "strata_weights": None}
+    sampling_meta: Dict[str, Any] = {"sampling": args.sampling, "stratified": args.stratify, "allocation": args.allocation}
+    if adaptive:
+        sampling_meta["cell_target_margin"] = args.cell_target_margin
+    if args.stratify:
+        # The pilot is seeded from the run seed so resumed runs see the same weights.
+        frequencies = estimate_composition_frequencies(
+            np.random.default_rng([args.seed, 2 ** 32]), role_arrays, composition_flags, args.strata_pilot_teams
+        )
+        design["strata_weights"] = np.outer(frequencies, frequencies)
+        design["team_frequencies"] = frequencies
+        sampling_meta["composition_frequencies"] = dict(zip(COMPOSITION_TYPES, frequencies.tolist()))
+        print("Composition frequencies: " + ", ".join(f"{comp} {freq:.3f}" for comp, freq in zip(COMPOSITION_TYPES, frequencies)))
+
     chunk = max(1, args.chunk_size)
     auto_mode = args.target_margin is not None
     target_margin = args.target_margin
     max_games = args.max_games or args.games
     games_to_run = max_games if auto_mode else args.games
+    if antithetic:
+        # Antithetic drafts are scored in pairs, so every task holds an even number of games.
+        chunk += chunk % 2
+        games_to_run += games_to_run % 2
     checkpoint_enabled = args.checkpoint_dir is not None
     checkpoint_dir = args.checkpoint_dir
     checkpoint_ci_step = args.checkpoint_ci_step
@@ -732,10 +1418,77 @@ def main():
     start_time = time.perf_counter()
 
     workers = max(1, args.workers)
+    max_in_flight = max(1, args.max_in_flight or workers * 2)
+    # Task seeds depend only on (seed, task index) and results are merged in task
+    # order, so a run is reproducible for a given chunk size and worker count.
+    task_size = chunk if workers == 1 else max(1, math.ceil(chunk / workers))
+    if antithetic:
+        task_size += task_size % 2
+    run_identity = {
+        "seed": args.seed,
+        "task_size": task_size,
+        "train_sample_rate": args.train_sample_rate if trainer is not None else None,
+        "sampling": args.sampling,
+        "stratified": args.stratify,
+        "allocation": args.allocation,
+        "cell_target_margin": args.cell_target_margin
+    }
+    # Adaptive allocations change once per epoch of tasks. Epoch e uses stats merged
+    # through epoch e - 2, so workers stay busy while allocations stay reproducible.
+    epoch_size = 1 if workers == 1 else max_in_flight
+    if adaptive:
+        run_identity["epoch_size"] = epoch_size
+    allocations: Dict[int, np.ndarray] = {}
+    if adaptive:
+        initial = _adaptive_allocation(stats, args.confidence, args.cell_target_margin, design["strata_weights"])
+        allocations = {0: initial, 1: initial}
+    next_task = 0
+    next_status_mark = chunk
+    if args.resume:
+        stats, resume_meta, trainer_state = load_resume_state(args.state_path)
+        saved_identity = {key: resume_meta.get(key) for key in run_identity}
+        if resume_meta.get("version") != RESUME_STATE_VERSION or saved_identity != run_identity:
+            parser.error(f"Resume state {args.state_path} was written by a different run configuration: {saved_identity}")
+        if (trainer_state is None) != (trainer is None):
+            parser.error("--train-model-path must match the run that wrote the resume state")
+        if trainer is not None:
+            trainer.load_state(trainer_state)
+        next_task = resume_meta["next_task"]
+        next_status_mark = resume_meta["next_status_mark"]
+        checkpoint_index = resume_meta["checkpoint_index"]
+        last_checkpoint_margin = resume_meta["last_checkpoint_margin"]
+        last_checkpoint_percent = resume_meta["last_checkpoint_percent"]
+        if adaptive:
+            allocations = {int(epoch): np.asarray(weights) for epoch, weights in resume_meta["allocations"].items()}
+        if next_progress_mark is not None:
+            next_progress_mark = (stats["total_games"] // progress_interval + 1) * progress_interval
+        print(f"Resuming from {args.state_path} at {stats['total_games']:,} games (task {next_task:,}).")
+    start_games = stats["total_games"]
+
     executor: Optional[ProcessPoolExecutor] = None
+    shared_state: Optional[tempfile.TemporaryDirectory] = None
+    shared_state_dir: Optional[str] = None
+    collect_training = trainer is not None and args.train_sample_rate > 0
     if workers > 1:
+        if args.worker_state == "shared":
+            shared_state = tempfile.TemporaryDirectory(prefix="mass_sim_state_")
+            shared_state_dir = shared_state.name
+            export_shared_worker_state(
+                Path(shared_state_dir),
+                predictor,
+                models_path,
+                role_arrays,
+                idx_to_champion,
+                feature_builder,
+                composition_flags,
+                build_training_diff_builder(idx_to_champion, champion_data, trainer.feature_names) if collect_training else None
+            )
         executor = ProcessPoolExecutor(max_workers=workers)
-    collect_training = trainer is not None and args.train_sample_rate > 0
+
+    def _cells_at_target() -> Tuple[int, int]:
+        margins = _cell_blue_margins(stats, args.confidence, design)
+        relied_on = design["strata_weights"] > 0
+        return int((margins[relied_on] <= args.cell_target_margin).sum()), int(relied_on.sum())
 
     def _format_progress_status(current_margin: Optional[float], include_heartbeat: bool = False) -> str:
         status = f"Simulated {stats['total_games']:,}/{games_to_run:,} games"
@@ -743,11 +1496,14 @@ def main():
             status += f" | current ±{current_margin * 100:.2f}%"
             if auto_mode and target_margin is not None:
                 status += f" (target ±{target_margin * 100:.2f}%)"
+        if adaptive:
+            reached, cells = _cells_at_target()
+            status += f" | cells at ±{args.cell_target_margin * 100:.2f}%: {reached}/{cells}"
         if include_heartbeat and progress_interval:
             status += f" | progress heartbeat every {progress_interval:,} games"
         elapsed = time.perf_counter() - start_time
-        if stats["total_games"] > 0 and elapsed > 0:
-            speed = stats["total_games"] / elapsed
+        if stats["total_games"] > start_games and elapsed > 0:
+            speed = (stats["total_games"] - start_games) / elapsed
             status += f" | speed {speed:,.1f} games/s"
             remaining = max(games_to_run - stats["total_games"], 0)
             eta_seconds = (remaining / speed) if speed > 0 else None
@@ -761,140 +1517,247 @@ def main():
         if not progress_interval or next_progress_mark is None:
             return
         while stats["total_games"] >= next_progress_mark:
-            _, current_margin = _compute_mean_and_margin(
-                stats["blue_win_prob_sum"],
-                stats["blue_win_prob_sq_sum"],
-                stats["total_games"],
-                args.confidence
-            )
+            _, current_margin = _overall_mean_and_margin(stats, args.confidence, design)
             status = _format_progress_status(current_margin, include_heartbeat=True)
             print(status + "...", flush=True)
             next_progress_mark += progress_interval
 
+    def _write_checkpoint(
+        index: int,
+        snapshot: Dict[str, Any],
+        current_margin: float,
+        extra_meta: Dict[str, Any],
+        partial_report: Optional[Dict],
+        model_snapshot: Optional[Dict[str, Any]]
+    ) -> None:
+        try:
+            checkpoint_summary = summarize(snapshot, args.top_k, args.confidence, design)
+            _write_summary_file(
+                checkpoint_dir / f"checkpoint_{index:04d}.{args.output_format}",
+                checkpoint_summary,
+                snapshot,
+                args,
+                games_to_run,
+                auto_mode,
+                target_margin,
+                current_margin,
+                partial_report,
+                interrupted=False,
+                extra_metadata=extra_meta
+            )
+            if model_snapshot is not None and args.train_model_path is not None:
+                snapshot_name = f"checkpoint_{index:04d}_{args.train_model_path.name}"
+                _dump_model_snapshot(model_snapshot, checkpoint_dir / snapshot_name)
+        except Exception as exc:
+            print(f"Warning: failed to write checkpoint {index}: {exc}", flush=True)
+
+    def _maybe_checkpoint(current_margin: Optional[float]) -> None:
+        nonlocal checkpoint_index, last_checkpoint_margin, last_checkpoint_percent
+        if (
+            not checkpoint_enabled
+            or current_margin is None
+            or stats["total_games"] < checkpoint_min_games
+        ):
+            return
+        should_checkpoint = False
+        current_margin_percent = None
+        if checkpoint_ci_step is not None:
+            if last_checkpoint_margin is None:
+                should_checkpoint = True
+            elif (last_checkpoint_margin - current_margin) >= checkpoint_ci_step:
+                should_checkpoint = True
+        elif checkpoint_ci_decimals is not None:
+            current_margin_percent = round(current_margin * 100, checkpoint_ci_decimals)
+            epsilon = 10 ** (-(checkpoint_ci_decimals + 2))
+            if last_checkpoint_percent is None:
+                should_checkpoint = True
+            elif current_margin_percent + epsilon < last_checkpoint_percent:
+                should_checkpoint = True
+
+        if not should_checkpoint:
+            return
+        checkpoint_index += 1
+        # Snapshot on this thread; summarizing and file I/O happen on the writer thread.
+        snapshot = _create_empty_stats()
+        _merge_stats(snapshot, stats)
+        extra_meta = {
+            "checkpoint_index": checkpoint_index,
+            "checkpoint_games": snapshot["total_games"],
+            "checkpoint_margin": current_margin,
+            "checkpoint_margin_percent": current_margin_percent if checkpoint_ci_decimals is not None else None,
+            "checkpoint_ci_step": checkpoint_ci_step,
+            "checkpoint_ci_decimals": checkpoint_ci_decimals,
+            "checkpoint_min_games": checkpoint_min_games,
+            "checkpoint_dir": str(checkpoint_dir),
+            **sampling_meta
+        }
+        partial_report = trainer.get_partial_report() if trainer is not None else None
+        model_snapshot = trainer.model_snapshot() if trainer is not None else None
+        checkpoint_writer.submit(
+            _write_checkpoint,
+            checkpoint_index,
+            snapshot,
+            current_margin,
+            extra_meta,
+            partial_report,
+            model_snapshot
+        )
+        last_checkpoint_margin = current_margin
+        if checkpoint_ci_decimals is not None:
+            last_checkpoint_percent = current_margin_percent
+
+    def _save_state() -> None:
+        # Only full-size task prefixes can be replayed exactly on resume.
+        if args.state_path is None or stats["total_games"] != next_task * task_size:
+            return
+        snapshot = _create_empty_stats()
+        _merge_stats(snapshot, stats)
+        meta = dict(
+            run_identity,
+            version=RESUME_STATE_VERSION,
+            next_task=next_task,
+            next_status_mark=next_status_mark,
+            checkpoint_index=checkpoint_index,
+            last_checkpoint_margin=last_checkpoint_margin,
+            last_checkpoint_percent=last_checkpoint_percent,
+            allocations={str(epoch): weights.tolist() for epoch, weights in allocations.items()}
+        )
+        trainer_state = trainer.get_state() if trainer is not None else None
+
+        def _write() -> None:
+            try:
+                save_resume_state(args.state_path, snapshot, meta, trainer_state)
+            except Exception as exc:
+                print(f"Warning: failed to save resume state: {exc}", flush=True)
+
+        checkpoint_writer.submit(_write)
+
+    def _allocation_for(task_index: int) -> Optional[np.ndarray]:
+        if not adaptive:
+            return design["strata_weights"]
+        return allocations.get(task_index // epoch_size)
+
+    def _after_merge() -> bool:
+        """Report/checkpoint at chunk boundaries; return True once the target margin is met."""
+        nonlocal next_status_mark
+        if adaptive and next_task % epoch_size == 0:
+            epoch = next_task // epoch_size
+            allocations[epoch + 1] = _adaptive_allocation(stats, args.confidence, args.cell_target_margin, design["strata_weights"])
+            for stale in [e for e in allocations if e < epoch]:
+                del allocations[stale]
+        _report_progress_checkpoint()
+        _, current_margin = _overall_mean_and_margin(stats, args.confidence, design)
+        if stats["total_games"] >= next_status_mark or stats["total_games"] >= games_to_run:
+            while next_status_mark <= stats["total_games"]:
+                next_status_mark += chunk
+            status = _format_progress_status(current_margin)
+            print(status + "...", flush=True)
+            _maybe_checkpoint(current_margin)
+            _save_state()
+        if adaptive:
+            reached, cells = _cells_at_target()
+            overall_met = not auto_mode or (current_margin is not None and current_margin <= target_margin)
+            return reached == cells and overall_met
+        return auto_mode and current_margin is not None and target_margin is not None and current_margin <= target_margin
+
+    stop_message = "Target confidence margin reached; stopping early."
+    if adaptive:
+        stop_message = "Every matchup cell reached the target confidence margin; stopping early."
+    checkpoint_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint-writer")
     interrupted = False
     try:
-        while stats["total_games"] < games_to_run:
-            remaining = games_to_run - stats["total_games"]
-            size = min(chunk, remaining)
-            if executor is None:
+        if executor is None:
+            while stats["total_games"] < games_to_run:
+                size = min(task_size, games_to_run - stats["total_games"])
                 simulate_chunk(
                     size,
                     champion_data,
                     role_pools,
                     predictor,
-                    rng,
+                    None,
                     stats,
                     trainer,
                     training_payload=None,
                     training_sample_rate=0.0,
+                    seed=_task_seed(args.seed, next_task),
                     role_arrays=role_arrays,
-                    idx_to_champion=idx_to_champion
+                    idx_to_champion=idx_to_champion,
+                    feature_builder=feature_builder,
+                    composition_flags=composition_flags,
+                    antithetic=antithetic,
+                    allocation_weights=_allocation_for(next_task),
+                    team_frequencies=design.get("team_frequencies")
                 )
-                _report_progress_checkpoint()
-            else:
-                work_sizes = _split_chunk_sizes(size, workers)
-                futures = []
-                for work_size in work_sizes:
-                    seed = rng.randrange(1, 2 ** 63)
-                    training_rate = args.train_sample_rate if collect_training else 0.0
-                    futures.append(
-                        executor.submit(
-                            _simulate_chunk_process,
-                            work_size,
-                            seed,
-                            training_rate,
-                            matchups_path
-                        )
+                next_task += 1
+                if _after_merge():
+                    print(stop_message)
+                    break
+        else:
+            # Keep a bounded window of tasks in flight; completed results wait in
+            # `finished` until every earlier task has been merged. The window is
+            # measured from the oldest unmerged task, so results parked behind a
+            # slow task count against it too.
+            training_rate = args.train_sample_rate if collect_training else 0.0
+            submit_task = next_task
+            submitted_games = stats["total_games"]
+            stopping = False
+            pending: Dict[Future, int] = {}
+            finished: Dict[int, Tuple[Dict[str, Any], Optional[Dict[str, np.ndarray]]]] = {}
+            while True:
+                while (
+                    not stopping
+                    and submitted_games < games_to_run
+                    and submit_task < next_task + max_in_flight
+                    and (not adaptive or submit_task // epoch_size in allocations)
+                ):
+                    size = min(task_size, games_to_run - submitted_games)
+                    future = executor.submit(
+                        _simulate_chunk_process,
+                        size,
+                        _task_seed(args.seed, submit_task),
+                        training_rate,
+                        matchups_path,
+                        shared_state_dir,
+                        trainer.feature_names if collect_training and shared_state_dir is None else None,
+                        antithetic,
+                        _allocation_for(submit_task),
+                        design.get("team_frequencies"),
+                        args.inference_backend
                     )
-                for future in as_completed(futures):
-                    worker_stats, payload = future.result()
+                    pending[future] = submit_task
+                    submit_task += 1
+                    submitted_games += size
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task_index = pending.pop(future)
+                    if not future.cancelled() and not stopping:
+                        finished[task_index] = future.result()
+                while not stopping and next_task in finished:
+                    worker_stats, payload = finished.pop(next_task)
                     _merge_stats(stats, worker_stats)
                     if collect_training:
                         _apply_training_payload(trainer, payload)
-                    _report_progress_checkpoint()
-            _, current_margin = _compute_mean_and_margin(
-                stats["blue_win_prob_sum"],
-                stats["blue_win_prob_sq_sum"],
-                stats["total_games"],
-                args.confidence
-            )
-            status = _format_progress_status(current_margin)
-            print(status + "...", flush=True)
-
-            if (
-                checkpoint_enabled
-                and current_margin is not None
-                and stats["total_games"] >= checkpoint_min_games
-            ):
-                should_checkpoint = False
-                current_margin_percent = None
-                if checkpoint_ci_step is not None:
-                    if last_checkpoint_margin is None:
-                        should_checkpoint = True
-                    elif (last_checkpoint_margin - current_margin) >= checkpoint_ci_step:
-                        should_checkpoint = True
-                elif checkpoint_ci_decimals is not None:
-                    current_margin_percent = round(current_margin * 100, checkpoint_ci_decimals)
-                    epsilon = 10 ** (-(checkpoint_ci_decimals + 2))
-                    if last_checkpoint_percent is None:
-                        should_checkpoint = True
-                    elif current_margin_percent + epsilon < last_checkpoint_percent:
-                        should_checkpoint = True
-                else:
-                    should_checkpoint = False
-
-                if should_checkpoint:
-                    checkpoint_index += 1
-                    checkpoint_summary = summarize(stats, args.top_k, args.confidence)
-                    checkpoint_path = checkpoint_dir / f"checkpoint_{checkpoint_index:04d}.json"
-                    extra_meta = {
-                        "checkpoint_index": checkpoint_index,
-                        "checkpoint_games": stats["total_games"],
-                        "checkpoint_margin": current_margin,
-                        "checkpoint_margin_percent": current_margin_percent if checkpoint_ci_decimals is not None else None,
-                        "checkpoint_ci_step": checkpoint_ci_step,
-                        "checkpoint_ci_decimals": checkpoint_ci_decimals,
-                        "checkpoint_min_games": checkpoint_min_games,
-                        "checkpoint_dir": str(checkpoint_dir)
-                    }
-                    partial_report = trainer.get_partial_report() if trainer is not None else None
-                    _write_summary_file(
-                        checkpoint_path,
-                        checkpoint_summary,
-                        stats,
-                        args,
-                        games_to_run,
-                        auto_mode,
-                        target_margin,
-                        current_margin,
-                        partial_report,
-                        interrupted=False,
-                        extra_metadata=extra_meta
-                    )
-                    if trainer is not None and args.train_model_path is not None:
-                        snapshot_name = f"checkpoint_{checkpoint_index:04d}_{args.train_model_path.name}"
-                        trainer.snapshot_model(checkpoint_dir / snapshot_name)
-                    last_checkpoint_margin = current_margin
-                    if checkpoint_ci_decimals is not None:
-                        last_checkpoint_percent = current_margin_percent
-
-            if auto_mode and current_margin is not None and target_margin is not None and current_margin <= target_margin:
-                print("Target confidence margin reached; stopping early.")
-                break
+                    next_task += 1
+                    if _after_merge():
+                        print(stop_message)
+                        stopping = True
+                        # Later tasks are dropped so the stopping point doesn't depend on timing.
+                        for queued in pending:
+                            queued.cancel()
     except KeyboardInterrupt:
         interrupted = True
         print("\nSimulation interrupted by user; finalizing partial results...")
     finally:
         if executor is not None:
-            executor.shutdown(wait=True)
+            executor.shutdown(wait=True, cancel_futures=True)
+        if shared_state is not None:
+            shared_state.cleanup()
+        checkpoint_writer.shutdown(wait=True)
 
-    summary = summarize(stats, args.top_k, args.confidence)
-    _, achieved_margin = _compute_mean_and_margin(
-        stats["blue_win_prob_sum"],
-        stats["blue_win_prob_sq_sum"],
-        stats["total_games"],
-        args.confidence
-    )
+    summary = summarize(stats, args.top_k, args.confidence, design)
+    _, achieved_margin = _overall_mean_and_margin(stats, args.confidence, design)
 
     if auto_mode and (achieved_margin is None or achieved_margin > target_margin):
         print("Warning: Max games reached before hitting target margin.")
@@ -911,7 +1774,8 @@ def main():
         target_margin,
         achieved_margin,
         training_report,
-        interrupted
+        interrupted,
+        extra_metadata=sampling_meta
     )
     print(f"Saved summary to {args.output}")
 
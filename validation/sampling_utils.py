@@ -28,6 +28,57 @@ def build_role_pools_indices(
     return role_arrays, idx_to_champion
 
 
+def _sample_side(
+    generator: np.random.Generator,
+    pools: List[np.ndarray],
+    batch_size: int,
+    max_attempts: int
+) -> np.ndarray:
+    """Draw one team per row, never repeating a champion within a row.
+
+    Each role column is drawn uniformly from its pool, then rows where it
+    collides with an earlier column are redrawn until they don't. This gives
+    the same distribution as sampling each role from the pool minus the
+    champions already picked.
+    """
+    teams = np.empty((batch_size, len(pools)), dtype=np.int32)
+    for column, pool in enumerate(pools):
+        teams[:, column] = pool[generator.integers(0, pool.size, size=batch_size)]
+        if column == 0:
+            continue
+        earlier = teams[:, :column]
+        clash = np.flatnonzero((earlier == teams[:, [column]]).any(axis=1))
+        attempts = 0
+        while clash.size and attempts < max_attempts:
+            teams[clash, column] = pool[generator.integers(0, pool.size, size=clash.size)]
+            still = (earlier[clash] == teams[clash, column][:, None]).any(axis=1)
+            clash = clash[still]
+            attempts += 1
+        for row in clash:
+            # Pool nearly exhausted by earlier picks; choose explicitly (or allow a repeat).
+            remaining = np.setdiff1d(pool, teams[row, :column])
+            choices = remaining if remaining.size else pool
+            teams[row, column] = choices[generator.integers(0, choices.size)]
+    return teams
+
+
+def sample_team_indices(
+    generator: np.random.Generator,
+    role_arrays: Dict[str, np.ndarray],
+    role_order: List[str],
+    batch_size: int,
+    max_attempts: int = 32
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Sample (batch_size, len(role_order)) champion index arrays for both sides."""
+    pools = [role_arrays.get(role) for role in role_order]
+    for role, pool in zip(role_order, pools):
+        if pool is None or pool.size == 0:
+            raise ValueError(f"No champions available for role {role}")
+    blue = _sample_side(generator, pools, batch_size, max_attempts)
+    red = _sample_side(generator, pools, batch_size, max_attempts)
+    return blue, red
+
+
 def sample_teams_numpy(
     generator: np.random.Generator,
     role_arrays: Dict[str, np.ndarray],
@@ -35,39 +86,7 @@ def sample_teams_numpy(
     role_order: List[str],
     batch_size: int
 ) -> Tuple[List[List[str]], List[List[str]]]:
-    champion_count = len(idx_to_champion)
-    blue_mask = np.zeros(champion_count, dtype=bool)
-    red_mask = np.zeros(champion_count, dtype=bool)
-    ordered_pools = [role_arrays.get(role) for role in role_order]
-
-    blue_teams: List[List[str]] = []
-    red_teams: List[List[str]] = []
-    for _ in range(batch_size):
-        blue_indices: List[int] = []
-        red_indices: List[int] = []
-        for pool in ordered_pools:
-            if pool is None or pool.size == 0:
-                continue
-            blue_masked = pool[~blue_mask[pool]]
-            if blue_masked.size == 0:
-                blue_masked = pool
-            blue_idx = int(generator.choice(blue_masked))
-            blue_mask[blue_idx] = True
-            blue_indices.append(blue_idx)
-
-            red_masked = pool[~red_mask[pool]]
-            if red_masked.size == 0:
-                red_masked = pool
-            red_idx = int(generator.choice(red_masked))
-            red_mask[red_idx] = True
-            red_indices.append(red_idx)
-
-        blue_teams.append([idx_to_champion[idx] for idx in blue_indices])
-        red_teams.append([idx_to_champion[idx] for idx in red_indices])
-
-        for idx in blue_indices:
-            blue_mask[idx] = False
-        for idx in red_indices:
-            red_mask[idx] = False
-
-    return blue_teams, red_teams
\ No newline at end of file
+    """Name-list variant of `sample_team_indices` for reporting and tooling."""
+    blue, red = sample_team_indices(generator, role_arrays, role_order, batch_size)
+    names = np.array(idx_to_champion, dtype=object)
+    return names[blue].tolist(), names[red].tolist()
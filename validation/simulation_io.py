@@ -0,0 +1,212 @@
+"""Columnar (.npz) storage for simulation summaries and checkpoints.
+
+Lists of same-shaped records (sample games, matchup rows) and dicts keyed by
+name whose values share a shape (``raw_matchups``) are stored as one array per
+leaf field, with strings dictionary-encoded. Everything else stays in a small
+JSON skeleton. Loading returns the same structure `json.load` would.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+SUMMARY_FORMATS = ["json", "npz"]
+TABLE_MARKER = "__npz_table__"
+MIN_TABLE_ROWS = 2
+
+
+def _flatten_record(record: Dict[str, Any]) -> List[Tuple[Tuple[str, ...], Any]]:
+    """(path, value) leaves of a nested dict; lists and empty dicts are leaves too."""
+    leaves: List[Tuple[Tuple[str, ...], Any]] = []
+    stack: List[Tuple[Tuple[str, ...], Dict[str, Any]]] = [((), record)]
+    while stack:
+        prefix, node = stack.pop()
+        children = []
+        for key, value in node.items():
+            if isinstance(value, dict) and value:
+                children.append((prefix + (key,), value))
+            else:
+                leaves.append((prefix + (key,), value))
+        stack.extend(reversed(children))
+    return leaves
+
+
+def _column_type(values: List[Any]) -> str:
+    kinds = {type(value) for value in values if value is not None}
+    if not kinds:
+        return "float"
+    if kinds == {bool}:
+        return "bool"
+    if kinds == {int}:
+        return "int"
+    if kinds <= {int, float}:
+        return "float"
+    if kinds == {str}:
+        return "str"
+    return "json"
+
+
+def _encode_strings(values: List[str]) -> np.ndarray:
+    # UTF-8 bytes are ~4x smaller than numpy's fixed-width UTF-32 strings.
+    return np.array([value.encode("utf-8") for value in values], dtype=np.bytes_)
+
+
+def _decode_strings(array: np.ndarray) -> List[str]:
+    return [value.decode("utf-8") for value in array.tolist()]
+
+
+def _is_table(rows: List[Any]) -> bool:
+    """Records that share the same top-level fields, so columns line up."""
+    if len(rows) < MIN_TABLE_ROWS or not all(isinstance(row, dict) and row for row in rows):
+        return False
+    keys = list(rows[0])
+    return all(list(row) == keys for row in rows[1:])
+
+
+def _encode_table(rows: List[Dict[str, Any]], prefix: str, arrays: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """Store `rows` as one array per leaf path under `prefix`; return the column specs."""
+    positions: Dict[Tuple[str, ...], int] = {}
+    values: List[List[Any]] = []
+    present: List[np.ndarray] = []
+    for row_index, row in enumerate(rows):
+        for path, value in _flatten_record(row):
+            position = positions.get(path)
+            if position is None:
+                position = positions[path] = len(values)
+                values.append([None] * len(rows))
+                present.append(np.zeros(len(rows), dtype=bool))
+            values[position][row_index] = value
+            present[position][row_index] = True
+
+    columns: List[Dict[str, Any]] = []
+    for path, position in positions.items():
+        column = values[position]
+        column_type = _column_type(column)
+        key = f"{prefix}_c{position}"
+        nulls = np.array([value is None for value in column], dtype=bool) & present[position]
+        if column_type in ("str", "json"):
+            if column_type == "json":
+                column = [json.dumps(value) for value in column]
+            labels, codes = np.unique(np.array(["" if value is None else value for value in column]), return_inverse=True)
+            codes = codes.astype(np.int32)
+            codes[nulls] = -1
+            arrays[key] = codes
+            arrays[f"{key}_values"] = _encode_strings(labels.tolist())
+        else:
+            fill = {"bool": False, "int": 0, "float": np.nan}[column_type]
+            dtype = {"bool": bool, "int": np.int64, "float": np.float64}[column_type]
+            arrays[key] = np.array([fill if value is None else value for value in column], dtype=dtype)
+        if nulls.any():
+            arrays[f"{key}_null"] = nulls
+        if not present[position].all():
+            arrays[f"{key}_present"] = present[position]
+        columns.append({
+            "path": list(path),
+            "type": column_type,
+            "nullable": bool(nulls.any()),
+            "sparse": not present[position].all()
+        })
+    return columns
+
+
+def _extract_tables(node: Any, tables: List[Dict[str, Any]], arrays: Dict[str, np.ndarray]) -> Any:
+    """Return the JSON skeleton of `node`, moving tabular parts into `arrays`."""
+    if isinstance(node, list):
+        if _is_table(node):
+            tables.append({"kind": "list", "rows": len(node), "columns": _encode_table(node, f"t{len(tables)}", arrays)})
+            return {TABLE_MARKER: len(tables) - 1}
+        return [_extract_tables(item, tables, arrays) for item in node]
+    if isinstance(node, dict):
+        if _is_table(list(node.values())):
+            prefix = f"t{len(tables)}"
+            arrays[f"{prefix}_keys"] = _encode_strings(list(node.keys()))
+            tables.append({"kind": "dict", "rows": len(node), "columns": _encode_table(list(node.values()), prefix, arrays)})
+            return {TABLE_MARKER: len(tables) - 1}
+        return {key: _extract_tables(value, tables, arrays) for key, value in node.items()}
+    return node
+
+
+def _decode_table(index: int, spec: Dict[str, Any], arrays: Any) -> Any:
+    prefix = f"t{index}"
+    rows: List[Dict[str, Any]] = [{} for _ in range(spec["rows"])]
+    for position, column in enumerate(spec["columns"]):
+        key = f"{prefix}_c{position}"
+        data = arrays[key]
+        if column["type"] in ("str", "json"):
+            labels = _decode_strings(arrays[f"{key}_values"])
+            if column["type"] == "json":
+                labels = [json.loads(label) for label in labels]
+            values = [labels[code] if code >= 0 else None for code in data.tolist()]
+        else:
+            values = data.tolist()
+            if column["nullable"]:
+                values = [None if null else value for value, null in zip(values, arrays[f"{key}_null"].tolist())]
+        present = arrays[f"{key}_present"].tolist() if column["sparse"] else [True] * len(values)
+        *parents, leaf = column["path"]
+        for row, value, has_value in zip(rows, values, present):
+            if not has_value:
+                continue
+            target = row
+            for parent in parents:
+                target = target.setdefault(parent, {})
+            target[leaf] = value
+    if spec["kind"] == "dict":
+        return dict(zip(_decode_strings(arrays[f"{prefix}_keys"]), rows))
+    return rows
+
+
+def _restore_tables(node: Any, tables: List[Dict[str, Any]], arrays: Any) -> Any:
+    if isinstance(node, dict):
+        if set(node) == {TABLE_MARKER}:
+            index = node[TABLE_MARKER]
+            return _decode_table(index, tables[index], arrays)
+        return {key: _restore_tables(value, tables, arrays) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_restore_tables(item, tables, arrays) for item in node]
+    return node
+
+
+def save_simulation_npz(path: Path, payload: Dict[str, Any]) -> None:
+    """Write `payload` as a columnar .npz archive (atomically)."""
+    tables: List[Dict[str, Any]] = []
+    arrays: Dict[str, np.ndarray] = {}
+    skeleton = _extract_tables(payload, tables, arrays)
+    header = json.dumps({"skeleton": skeleton, "tables": tables}).encode("utf-8")
+    arrays["header"] = np.frombuffer(header, dtype=np.uint8)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as handle:
+        np.savez(handle, **arrays)
+    os.replace(tmp_path, path)
+
+
+def load_simulation_npz(path: Path) -> Dict[str, Any]:
+    with np.load(path, allow_pickle=False) as arrays:
+        header = json.loads(arrays["header"].tobytes().decode("utf-8"))
+        return _restore_tables(header["skeleton"], header["tables"], arrays)
+
+
+def write_simulation_payload(path: Path, payload: Dict[str, Any]) -> None:
+    """Write a summary/checkpoint payload as .npz or indented JSON based on the suffix."""
+    path = Path(path)
+    if path.suffix == ".npz":
+        save_simulation_npz(path, payload)
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2)
+
+
+def load_simulation_payload(path: Path) -> Dict[str, Any]:
+    """Load a summary/checkpoint payload written as .npz or JSON."""
+    path = Path(path)
+    if path.suffix == ".npz":
+        return load_simulation_npz(path)
+    with open(path, "r", encoding="utf-8") as handle:
+        return json.load(handle)